@@ -1,3 +1,8 @@
 # agents/__init__.py
 
-from .resume_agent import ResumeAgent
\ No newline at end of file
+from .resume_agent import ResumeAgent
+from .analysis_job import (
+    start_dashboard_analysis,
+    current_analysis_job,
+    sync_analysis_results
+)
\ No newline at end of file
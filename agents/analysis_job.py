@@ -0,0 +1,131 @@
+import hashlib
+import uuid
+
+import streamlit as st
+from database import save_resume_async, save_analysis_checkpoint, load_analysis_checkpoint
+from services.ai_services import AIServiceError
+from services.job_runner import get_job_runner, DONE
+from utils.session_state import apply_analysis_results
+from .resume_agent import ResumeAgent
+
+# Parsing, the agent's three steps, then saving to the history
+ANALYSIS_STEPS = 5
+# A parsed resume with none of these is treated as a failed parse
+RESUME_CONTENT_FIELDS = ('summary', 'skills', 'experience')
+
+
+def _input_hash(resume_text, job_description):
+    return hashlib.sha256(f"{resume_text}\0{job_description}".encode('utf-8')).hexdigest()
+
+def _has_resume_content(resume_data):
+    """Whether parsing produced a resume, rather than the empty result of a failed or unparseable response."""
+    return isinstance(resume_data, dict) and any(resume_data.get(field) for field in RESUME_CONTENT_FIELDS)
+
+def _session_owner():
+    """A stable id for this browser session, used to key its background jobs."""
+    if 'job_owner' not in st.session_state:
+        st.session_state.job_owner = uuid.uuid4().hex
+    return st.session_state.job_owner
+
+
+def run_dashboard_analysis(agent, resume_text, job_description, user_id, input_hash, progress):
+    """
+    The Dashboard's full analysis, run on a job worker rather than the script
+    thread: parse the resume, run the agent's analysis, apply its optimizations
+    and save the result to the user's history. Touches no session state, so it
+    keeps going (and saves exactly once) whatever the user does meanwhile.
+
+    The results are checkpointed under the user and a hash of the inputs; the
+    same inputs later (e.g. after a server restart) are answered from the
+    checkpoint without any AI calls. A failed AI call raises AIServiceError,
+    so the job ends as failed and the user can submit it again.
+    """
+    checkpoint = load_analysis_checkpoint(user_id, input_hash)
+    if checkpoint is not None:
+        save_analysis_checkpoint(user_id, input_hash, checkpoint)  # Now the latest, for the next login
+        progress(ANALYSIS_STEPS, ANALYSIS_STEPS, "Restored your earlier analysis of this resume and job.")
+        return checkpoint
+
+    progress(0, ANALYSIS_STEPS, "Parsing and structuring your resume...")
+    initial_data = agent.ai_helper.analyze_resume_content(resume_text)
+    if not _has_resume_content(initial_data):
+        raise AIServiceError("the AI could not read your resume")
+    all_results = agent.run_full_analysis(
+        initial_data, job_description,
+        progress=lambda step, total_steps, message: progress(1 + step, ANALYSIS_STEPS, message)
+    )
+
+    # Auto-apply the optimizations from the analysis
+    resume_data = dict(initial_data)
+    optimization = all_results.get('optimization', {})
+    if isinstance(optimization, dict):
+        resume_data['summary'] = optimization.get('optimized_summary', initial_data.get('summary', ''))
+        current_skills = set(resume_data.get('skills', []))
+        current_skills.update(optimization.get('missing_keywords', []))
+        resume_data['skills'] = sorted(list(current_skills))
+
+    # Only a real result is saved and checkpointed; a checkpoint would serve a failed one forever
+    ats = all_results.get('ats')
+    if not isinstance(ats, dict) or ats.get('ats_score') is None:
+        raise AIServiceError("the AI returned no ATS score")
+    ats_score = ats['ats_score']
+    progress(4, ANALYSIS_STEPS, "Saving the analysis to your history...")
+    resume_id = save_resume_async(user_id, resume_data, job_description, ats_score).result()
+
+    results = {
+        "resume_data": resume_data,
+        "job_description": job_description,
+        "ats": ats,
+        "ats_score": ats_score,
+        "questions": all_results.get('questions'),
+        "courses": all_results.get('courses'),
+        "resume_id": resume_id,
+    }
+    save_analysis_checkpoint(user_id, input_hash, results)
+
+    progress(ANALYSIS_STEPS, ANALYSIS_STEPS, "Analysis complete!")
+    return results
+
+
+def start_dashboard_analysis(resume_text, job_description):
+    """
+    Starts the Dashboard analysis in the background for this session and returns
+    its job. Submitting the same resume and job description again returns the
+    job already running (or finished) instead of paying for a second analysis;
+    only a failed job is run again.
+    """
+    agent = ResumeAgent()  # Built on the script thread, where session state is available
+    input_hash = _input_hash(resume_text, job_description)
+    job = get_job_runner().submit(
+        _session_owner(), input_hash,
+        run_dashboard_analysis, agent, resume_text, job_description, st.session_state.user_id, input_hash
+    )
+    st.session_state.analysis_job_key = job.input_hash
+    # An explicit request applies the results again, even from a job already applied,
+    # e.g. to bring back results the session memory budget has since dropped
+    st.session_state.pop('applied_analysis_job', None)
+    return job
+
+def current_analysis_job():
+    """This session's latest Dashboard analysis job, or None."""
+    input_hash = st.session_state.get('analysis_job_key')
+    if input_hash is None:
+        return None
+    return get_job_runner().get(_session_owner(), input_hash)
+
+def sync_analysis_results():
+    """
+    Copies the results of a finished background analysis into session state,
+    once per job. Safe to call on every rerun of every page; returns the job
+    whose results were just applied, or None. Also sets the 'analysis_completed'
+    flag, which the Dashboard pops to celebrate the finished analysis once.
+    """
+    job = current_analysis_job()
+    if job is None or job.status != DONE or st.session_state.get('applied_analysis_job') == job.job_id:
+        return None
+
+    apply_analysis_results(job.result)
+    st.session_state.applied_analysis_job = job.job_id
+    st.session_state.analysis_completed = True  # For the Dashboard, whichever page applied the results
+    st.session_state.pop('history_items', None)  # Reload the history on the next visit
+    return job
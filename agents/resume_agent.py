@@ -1,5 +1,5 @@
 import streamlit as st
-from services.ai_services import GeminiAIHelper
+from services.ai_services import get_ai_helper
 
 class ResumeAgent:
     """
@@ -9,11 +9,11 @@ class ResumeAgent:
     
     def __init__(self):
         """Initializes the agent with its toolbox of AI functions."""
-        if 'gemini_model' not in st.session_state:
+        if not st.session_state.get('gemini_ready'):
             st.error("Gemini model not initialized. Please log in again.")
             return
             
-        self.ai_helper = GeminiAIHelper(st.session_state.gemini_model)
+        self.ai_helper = get_ai_helper()
         
         # The "toolbox" contains all the functions the agent can decide to use.
         self.tools = {
@@ -24,11 +24,18 @@ class ResumeAgent:
             "recommend_courses": self.ai_helper.generate_course_recommendations,
         }
 
-    def run_full_analysis(self, resume_data, job_description):
+    def run_full_analysis(self, resume_data, job_description, progress=None):
         """
         NEW: Runs the complete, sequential analysis for the main dashboard.
         This is the core of the "analyze-once" workflow.
+
+        `progress(step, total_steps, message)` is called as each step starts; by
+        default the messages are shown with st.info. Pass a callback when running
+        outside the script thread, e.g. as a background job.
         """
+        if progress is None:
+            progress = lambda step, total_steps, message: st.info(message)
+
         all_results = {}
         resume_text = " ".join(map(str, [
             resume_data.get('summary', ''),
@@ -37,20 +44,20 @@ class ResumeAgent:
         ]))
 
         # --- Step 1: ATS Score and Optimization ---
-        st.info("Step 1/3: Analyzing ATS compatibility and finding optimizations...")
+        progress(0, 3, "Step 1/3: Analyzing ATS compatibility and finding optimizations...")
         all_results['ats'] = self.tools["score_ats"](resume_text, job_description)
         all_results['optimization'] = self.tools["optimize_resume"](resume_data, job_description)
 
         # --- Step 2: Generate Interview Questions ---
-        st.info("Step 2/3: Crafting personalized interview questions...")
+        progress(1, 3, "Step 2/3: Crafting personalized interview questions...")
         all_results['questions'] = self.tools["generate_questions"](job_description, resume_data)
 
         # --- Step 3: Recommend Courses ---
-        st.info("Step 3/3: Identifying skill gaps and recommending courses...")
+        progress(2, 3, "Step 3/3: Identifying skill gaps and recommending courses...")
         skills = resume_data.get('skills', [])
         all_results['courses'] = self.tools["recommend_courses"](skills, job_description)
 
-        st.success("Full analysis complete!")
+        progress(3, 3, "Full analysis complete!")
         return all_results
 
 
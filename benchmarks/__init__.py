@@ -0,0 +1,2 @@
+# This file is intentionally left blank.
+# It helps Python recognize the 'benchmarks' directory as a package.
\ No newline at end of file
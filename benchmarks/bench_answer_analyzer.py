@@ -0,0 +1,50 @@
+# benchmarks/bench_answer_analyzer.py
+#
+# Time to the first feedback on a mock interview answer: the local STAR
+# structure check, which is shown at once, for answers of growing length.
+# The AI evaluation that follows it typically takes seconds.
+#
+# Usage: python -m benchmarks.bench_answer_analyzer --words 60 250 1000
+
+import argparse
+import statistics
+import time
+
+from services.answer_analyzer import analyze_answer
+
+SENTENCES = [
+    "In my last role at a logistics startup, our nightly data pipeline kept failing.",
+    "My task was to make it reliable before the quarterly audit.",
+    "I first analyzed the failures and found that most came from one flaky upstream API.",
+    "I then designed a retry queue and, um, basically added monitoring and alerts.",
+    "We worked with the API team to agree on rate limits.",
+    "As a result, failures dropped by 90% and we saved about 10 hours a week.",
+]
+
+
+def answer_of(words):
+    text, sentences = [], iter(SENTENCES * (words // 8 + 1))
+    while len(" ".join(text).split()) < words:
+        text.append(next(sentences))
+    return " ".join(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local STAR answer analysis latency by answer length")
+    parser.add_argument("--words", type=int, nargs="+", default=[60, 250, 1000], help="answer lengths to try")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'words':>6} {'median ms':>10} {'score':>6}")
+    for words in args.words:
+        answer = answer_of(words)
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            analysis = analyze_answer(answer)
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{analysis.word_count:>6} {statistics.median(samples):>10.3f} {analysis.score:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_auth.py
+#
+# Measures bcrypt login cost at several work factors: logins/s on a single
+# core, and throughput plus latency when a burst of concurrent logins goes
+# through the bounded hashing pool. Use it to pick HIREDLY_BCRYPT_ROUNDS for
+# the hardware the app is deployed on.
+#
+# Usage: python -m benchmarks.bench_auth --costs 10 11 12 13 --burst 16
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from database import passwords
+
+PASSWORD = "correct horse battery staple"
+
+
+def single_core_rate(stored_hash, seconds):
+    """Verifications per second on the calling thread, i.e. one core."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        passwords._verify(stored_hash, PASSWORD)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def burst(stored_hash, logins):
+    """Fires `logins` concurrent logins through the hashing pool, as a crowd of sessions would."""
+    def login():
+        start = time.perf_counter()
+        passwords.verify_password(stored_hash, PASSWORD)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=logins) as sessions:
+        latencies = sorted(sessions.map(lambda _: login(), range(logins)))
+    elapsed = time.perf_counter() - start
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return logins / elapsed, statistics.median(latencies), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt login throughput per work factor")
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--burst", type=int, default=16, help="concurrent logins per burst")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time spent per single-core measurement")
+    args = parser.parse_args()
+
+    print(f"hash workers={passwords.HASH_WORKERS} configured cost={passwords.BCRYPT_ROUNDS}")
+    print(f"{'cost':>4}  {'logins/s/core':>13}  {'burst logins/s':>14}  {'p50 ms':>8}  {'p99 ms':>8}")
+    for cost in args.costs:
+        stored_hash = passwords.hash_password(PASSWORD, rounds=cost)
+        per_core = single_core_rate(stored_hash, args.seconds)
+        throughput, p50, p99 = burst(stored_hash, args.burst)
+        print(f"{cost:>4}  {per_core:13.1f}  {throughput:14.1f}  {p50:8.1f}  {p99:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
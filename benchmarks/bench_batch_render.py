@@ -0,0 +1,46 @@
+# benchmarks/bench_batch_render.py
+#
+# Measures resume rendering throughput (resumes/second) for a plain sequential
+# loop versus the process-pool batch renderer.
+#
+# Usage: python -m benchmarks.bench_batch_render --jobs 120 --workers 4
+
+import argparse
+import io
+import time
+
+from services.batch_renderer import render_batch_to_zip
+from services.resume_generator import TEMPLATE_NAMES, render_resume
+from benchmarks.sample_data import make_resume
+
+
+def build_jobs(count, output_format):
+    """Cycles through every template so the batch mirrors a cohort export."""
+    return [(make_resume(i), TEMPLATE_NAMES[i % len(TEMPLATE_NAMES)], output_format) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch resume rendering throughput")
+    parser.add_argument("--jobs", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", default="pdf")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.jobs, args.format)
+
+    start = time.perf_counter()
+    for resume_data, template_style, output_format in jobs:
+        render_resume(resume_data, template_style, output_format)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_batch_to_zip(jobs, io.BytesIO(), max_workers=args.workers)
+    batched = time.perf_counter() - start
+
+    print(f"jobs={args.jobs} format={args.format}")
+    print(f"sequential: {args.jobs / sequential:8.1f} resumes/s ({sequential:.2f}s)")
+    print(f"batch pool: {args.jobs / batched:8.1f} resumes/s ({batched:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
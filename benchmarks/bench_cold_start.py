@@ -0,0 +1,68 @@
+# benchmarks/bench_cold_start.py
+#
+# Measures the import time of the app entry point and every page in a fresh
+# interpreter, the cost a server process pays on the first request after a
+# deploy or scale-up. Streamlit itself is imported before timing starts, since
+# it is already loaded when a page runs. Exits with status 1 if any module
+# exceeds the cold-start budget.
+#
+# Usage: python -m benchmarks.bench_cold_start --budget-ms 75 --repeat 3
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# What each entry point imports before it can render. main.py's own imports are
+# listed instead of main itself, which would start running the app.
+ENTRY_POINTS = {
+    "main (login page)": ["database", "components.visualizations", "utils.session_state"],
+    "pages/resume_input.py": ["pages.resume_input"],
+    "pages/ats_analysis.py": ["pages.ats_analysis"],
+    "pages/interview_prep.py": ["pages.interview_prep"],
+    "pages/course_recommendations.py": ["pages.course_recommendations"],
+    "pages/download_resume.py": ["pages.download_resume"],
+}
+
+TIMER = """
+import importlib, time, warnings
+warnings.simplefilter("ignore")
+import streamlit
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def cold_import_ms(modules):
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", TIMER.format(modules=modules)],
+        cwd=repo_root, capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time per page")
+    parser.add_argument("--budget-ms", type=float, default=75.0, help="maximum import time per entry point")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per entry point (median is used)")
+    args = parser.parse_args()
+
+    over_budget = []
+    for label, modules in ENTRY_POINTS.items():
+        elapsed = statistics.median(cold_import_ms(modules) for _ in range(args.repeat))
+        flag = "" if elapsed <= args.budget_ms else "  OVER BUDGET"
+        print(f"{label:34} {elapsed:8.1f} ms{flag}")
+        if flag:
+            over_budget.append(label)
+
+    print(f"budget {args.budget_ms:.0f} ms per entry point")
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
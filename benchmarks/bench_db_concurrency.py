@@ -0,0 +1,94 @@
+# benchmarks/bench_db_concurrency.py
+#
+# Simulates many sessions saving and reading analyses at the same time and
+# reports operations/second for the pooled WAL connection manager versus the
+# previous connect-per-call, rollback-journal approach. Uses temporary
+# database files; the application database is never touched.
+#
+# Usage: python -m benchmarks.bench_db_concurrency --sessions 16 --ops 50
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import database
+from database import db_manager
+from benchmarks.bench_storage import LEGACY_SCHEMA
+from benchmarks.sample_data import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+
+def naive_save(path, user_id):
+    with sqlite3.connect(path, timeout=30) as conn:
+        conn.execute(
+            "INSERT INTO resumes (user_id, resume_data, job_description, ats_score) VALUES (?, ?, ?, ?)",
+            (user_id, json.dumps(SAMPLE_RESUME), SAMPLE_JOB_DESCRIPTION, 72.5),
+        )
+        conn.commit()
+
+
+def naive_read(path, user_id):
+    with sqlite3.connect(path, timeout=30) as conn:
+        rows = conn.execute(
+            "SELECT resume_data FROM resumes WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+def run_sessions(sessions, ops, save, read):
+    """Each simulated session alternates saves and history reads. Returns ops/second."""
+    barrier = threading.Barrier(sessions + 1)
+    errors = []
+
+    def session(user_id):
+        barrier.wait()
+        try:
+            for i in range(ops):
+                save(user_id) if i % 2 == 0 else read(user_id)
+        except Exception as e:  # Record lock timeouts instead of killing the benchmark
+            errors.append(e)
+
+    threads = [threading.Thread(target=session, args=(user_id,)) for user_id in range(1, sessions + 1)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sessions * ops / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite save/read throughput under concurrent sessions")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        naive_path = os.path.join(tmp, "naive.db")
+        with sqlite3.connect(naive_path) as conn:
+            for statement in LEGACY_SCHEMA:
+                conn.execute(statement)
+        database.configure_database(os.path.join(tmp, "pooled.db"))
+        db_manager.init_db()
+
+        naive_rate, naive_errors = run_sessions(
+            args.sessions, args.ops, lambda u: naive_save(naive_path, u), lambda u: naive_read(naive_path, u)
+        )
+        pooled_rate, pooled_errors = run_sessions(
+            args.sessions, args.ops,
+            lambda u: db_manager.save_resume(u, SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, 72.5),
+            db_manager.get_user_resumes,
+        )
+
+    print(f"sessions={args.sessions} ops/session={args.ops}")
+    print(f"connect-per-call: {naive_rate:8.1f} ops/s  errors={len(naive_errors)}")
+    print(f"pooled WAL:       {pooled_rate:8.1f} ops/s  errors={len(pooled_errors)}")
+
+
+if __name__ == "__main__":
+    main()
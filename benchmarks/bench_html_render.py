@@ -0,0 +1,44 @@
+# benchmarks/bench_html_render.py
+#
+# Checks that HTML resume rendering stays fast enough to act as the instant
+# live-preview format. Exits non-zero if the mean render time for any template
+# exceeds the budget.
+#
+# Usage: python -m benchmarks.bench_html_render --renders 2000 --budget-ms 1.0
+
+import argparse
+import sys
+import time
+
+from services.resume_generator import TEMPLATE_NAMES, create_html_preview, create_html_resume
+from benchmarks.sample_data import SAMPLE_RESUME
+
+
+def mean_ms(render, template_style, renders):
+    render(SAMPLE_RESUME, template_style)  # compile the template outside the timed loop
+    start = time.perf_counter()
+    for _ in range(renders):
+        render(SAMPLE_RESUME, template_style)
+    return (time.perf_counter() - start) * 1000 / renders
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML resume render latency")
+    parser.add_argument("--renders", type=int, default=2000)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    over_budget = False
+    for template_style in TEMPLATE_NAMES:
+        for label, render in (("document", create_html_resume), ("preview", create_html_preview)):
+            elapsed = mean_ms(render, template_style, args.renders)
+            over_budget |= elapsed > args.budget_ms
+            print(f"{template_style:<14}{label:<10}{elapsed * 1000:8.1f} µs/render")
+
+    if over_budget:
+        print(f"FAIL: HTML rendering exceeded the {args.budget_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
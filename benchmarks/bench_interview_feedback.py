@@ -0,0 +1,73 @@
+# benchmarks/bench_interview_feedback.py
+#
+# API calls and feedback wait per question for a mock interview session:
+# the old path (every "Get AI Feedback" click is a request), the same clicks
+# with the evaluation cache, and a practice round evaluated in batches.
+# Requests go to a stand-in client whose latency is base + per-answer cost,
+# roughly how the model's output grows with the answers it has to review.
+#
+# Usage: python -m benchmarks.bench_interview_feedback --questions 8 --resubmits 3
+
+import argparse
+import json
+import time
+
+from services.ai_services import GeminiAIHelper
+
+
+class SimulatedClient:
+    def __init__(self, base_ms, per_answer_ms):
+        self.base_ms = base_ms
+        self.per_answer_ms = per_answer_ms
+        self.calls = 0
+
+    def generate_text(self, prompt, cache=True):
+        self.calls += 1
+        answers = prompt.count("Interview Question:")
+        time.sleep((self.base_ms + self.per_answer_ms * answers) / 1000)
+        if "JSON array" not in prompt:
+            return "- **Overall Score:** 7/10\n- **✅ What Went Well:** ...\n- **🔧 Areas for Improvement:** ...\n- **⭐ A Stronger Example Answer:** ..."
+        return json.dumps([{"answer_number": n, "score": 7, "what_went_well": ["..."], "areas_for_improvement": ["..."],
+                            "stronger_example_answer": "..."} for n in range(1, answers + 1)])
+
+
+def session_clicks(questions, resubmits):
+    """The (question, answer) of every feedback click: each answer is submitted, some again with small edits."""
+    answers = [(f"Question {i}?", f"In my last role I led project {i} and cut costs by {i * 5}%.") for i in range(questions)]
+    clicks = list(answers)
+    for i in range(resubmits):
+        question, answer = answers[i % questions]
+        clicks.append((question, f"  {answer.upper()}  "))  # Same answer, resubmitted (or re-transcribed)
+    return answers, clicks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock interview feedback: API calls and wait per question")
+    parser.add_argument("--questions", type=int, default=8)
+    parser.add_argument("--resubmits", type=int, default=3, help="identical answers submitted again")
+    parser.add_argument("--base-ms", type=float, default=300, help="simulated latency per request")
+    parser.add_argument("--per-answer-ms", type=float, default=200, help="simulated latency per answer reviewed")
+    args = parser.parse_args()
+
+    answers, clicks = session_clicks(args.questions, args.resubmits)
+
+    def run(label, evaluate):
+        client = SimulatedClient(args.base_ms, args.per_answer_ms)
+        helper = GeminiAIHelper(client)
+        start = time.perf_counter()
+        evaluate(helper)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {client.calls:>6} {elapsed / len(clicks) * 1000:>16.0f}")
+
+    def uncached(helper):
+        for question, answer in clicks:
+            helper._safe_generate_content(f'Interview Question: "{question}" Candidate\'s Answer: "{answer}"')
+
+    print(f"{'strategy':<28} {'calls':>6} {'ms per question':>16}")
+    run("request per click", uncached)
+    run("cached per click", lambda helper: [helper.evaluate_interview_answer(q, a, "JD") for q, a in clicks])
+    run("practice round", lambda helper: helper.evaluate_practice_round(clicks, "JD"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/bench_pdf_fastpath.py
+#
+# Compares the canvas fast path against Platypus layout for a one-page resume:
+# mean render time and peak traced memory per render, for every template.
+#
+# Usage: python -m benchmarks.bench_pdf_fastpath --renders 200
+
+import argparse
+import time
+import tracemalloc
+
+from services.resume_generator import TEMPLATE_NAMES, create_enhanced_pdf_resume, warm_template_styles
+from benchmarks.sample_data import SAMPLE_RESUME
+
+
+def measure(template_style, fast_path, renders):
+    """Returns (mean seconds per render, peak bytes allocated during one render)."""
+    start = time.perf_counter()
+    for _ in range(renders):
+        create_enhanced_pdf_resume(SAMPLE_RESUME, template_style, fast_path=fast_path)
+    elapsed = (time.perf_counter() - start) / renders
+
+    tracemalloc.start()
+    create_enhanced_pdf_resume(SAMPLE_RESUME, template_style, fast_path=fast_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF fast path vs Platypus")
+    parser.add_argument("--renders", type=int, default=200)
+    args = parser.parse_args()
+
+    warm_template_styles()
+    print(f"{'template':<14}{'platypus ms':>12}{'fast ms':>10}{'speedup':>9}{'platypus KiB':>14}{'fast KiB':>10}")
+    for template_style in TEMPLATE_NAMES:
+        slow_time, slow_peak = measure(template_style, False, args.renders)
+        fast_time, fast_peak = measure(template_style, True, args.renders)
+        print(
+            f"{template_style:<14}{slow_time * 1000:>12.2f}{fast_time * 1000:>10.2f}"
+            f"{slow_time / fast_time:>8.1f}x{slow_peak / 1024:>14.1f}{fast_peak / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
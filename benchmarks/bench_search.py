@@ -0,0 +1,71 @@
+# benchmarks/bench_search.py
+#
+# Measures full-text search latency over a large saved-analysis history.
+# Fills a temporary database through save_resume() (so the search index is
+# maintained exactly as in the app), then times search_user_resumes() for a
+# mix of selective, broad and prefix queries. Exits with status 1 if the p99
+# latency exceeds the budget. The application database is never touched.
+#
+# Usage: python -m benchmarks.bench_search --analyses 20000 --budget-ms 50
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import database
+from database import db_manager
+from benchmarks.sample_data import SAMPLE_JOB_DESCRIPTION, make_resume
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Pied Piper"]
+ROLES = ["Data Engineer", "Backend Developer", "ML Engineer", "Product Analyst", "Site Reliability Engineer"]
+QUERIES = ["data engineer acme", "hooli", "kafka", "reliability", "backend developer initech", "stark ind", "pied pip"]
+
+
+def fill_history(user_id, analyses):
+    for n in range(analyses):
+        job_description = (
+            f"{ROLES[n % len(ROLES)]} at {COMPANIES[n % len(COMPANIES)]}\n{SAMPLE_JOB_DESCRIPTION} Req #{n}"
+        )
+        db_manager.save_resume(user_id, make_resume(n), job_description, 50 + n % 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search latency over a large history")
+    parser.add_argument("--analyses", type=int, default=20000, help="saved analyses for the searching user")
+    parser.add_argument("--others", type=int, default=5000, help="analyses belonging to another user")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="p99 search latency budget")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure_database(os.path.join(tmp, "search.db"))
+        db_manager.init_db()
+        start = time.perf_counter()
+        fill_history(1, args.analyses)
+        fill_history(2, args.others)
+        print(f"indexed {args.analyses + args.others} analyses in {time.perf_counter() - start:.1f}s")
+
+        latencies = []
+        for query in QUERIES:
+            page, _ = db_manager.search_user_resumes(1, query)  # warm the page cache
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                db_manager.search_user_resumes(1, query)
+                samples.append((time.perf_counter() - start) * 1000)
+            latencies.extend(samples)
+            print(f"{query!r:32} first page={len(page):2}  median {statistics.median(samples):7.2f} ms")
+        database.configure_database(os.path.join(tmp, "unused.db"))  # release pooled handles
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"p99 {p99:.2f} ms (budget {args.budget_ms:.0f} ms)")
+    if p99 > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
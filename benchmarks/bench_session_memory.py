@@ -0,0 +1,78 @@
+# benchmarks/bench_session_memory.py
+#
+# Compares the memory held by N sessions' analysis results stored as the AI
+# helper's raw JSON (dicts and lists) against the compact session records.
+# Each session parses its own copy of the JSON, as it would from a model
+# response, so only interning lets sessions share strings. Objects are counted
+# once across all sessions.
+#
+# Usage: python -m benchmarks.bench_session_memory --sessions 2000
+
+import argparse
+import json
+import random
+
+from utils.session_records import (ResumeRecord, ATSRecord, QuestionRecord, CourseRecord,
+                                   from_dict, deep_sizeof)
+
+SKILLS = ["Python", "SQL", "Kafka", "Spark", "AWS", "Docker", "Kubernetes", "Airflow", "Go", "React",
+          "TypeScript", "PostgreSQL", "Terraform", "Machine Learning", "Data Modeling", "Git"]
+
+
+def fake_results(rng):
+    """One session's analysis results as JSON text."""
+    resume = {
+        "name": "Candidate", "email": "candidate@example.com", "phone": "555-0100",
+        "summary": "Engineer with experience building data platforms. " * 4,
+        "skills": rng.sample(SKILLS, 10),
+        "experience": [f"Role {i}: built and operated pipelines at scale. " * 3 for i in range(4)],
+        "education": ["BSc Computer Science"], "certifications": [], "projects": ["Project A", "Project B"],
+    }
+    ats = {
+        "ats_score": rng.randint(40, 95), "keyword_match_percentage": rng.randint(30, 90),
+        "missing_critical_keywords": rng.sample(SKILLS, 5),
+        "strengths": ["Clear impact statements", "Relevant stack"],
+        "improvement_areas": ["Quantify results", "Add certifications"],
+        "formatting_score": 80, "content_relevance_score": 75,
+    }
+    questions = [{"question": f"Question {i}: tell me about a time you led a project?",
+                  "category": rng.choice(["General", "Technical", "Behavioral"]),
+                  "tips": "Use the STAR method."} for i in range(12)]
+    courses = [{"course_name": f"Course {i}", "provider": rng.choice(["Coursera", "Udemy", "edX"]),
+                "reason": "Closes a gap named in the job description.",
+                "skill_gap": rng.choice(SKILLS), "duration": "4 weeks"} for i in range(4)]
+    return json.dumps({"resume": resume, "ats": ats, "questions": questions, "courses": courses})
+
+
+def as_records(results):
+    return (
+        from_dict(ResumeRecord, results["resume"]),
+        from_dict(ATSRecord, results["ats"]),
+        tuple(from_dict(QuestionRecord, q) for q in results["questions"]),
+        tuple(from_dict(CourseRecord, c) for c in results["courses"]),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Session result memory: raw JSON vs compact records")
+    parser.add_argument("--sessions", type=int, default=2000, help="concurrent sessions to simulate")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [fake_results(rng) for _ in range(args.sessions)]
+
+    raw_seen, record_seen = set(), set()
+    raw_sessions = [json.loads(payload) for payload in payloads]
+    raw_bytes = sum(deep_sizeof(results, raw_seen) for results in raw_sessions)
+    record_sessions = [as_records(json.loads(payload)) for payload in payloads]
+    record_bytes = sum(deep_sizeof(records, record_seen) for records in record_sessions)
+
+    print(f"sessions         {args.sessions}")
+    print(f"raw JSON         {raw_bytes / args.sessions:10,.0f} bytes/session  {raw_bytes / 2**20:8.1f} MB total")
+    print(f"records          {record_bytes / args.sessions:10,.0f} bytes/session  {record_bytes / 2**20:8.1f} MB total")
+    print(f"saving           {1 - record_bytes / raw_bytes:10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_skills_gap.py
+#
+# Cost of the skills gap chart as the number of skills grows: building and
+# serializing the old radar (one polar axis per skill) against the category
+# radar, uncached and as a cached lookup, plus the JSON payload each sends to
+# the browser.
+#
+# Usage: python -m benchmarks.bench_skills_gap --skills 20 60 200
+
+import argparse
+import random
+import statistics
+import time
+import warnings
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.skill_taxonomy import SKILL_CATEGORIES
+from components.visualizations import skills_gap_figure_json
+
+VOCABULARY = sorted({keyword for keywords in SKILL_CATEGORIES.values() for keyword in keywords})
+
+
+def per_skill_radar_json(user_skills, missing_skills):
+    """The previous chart: every skill is an axis."""
+    user = {s.lower() for s in user_skills}
+    labels = sorted(user | {s.lower() for s in missing_skills})
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(r=[1] * len(labels), theta=labels, fill='toself', name='Required Skills'))
+    fig.add_trace(go.Scatterpolar(r=[1 if s in user else 0.2 for s in labels], theta=labels, fill='toself',
+                                  name='Your Skills'))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=False, range=[0, 1.1])))
+    return pio.to_json(fig, validate=False)
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skills gap chart cost by skill count")
+    parser.add_argument("--skills", type=int, nargs="+", default=[20, 60, 200], help="total skill counts to try")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    rng = random.Random(3)
+    print(f"{'skills':>6} {'per-skill ms':>13} {'bytes':>8} {'category ms':>12} {'cached ms':>10} {'bytes':>7}")
+    for count in args.skills:
+        pool = VOCABULARY + [f"custom skill {i}" for i in range(max(0, count - len(VOCABULARY)))]
+        skills = rng.sample(pool, count)
+        user, missing = tuple(sorted(skills[: count * 2 // 3])), tuple(sorted(skills[count * 2 // 3:]))
+
+        old_ms = median_ms(lambda: per_skill_radar_json(user, missing), args.repeat)
+        old_bytes = len(per_skill_radar_json(user, missing))
+        new_ms = median_ms(lambda: skills_gap_figure_json.__wrapped__(user, missing), args.repeat)
+        skills_gap_figure_json(user, missing)
+        cached_ms = median_ms(lambda: skills_gap_figure_json(user, missing), args.repeat)
+        new_bytes = len(skills_gap_figure_json(user, missing))
+        print(f"{count:>6} {old_ms:>13.2f} {old_bytes:>8} {new_ms:>12.2f} {cached_ms:>10.3f} {new_bytes:>7}")
+
+
+if __name__ == "__main__":
+    main()
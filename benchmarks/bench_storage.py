@@ -0,0 +1,100 @@
+# benchmarks/bench_storage.py
+#
+# Measures database size and history read time before and after the compact
+# storage migration. Builds a database in the original layout (JSON text plus
+# the full job description on every row), reads it, migrates it with init_db()
+# and reads it again. Uses a temporary file; the application database is never
+# touched.
+#
+# Usage: python -m benchmarks.bench_storage --users 50 --analyses 40
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import database
+from database import db_manager
+from benchmarks.sample_data import SAMPLE_JOB_DESCRIPTION, make_resume
+
+# The layout used before payloads were compressed and job descriptions hashed.
+LEGACY_SCHEMA = (
+    """CREATE TABLE users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, password_hash TEXT NOT NULL)""",
+    """CREATE TABLE resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, resume_data TEXT NOT NULL,
+        job_description TEXT, ats_score REAL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""",
+)
+
+
+def build_legacy_database(path, users, analyses):
+    """Each user re-analyses slight variations of their resume against a handful of job descriptions."""
+    job_descriptions = [f"{SAMPLE_JOB_DESCRIPTION}\n" * 12 + f"Posting #{n}" for n in range(5)]
+    with sqlite3.connect(path) as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(statement)
+        conn.executemany(
+            "INSERT INTO resumes (user_id, resume_data, job_description, ats_score) VALUES (?, ?, ?, ?)",
+            (
+                (user_id, json.dumps(make_resume(user_id * 1000 + n)), job_descriptions[n % 5], 60 + n % 40)
+                for user_id in range(1, users + 1) for n in range(analyses)
+            ),
+        )
+
+
+def database_size(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # VACUUM output lands in the WAL first
+    return os.path.getsize(path)
+
+
+def time_reads(read_history, users):
+    start = time.perf_counter()
+    for user_id in range(1, users + 1):
+        read_history(user_id)
+    return (time.perf_counter() - start) * 1000 / users
+
+
+def legacy_read(path):
+    def read_history(user_id):
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute(
+                "SELECT resume_data, job_description, ats_score, created_at FROM resumes "
+                "WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
+            ).fetchall()
+        return [(json.loads(row[0]), row[1]) for row in rows]
+    return read_history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact storage size and read time")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--analyses", type=int, default=40)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "storage.db")
+        build_legacy_database(path, args.users, args.analyses)
+        legacy_size = database_size(path)
+        legacy_ms = time_reads(legacy_read(path), args.users)
+
+        database.configure_database(path)
+        start = time.perf_counter()
+        db_manager.init_db()
+        migration_s = time.perf_counter() - start
+        database.configure_database(os.path.join(tmp, "unused.db"))  # release pooled handles before VACUUM
+        compact_size = database_size(path)
+        database.configure_database(path)
+        compact_ms = time_reads(db_manager.get_user_resumes, args.users)
+
+    rows = args.users * args.analyses
+    print(f"rows={rows} (migrated in {migration_s:.2f}s)")
+    print(f"legacy:  {legacy_size / 1024:9.1f} KiB  history read {legacy_ms:6.2f} ms/user")
+    print(f"compact: {compact_size / 1024:9.1f} KiB  history read {compact_ms:6.2f} ms/user")
+
+
+if __name__ == "__main__":
+    main()
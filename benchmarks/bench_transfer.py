@@ -0,0 +1,86 @@
+# benchmarks/bench_transfer.py
+#
+# Measures streaming history import and export at several database sizes:
+# rows/second, and peak Python memory (tracemalloc) to show that memory use
+# stays flat as the history grows. Generates a gzipped JSONL file, imports it
+# into a temporary database, then exports the database again. The application
+# database is never touched.
+#
+# Usage: python -m benchmarks.bench_transfer --rows 2000 20000
+
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import database
+from database import db_manager
+from benchmarks.sample_data import SAMPLE_JOB_DESCRIPTION, make_resume
+
+USERS = 20
+
+
+def write_source_file(path, rows):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "header", "format_version": 1}) + "\n")
+        for user in range(USERS):
+            f.write(json.dumps({"type": "user", "username": f"user{user}", "password_hash": "x"}) + "\n")
+        for n in range(rows):
+            f.write(json.dumps({
+                "type": "analysis",
+                "username": f"user{n % USERS}",
+                "created_at": f"2026-{1 + n % 12:02d}-{1 + n % 28:02d} 12:00:00",
+                "ats_score": 50 + n % 50,
+                "job_description": f"{SAMPLE_JOB_DESCRIPTION} Req #{n % 200}",
+                "resume_data": make_resume(n),
+            }) + "\n")
+
+
+def measure(operation):
+    """Runs operation twice: once for timing, once under tracemalloc for peak memory."""
+    start = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming JSONL import/export throughput and memory")
+    parser.add_argument("--rows", type=int, nargs="+", default=[2000, 20000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>7}  {'import rows/s':>13}  {'import peak':>11}  {'export rows/s':>13}  {'export peak':>11}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "source.jsonl.gz")
+            write_source_file(source, rows)
+
+            def run_import():
+                # A fresh database per run so both runs import the same number of rows
+                database.configure_database(os.path.join(tmp, f"import-{time.perf_counter_ns()}.db"))
+                db_manager.init_db()
+                with open(source, "rb") as f:
+                    database.import_history(f)
+
+            import_s, import_peak = measure(run_import)
+
+            def run_export():
+                with open(os.path.join(tmp, "export.jsonl.gz"), "wb") as f:
+                    database.export_history(f)
+
+            export_s, export_peak = measure(run_export)
+            database.configure_database(os.path.join(tmp, "unused.db"))  # release pooled handles
+
+        print(f"{rows:>7}  {rows / import_s:13.0f}  {import_peak / 2**20:9.1f}MB  "
+              f"{rows / export_s:13.0f}  {export_peak / 2**20:9.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_voice_input.py
+#
+# Latency from the end of a spoken answer to its final transcript: streaming
+# (segments transcribed while the user is still talking) against recording
+# the whole answer and then transcribing it in one request. Speech is
+# synthetic (tone bursts over a noise floor, with short pauses between
+# sentences) and fed at real-time pace, optionally sped up. Recognition is
+# simulated with a cost model, base + per-second-of-audio, instead of calling
+# the speech API.
+#
+# Usage: python -m benchmarks.bench_voice_input --sentences 8 --speedup 10
+
+import argparse
+import time
+
+import numpy as np
+
+from services.voice_input import (SAMPLE_RATE, FRAME_SAMPLES, SAMPLE_WIDTH, END_OF_SPEECH_S,
+                                  start_voice_capture)
+
+FRAME_S = FRAME_SAMPLES / SAMPLE_RATE
+
+
+def synthetic_answer(sentences, sentence_s, pause_s, rng):
+    """Frames of leading silence, then `sentences` tone bursts separated by pauses, then silence."""
+    def noise(seconds):
+        return rng.normal(0, 80, int(seconds * SAMPLE_RATE))
+
+    def speech(seconds):
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        return 4000 * np.sin(2 * np.pi * 220 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t)) + noise(seconds)
+
+    parts = [noise(1.0)]
+    for i in range(sentences):
+        parts.append(speech(sentence_s))
+        parts.append(noise(pause_s if i < sentences - 1 else END_OF_SPEECH_S + 1.0))
+    pcm = np.concatenate(parts).clip(-32768, 32767).astype(np.int16).tobytes()
+    step = FRAME_SAMPLES * SAMPLE_WIDTH
+    return [pcm[i:i + step] for i in range(0, len(pcm), step)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Voice answer: streaming vs whole-clip transcription latency")
+    parser.add_argument("--sentences", type=int, default=8)
+    parser.add_argument("--sentence-s", type=float, default=3.0, help="seconds of speech per sentence")
+    parser.add_argument("--pause-s", type=float, default=0.7, help="pause between sentences")
+    parser.add_argument("--base-ms", type=float, default=400, help="simulated recognition cost per request")
+    parser.add_argument("--per-audio-s-ms", type=float, default=80, help="simulated recognition cost per second of audio")
+    parser.add_argument("--speedup", type=float, default=10, help="run this many times faster than real time")
+    args = parser.parse_args()
+
+    frames = synthetic_answer(args.sentences, args.sentence_s, args.pause_s, np.random.default_rng(1))
+    speech_end_frame = int((1.0 + args.sentences * args.sentence_s + (args.sentences - 1) * args.pause_s) / FRAME_S)
+
+    def recognition_s(pcm):
+        audio_s = len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH)
+        return (args.base_ms + args.per_audio_s_ms * audio_s) / 1000
+
+    segments = []
+
+    def fake_transcribe(pcm):
+        segments.append(len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH))
+        time.sleep(recognition_s(pcm) / args.speedup)
+        return f"segment{len(segments)}"
+
+    speech_ended = {}
+
+    def realtime(frames):
+        for index, frame in enumerate(frames):
+            if index == speech_end_frame:
+                speech_ended["at"] = time.monotonic()
+            time.sleep(FRAME_S / args.speedup)
+            yield frame
+
+    capture = start_voice_capture(realtime(frames), fake_transcribe)
+    while not capture.finished:
+        time.sleep(0.001)
+    streaming_s = (time.monotonic() - speech_ended["at"]) * args.speedup
+
+    # Whole clip: the same end-of-speech wait, then one request for all the audio
+    speech_pcm_s = args.sentences * args.sentence_s + (args.sentences - 1) * args.pause_s
+    whole_clip_s = END_OF_SPEECH_S + recognition_s(b"\0" * int(speech_pcm_s * SAMPLE_RATE * SAMPLE_WIDTH))
+
+    print(f"answer length            {speech_pcm_s:6.1f} s of speech, {len(segments)} segments "
+          f"(longest {max(segments):.1f} s)")
+    print(f"transcript               {capture.text()!r:.60}")
+    print(f"whole clip, then ASR     {whole_clip_s:6.2f} s after the last word")
+    print(f"streaming segments       {streaming_s:6.2f} s after the last word")
+
+
+if __name__ == "__main__":
+    main()
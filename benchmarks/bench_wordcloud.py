@@ -0,0 +1,65 @@
+# benchmarks/bench_wordcloud.py
+#
+# Per-rerun cost of the ATS page's keyword word cloud: the old path (render,
+# then draw through a matplotlib figure and save it the way st.pyplot does,
+# never closing the figure), a direct PNG render with Pillow, and the cached
+# lookup a rerun now performs. Also reports the figures the old path leaves open.
+#
+# Usage: python -m benchmarks.bench_wordcloud --reruns 20
+
+import argparse
+import io
+import statistics
+import time
+import warnings
+
+from services.wordcloud_renderer import WordCloudRenderer, render_wordcloud_png
+
+KEYWORDS = ["Kafka", "Spark", "Airflow", "Terraform", "Kubernetes", "dbt", "Snowflake", "CI/CD",
+            "stakeholder management", "data modeling", "Python", "SQL", "streaming", "observability"]
+
+
+def old_path(keywords):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
+
+    cloud = WordCloud(width=800, height=400, background_color='white', colormap='Blues_r',
+                      max_words=50, collocations=False).generate(" ".join(keywords))
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.imshow(cloud, interpolation='bilinear')
+    ax.axis('off')
+    fig.savefig(io.BytesIO(), format='png')  # What st.pyplot does with the figure
+    return plt
+
+
+def timed_ms(fn, reruns):
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Word cloud cost per ATS page rerun")
+    parser.add_argument("--reruns", type=int, default=20, help="simulated reruns per strategy")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    old_ms, plt = timed_ms(lambda: old_path(KEYWORDS), args.reruns)
+    print(f"matplotlib figure per rerun  {old_ms:9.2f} ms  ({len(plt.get_fignums())} figures left open)")
+
+    png_ms, png = timed_ms(lambda: render_wordcloud_png(KEYWORDS), args.reruns)
+    print(f"direct PNG per rerun         {png_ms:9.2f} ms  ({len(png) / 1024:.0f} KB image)")
+
+    renderer = WordCloudRenderer()
+    renderer.submit(KEYWORDS).result()
+    cached_ms, _ = timed_ms(lambda: renderer.cached(KEYWORDS), args.reruns)
+    print(f"cached lookup per rerun      {cached_ms:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_write_queue.py
+#
+# Compares saving analyses synchronously (save_resume) with the write-behind
+# queue (save_resume_async) while many sessions save at once. Reports write
+# throughput, the latency each save adds to the request path (p50/p99), and
+# for the queue how long a save takes to be committed. Uses temporary
+# database files; the application database is never touched.
+#
+# Usage: python -m benchmarks.bench_write_queue --sessions 16 --saves 50
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+import database
+from database import db_manager
+from database.write_queue import WriteBehindQueue
+from database.db_manager import prepare_resume
+from benchmarks.sample_data import SAMPLE_JOB_DESCRIPTION, make_resume
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_sessions(sessions, saves, save):
+    """Each session saves `saves` analyses back to back. Returns request-path latencies (ms) and elapsed seconds."""
+    barrier = threading.Barrier(sessions + 1)
+    latencies = []
+    lock = threading.Lock()
+
+    def session(user_id):
+        local = []
+        barrier.wait()
+        for n in range(saves):
+            start = time.perf_counter()
+            save(user_id, make_resume(user_id * 1000 + n), SAMPLE_JOB_DESCRIPTION, 50 + n % 50)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=session, args=(user_id,)) for user_id in range(1, sessions + 1)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return latencies, start
+
+
+def report(label, total, elapsed, latencies):
+    print(f"{label:13} {total / elapsed:9.1f} saves/s  request path p50 {statistics.median(latencies):7.2f} ms"
+          f"  p99 {percentile(latencies, 0.99):7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synchronous saves versus the write-behind queue")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--saves", type=int, default=50, help="saves per session")
+    parser.add_argument("--flush-interval", type=float, default=0.05, help="write-behind flush interval (s)")
+    args = parser.parse_args()
+    total = args.sessions * args.saves
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure_database(os.path.join(tmp, "sync.db"))
+        db_manager.init_db()
+        latencies, start = run_sessions(args.sessions, args.saves, db_manager.save_resume)
+        report("synchronous", total, time.perf_counter() - start, latencies)
+
+        database.configure_database(os.path.join(tmp, "queued.db"))
+        db_manager.init_db()
+        write_queue = WriteBehindQueue(flush_interval=args.flush_interval)
+        futures, commit_latencies = [], []
+
+        def queued_save(user_id, resume_data, job_description, ats_score):
+            submitted = time.perf_counter()
+            future = write_queue.submit(prepare_resume(user_id, resume_data, job_description, ats_score))
+            future.add_done_callback(lambda _: commit_latencies.append((time.perf_counter() - submitted) * 1000))
+            futures.append(future)
+
+        latencies, start = run_sessions(args.sessions, args.saves, queued_save)
+        for future in futures:
+            future.result()
+        report("write-behind", total, time.perf_counter() - start, latencies)
+        print(f"{'':13} commit latency p50 {statistics.median(commit_latencies):7.2f} ms"
+              f"  p99 {percentile(commit_latencies, 0.99):7.2f} ms")
+        write_queue.close()
+        database.configure_database(os.path.join(tmp, "unused.db"))  # release pooled handles
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# benchmarks/sample_data.py
+
+SAMPLE_RESUME = {
+    "name": "Jordan Avery",
+    "email": "jordan.avery@example.com",
+    "phone": "+1 555 010 2030",
+    "summary": (
+        "Data engineer with six years of experience building batch and streaming pipelines "
+        "on AWS and GCP. Reduced warehouse costs by 35% and cut pipeline latency from hours to minutes."
+    ),
+    "skills": [
+        "Python", "SQL", "Apache Spark", "Airflow", "Kafka", "dbt", "AWS", "GCP", "Docker",
+        "Kubernetes", "Terraform", "Snowflake",
+    ],
+    "experience": [
+        "Senior Data Engineer, Acme Corp (2021-Present): Led migration of 40 legacy ETL jobs to Airflow and dbt.",
+        "Data Engineer, Globex (2018-2021): Built a Kafka-based clickstream pipeline processing 2B events/day.",
+        "Analyst, Initech (2017-2018): Automated weekly reporting with Python, saving 10 hours per week.",
+    ],
+    "education": ["B.Sc. Computer Science, State University (2017)"],
+    "projects": ["Open-source dbt package for data quality checks (1.2k GitHub stars)"],
+    "certifications": ["AWS Certified Data Analytics - Specialty"],
+}
+
+SAMPLE_JOB_DESCRIPTION = (
+    "Senior Data Engineer\n"
+    "We are looking for a data engineer to design and operate our streaming platform. "
+    "Experience with Kafka, Spark, Airflow and cloud data warehouses is required."
+)
+
+
+def make_resume(index):
+    """Returns a copy of the sample resume with a unique name, for bulk benchmarks."""
+    resume = dict(SAMPLE_RESUME)
+    resume["name"] = f"{SAMPLE_RESUME['name']} {index}"
+    return resume
@@ -1,5 +1,7 @@
 import streamlit as st
-from agents import ResumeAgent
+from agents import ResumeAgent, sync_analysis_results
+from utils.session_state import get_record, set_record
+from utils.session_memory import enforce_session_budget
 
 def create_sidebar():
     """
@@ -9,6 +11,10 @@ def create_sidebar():
     interactive AI Co-Pilot for ad-hoc tasks.
     """
 
+    # Pick up a background analysis that finished while the user was on another page
+    sync_analysis_results()
+    enforce_session_budget()
+
     # --- Display Latest Analysis Score ---
     st.sidebar.markdown("---")
     st.sidebar.header("📊 Latest Analysis")
@@ -18,11 +24,10 @@ def create_sidebar():
         st.sidebar.metric("ATS Compatibility Score", f"{score:.1f}%")
         
         # Display the number of missing keywords if available
-        if 'ats_analysis_results' in st.session_state:
-            results = st.session_state.ats_analysis_results
-            if isinstance(results, dict):
-                missing_keywords_count = len(results.get('missing_critical_keywords', []))
-                st.sidebar.metric("Keywords to Add", missing_keywords_count)
+        results = get_record('ats_analysis_results')
+        if results:
+            missing_keywords_count = len(results.get('missing_critical_keywords', []))
+            st.sidebar.metric("Keywords to Add", missing_keywords_count)
     else:
         st.sidebar.info("Your analysis results will appear here once you run a scan on the Dashboard.")
 
@@ -31,7 +36,8 @@ def create_sidebar():
     st.sidebar.header("🤖 AI Co-Pilot")
 
     # The assistant is only active if there's resume data to work with
-    if not st.session_state.get('resume_data'):
+    resume_data = get_record('resume_data')
+    if not resume_data:
         st.sidebar.warning("Please input your resume on the Dashboard to activate the Co-Pilot.")
     else:
         st.sidebar.success("Co-Pilot is ready! Ask for a specific task.")
@@ -47,7 +53,7 @@ def create_sidebar():
                     # The agent's execute_task is designed for these ad-hoc requests
                     response = agent.execute_task(
                         task_description=user_question,
-                        resume_data=st.session_state.resume_data,
+                        resume_data=resume_data,
                         job_description=st.session_state.get('job_description', '')
                     )
 
@@ -55,12 +61,13 @@ def create_sidebar():
                     if isinstance(response, dict) and 'error' not in response:
                         # If the agent returns optimization data, apply it directly
                         if 'optimized_summary' in response:
-                            st.session_state.resume_data['summary'] = response['optimized_summary']
+                            resume_data['summary'] = response['optimized_summary']
                         
                         if 'missing_keywords' in response:
-                            current_skills = set(st.session_state.resume_data.get('skills', []))
+                            current_skills = set(resume_data.get('skills', []))
                             current_skills.update(response['missing_keywords'])
-                            st.session_state.resume_data['skills'] = sorted(list(current_skills))
+                            resume_data['skills'] = sorted(list(current_skills))
+                        set_record('resume_data', resume_data)
 
                         st.sidebar.success("Your resume data has been updated!")
                         st.rerun() # Refresh the app to show changes instantly
@@ -1,9 +1,12 @@
 import streamlit as st
-from services.resume_generator import (
-    create_enhanced_pdf_resume,
-    create_word_resume,
-    create_resume_package
-)
+from functools import partial
+from utils.lazy_imports import lazy_import
+from services.answer_analyzer import STAR_STEPS
+
+# Every page applies the Hiredly styles from this module, but only the preview
+# and download widgets need the renderers (and with them ReportLab and python-docx).
+resume_generator = lazy_import("services.resume_generator")
+voice_input = lazy_import("services.voice_input")  # numpy and speech_recognition, on first recording
 
 def apply_hiredly_styles():
     """
@@ -64,37 +67,27 @@ def apply_hiredly_styles():
     st.markdown(custom_css, unsafe_allow_html=True)
 
 
-def display_resume_preview(resume_data):
-    """Shows a simplified, well-formatted preview of the resume content."""
+def display_resume_preview(resume_data, template_style="modern"):
+    """
+    Shows a live preview of the resume content.
+
+    Rendered from the same compiled template as the downloadable HTML resume, so
+    the preview always matches the exported file.
+    """
     if not isinstance(resume_data, dict) or not resume_data:
         st.warning("No resume data available to display a preview.")
         return
 
-    st.markdown(f"#### {resume_data.get('name', 'Your Name')}")
-    st.write(f"📧 {resume_data.get('email', 'N/A')} | 📱 {resume_data.get('phone', 'N/A')}")
-    
-    with st.expander("🎯 Professional Summary", expanded=True):
-        st.info(resume_data.get('summary', "No summary provided."))
-    
-    if resume_data.get('skills'):
-        st.markdown("**💪 Core Skills**")
-        # Display skills as neat tags
-        skills_html = ''.join(f'<span style="background-color:#1E90FF;color:white;padding:5px 12px;border-radius:15px;margin:3px;display:inline-block;">{skill}</span>' for skill in resume_data['skills'])
-        st.markdown(skills_html, unsafe_allow_html=True)
-    
-    if resume_data.get('experience'):
-        st.markdown("**💼 Professional Experience**")
-        for exp in resume_data['experience']:
-            st.markdown(f"- {exp}")
+    st.html(resume_generator.create_html_preview(resume_data, template_style))
 
 
-def create_download_buttons(resume_data, selected_template):
+def create_download_buttons(resume_data, selected_template, cover_letter="", linkedin_summary=""):
     """Generates a column of download buttons for various resume formats."""
     st.subheader("Download Formats")
     
     # PDF Download
     with st.spinner("Generating PDF..."):
-        pdf_buffer = create_enhanced_pdf_resume(resume_data, selected_template)
+        pdf_buffer = resume_generator.create_enhanced_pdf_resume(resume_data, selected_template)
     st.download_button(
         label="📄 Download PDF",
         data=pdf_buffer,
@@ -106,7 +99,7 @@ def create_download_buttons(resume_data, selected_template):
     
     # Word DOCX Download
     with st.spinner("Generating DOCX..."):
-        word_buffer = create_word_resume(resume_data)
+        word_buffer = resume_generator.create_word_resume(resume_data, selected_template)
     st.download_button(
         label="📝 Download DOCX",
         data=word_buffer,
@@ -115,12 +108,14 @@ def create_download_buttons(resume_data, selected_template):
         use_container_width=True
     )
     
-    # All-in-one ZIP Package
-    with st.spinner("Generating ZIP Package..."):
-        zip_buffer = create_resume_package(resume_data, selected_template)
+    # All-in-one ZIP Package, built only when clicked. st.download_button needs the whole file as bytes,
+    # so the archive is assembled in memory here; stream_resume_package() is for callers that can stream.
     st.download_button(
         label="📦 Download Full Package (.zip)",
-        data=zip_buffer,
+        data=partial(
+            resume_generator.create_resume_package, resume_data, selected_template,
+            cover_letter=cover_letter, linkedin_summary=linkedin_summary
+        ),
         file_name="Hiredly_Resume_Package.zip",
         mime="application/zip",
         use_container_width=True
@@ -130,16 +125,54 @@ def create_download_buttons(resume_data, selected_template):
 def display_star_method_guide():
     """Displays a formatted guide for the STAR method."""
     st.subheader("⭐ Master the STAR Method for Behavioral Questions")
-    star_cols = st.columns(4)
-    with star_cols[0]:
-        st.markdown("##### 🎯 Situation")
-        st.write("Set the scene and provide context (when, where).")
-    with star_cols[1]:
-        st.markdown("##### 📋 Task")
-        st.write("Describe your responsibility or the challenge.")
-    with star_cols[2]:
-        st.markdown("##### ⚡ Action")
-        st.write("Explain the specific steps YOU took. Use 'I' statements.")
-    with star_cols[3]:
-        st.markdown("##### 🏆 Result")
-        st.write("Share the outcome and quantify your success with numbers.")
\ No newline at end of file
+    star_cols = st.columns(len(STAR_STEPS))
+    for col, step in zip(star_cols, STAR_STEPS):
+        with col:
+            st.markdown(f"##### {step.icon} {step.name}")
+            st.write(step.guidance)
+
+
+# --- VOICE INPUT ---
+@st.fragment(run_every=0.5)
+def _live_voice_transcript(label, capture_key, height):
+    """Shows the transcript growing while the user speaks; redraws the page once it is final."""
+    capture = st.session_state[capture_key]
+    if capture.finished:
+        st.rerun()
+
+    if capture.status == voice_input.LISTENING:
+        st.info("🎙️ Listening... Pause for a moment when you're done, or press Stop.")
+    else:
+        st.info("✍️ Finishing the transcription...")
+    text = capture.text()
+    st.text_area(label, value=f"{text} …" if text else "…", height=height, disabled=True)
+    if capture.status == voice_input.LISTENING and st.button("⏹️ Stop Recording", key=f"{capture_key}_stop"):
+        capture.stop()
+
+def voice_text_area(label, key, record_label="🎤 Start Recording", height=None):
+    """
+    A text area the user can fill by speaking as well as typing. Speech is
+    transcribed segment by segment while they talk, and the partial text is
+    shown live; the final transcript lands in the text area, where it can be
+    edited. Returns the text area's value, like st.text_area.
+    """
+    capture_key = f"{key}_voice_capture"
+    capture = st.session_state.get(capture_key)
+    if capture is not None and not capture.finished:
+        _live_voice_transcript(label, capture_key, height)
+        return st.session_state.get(key, "")
+
+    if capture is not None:
+        # The recording just finished: move the transcript into the text area once
+        del st.session_state[capture_key]
+        text = capture.text()
+        if capture.error:
+            st.error(capture.error)
+        if text:
+            st.session_state[key] = text
+            st.toast("Transcription successful!", icon="✅")
+
+    if st.button(record_label, key=f"{key}_record"):
+        st.session_state[capture_key] = voice_input.start_voice_capture()
+        st.rerun()
+    return st.text_area(label, key=key, height=height)
@@ -1,7 +1,15 @@
+import json
+
 import streamlit as st
-import plotly.graph_objects as go
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from utils.lazy_imports import lazy_import
+
+# Charting libraries are loaded the first time a chart is drawn
+go = lazy_import("plotly.graph_objects")
+wordcloud_renderer = lazy_import("services.wordcloud_renderer")
+skills_gap = lazy_import("utils.skill_taxonomy")  # Brings in numpy
+
+# How long the page waits for a word cloud still rendering before moving on
+WORDCLOUD_WAIT_S = 10
 
 def display_ats_gauge(score):
     """
@@ -28,72 +36,158 @@ def display_ats_gauge(score):
     fig.update_layout(height=250, margin=dict(l=20, r=20, t=50, b=20), font=dict(color="#262730"))
     st.plotly_chart(fig, use_container_width=True)
 
+def prefetch_keyword_wordcloud(keywords):
+    """
+    Starts rendering the word cloud for these keywords in the background, so it
+    is ready (or nearly) by the time display_keyword_wordcloud() reaches it.
+    """
+    if keywords:
+        wordcloud_renderer.get_wordcloud_renderer().submit(keywords)
+
 def display_keyword_wordcloud(keywords):
     """
     Generates and displays a word cloud from a list of keywords.
+    Images are cached by keyword set, so a rerun is a cache lookup.
     """
     if not keywords:
         st.info("No missing keywords to display.")
         return
 
-    text = " ".join(keywords)
+    renderer = wordcloud_renderer.get_wordcloud_renderer()
+    png = renderer.cached(keywords)
     try:
-        wordcloud = WordCloud(
-            width=800,
-            height=400,
-            background_color='white',
-            colormap='Blues_r',  # UPDATED: Blue colormap to match theme
-            max_words=50,
-            collocations=False
-        ).generate(text)
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        st.pyplot(fig)
+        if png is None:
+            with st.spinner("Drawing your keyword cloud..."):
+                png = renderer.submit(keywords).result(timeout=WORDCLOUD_WAIT_S)
+        st.image(png, use_container_width=True)
     except Exception as e:
         st.error(f"Could not generate word cloud: {e}")
 
-def display_skills_gap_chart(user_skills, missing_skills):
+# Categories on the skills gap radar; with the per-category example lists this
+# bounds the chart's size however many skills a resume lists
+SKILLS_GAP_TOP_N = 8
+# A radar needs at least three axes to enclose an area; fewer categories get a bar chart
+SKILLS_GAP_MIN_CATEGORIES = 3
+
+def _hover_list(examples, total):
+    if not examples:
+        return "none"
+    extra = total - len(examples)
+    return ", ".join(examples) + (f" (+{extra} more)" if extra > 0 else "")
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def skills_gap_figure_json(user_skills, missing_skills, top_n=SKILLS_GAP_TOP_N):
     """
-    Creates and displays a dynamic radar chart visualizing the actual skills gap.
+    Builds the skills gap radar for sorted, de-duplicated skill tuples and
+    returns it as Plotly JSON, or a bar chart when the skills fall into fewer
+    than SKILLS_GAP_MIN_CATEGORIES categories. Cached by input, so reruns and
+    sessions with the same skills skip building the figure.
     """
-    user_skills_lower = {s.lower() for s in user_skills}
-    missing_skills_lower = {s.lower() for s in missing_skills}
-    
-    # The axes of our chart are the union of skills you have and skills you're missing.
-    labels = sorted(list(user_skills_lower.union(missing_skills_lower)))
-    
-    if not labels:
-        st.info("Not enough skill data to generate a gap analysis chart.")
-        return
-        
-    # A required skill is one you have OR one that's missing.
-    required_skills_lower = user_skills_lower.union(missing_skills_lower)
+    rows = skills_gap.skills_gap_by_category(user_skills, missing_skills, top_n=top_n)
+    if not rows:
+        return None
 
-    # Assign scores: 1 if present, 0.2 if missing (to create a visible shape).
-    user_scores = [1 if skill in user_skills_lower else 0.2 for skill in labels]
-    required_scores = [1 if skill in required_skills_lower else 0.2 for skill in labels]
+    labels = [row['category'] for row in rows]
+    hover = [
+        f"<b>{row['category']}</b><br>Have ({row['have']}): {_hover_list(row['have_examples'], row['have'])}"
+        f"<br>Missing ({row['missing']}): {_hover_list(row['missing_examples'], row['missing'])}"
+        for row in rows
+    ]
+    coverage = [round(row['coverage'], 3) for row in rows]
 
     fig = go.Figure()
+    if len(rows) < SKILLS_GAP_MIN_CATEGORIES:
+        fig.add_trace(go.Bar(
+            x=coverage, y=labels, orientation='h', name='Your Coverage',
+            marker_color='#1E90FF',
+            text=hover, hovertemplate='%{text}<br>Coverage: %{x:.0%}<extra></extra>'
+        ))
+        fig.update_layout(
+            xaxis=dict(range=[0, 1.05], tickformat='.0%', tickvals=[0.25, 0.5, 0.75, 1]),
+            yaxis=dict(autorange='reversed'),
+            height=150 + 60 * len(rows),
+            title="Your Personalized Skills Gap",
+            font=dict(color="#262730")
+        )
+        return fig.to_json()
 
+    # Close the polygons by repeating the first point
+    theta = labels + labels[:1]
     # Required Skills (Red Area - the gap to fill)
     fig.add_trace(go.Scatterpolar(
-        r=required_scores, theta=labels, fill='toself', name='Required Skills',
+        r=[1] * len(theta), theta=theta, fill='toself', name='Required Skills',
         fillcolor='rgba(231, 76, 60, 0.2)',
-        line=dict(color='rgba(231, 76, 60, 0.8)')
+        line=dict(color='rgba(231, 76, 60, 0.8)'),
+        hoverinfo='skip'
     ))
     # Your Skills (Blue Area)
     fig.add_trace(go.Scatterpolar(
-        r=user_scores, theta=labels, fill='toself', name='Your Skills',
-        fillcolor='rgba(30, 144, 255, 0.4)',      # UPDATED: Hiredly primary color (semi-transparent)
-        line=dict(color='#1E90FF')                # UPDATED: Hiredly primary color
+        r=coverage + coverage[:1], theta=theta, fill='toself', name='Your Coverage',
+        fillcolor='rgba(30, 144, 255, 0.4)',
+        line=dict(color='#1E90FF'),
+        text=hover + hover[:1], hovertemplate='%{text}<br>Coverage: %{r:.0%}<extra></extra>'
     ))
-    
     fig.update_layout(
-        polar=dict(radialaxis=dict(visible=False, range=[0, 1.1])),
+        polar=dict(radialaxis=dict(visible=True, range=[0, 1.05], tickformat='.0%', tickvals=[0.25, 0.5, 0.75, 1])),
         showlegend=True,
         title="Your Personalized Skills Gap",
         font=dict(color="#262730")
     )
-    st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
+    return fig.to_json()
+
+def display_skills_gap_chart(user_skills, missing_skills):
+    """
+    Shows skill coverage per taxonomy category (Cloud & DevOps, Data & Analytics,
+    ...) as a radar chart, or a bar chart for one or two categories: the share
+    of each category's skills the resume already has, with examples on hover.
+    """
+    figure_json = skills_gap_figure_json(
+        tuple(sorted({str(s) for s in user_skills})), tuple(sorted({str(s) for s in missing_skills}))
+    )
+    if figure_json is None:
+        st.info("Not enough skill data to generate a gap analysis chart.")
+        return
+    st.plotly_chart(json.loads(figure_json), use_container_width=True)
+
+def display_score_trends(trends):
+    """
+    Charts weekly ATS score progress and lists the best score reached per target role.
+    Expects the output of database.get_score_trends().
+    """
+    weekly = trends.get('weekly', [])
+    if not weekly:
+        st.info("Save a few analyses to see how your ATS score develops over time.")
+        return
+
+    weeks = [bucket['week_start'] for bucket in weekly]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=weeks, y=[bucket['analyses'] for bucket in weekly], name='Analyses',
+        marker_color='rgba(30, 144, 255, 0.25)', yaxis='y2'
+    ))
+    fig.add_trace(go.Scatter(
+        x=weeks, y=[bucket['average_score'] for bucket in weekly], name='Average Score',
+        mode='lines+markers', line=dict(color='#1E90FF')
+    ))
+    fig.add_trace(go.Scatter(
+        x=weeks, y=[bucket['best_score'] for bucket in weekly], name='Best Score',
+        mode='lines+markers', line=dict(color='#2ECC71', dash='dot')
+    ))
+    fig.update_layout(
+        title="ATS Score by Week",
+        xaxis=dict(type='category', title='Week of'),
+        yaxis=dict(range=[0, 100], title='ATS Score'),
+        yaxis2=dict(overlaying='y', side='right', showgrid=False, title='Analyses', rangemode='tozero'),
+        height=320, margin=dict(l=20, r=20, t=50, b=20),
+        legend=dict(orientation='h', y=-0.3),
+        font=dict(color="#262730")
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    roles = trends.get('roles', [])
+    if roles:
+        st.markdown("**Best score per role**")
+        st.dataframe(
+            [{"Role": r['role'], "Best Score": round(r['best_score'], 1), "Analyses": r['analyses']} for r in roles],
+            hide_index=True, use_container_width=True
+        )
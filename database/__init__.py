@@ -5,8 +5,20 @@ from .db_manager import (
     add_user,
     authenticate_user,
     save_resume,
-    get_user_resumes
+    get_user_resumes,
+    list_user_resumes,
+    search_user_resumes,
+    search_is_truncated,
+    get_score_trends,
+    get_resume_details,
+    save_analysis_checkpoint,
+    load_analysis_checkpoint,
+    SEARCH_CANDIDATE_LIMIT
 )
+from .connection import configure_database
+from .passwords import HashingBusyError
+from .write_queue import save_resume_async
+from .transfer import export_history, import_history, HistoryImportError
 
 # Explicitly define the public API of the 'database' package
 __all__ = [
@@ -14,5 +26,19 @@ __all__ = [
     "add_user",
     "authenticate_user",
     "save_resume",
-    "get_user_resumes"
+    "save_resume_async",
+    "get_user_resumes",
+    "list_user_resumes",
+    "search_user_resumes",
+    "search_is_truncated",
+    "get_score_trends",
+    "get_resume_details",
+    "save_analysis_checkpoint",
+    "load_analysis_checkpoint",
+    "SEARCH_CANDIDATE_LIMIT",
+    "configure_database",
+    "HashingBusyError",
+    "export_history",
+    "import_history",
+    "HistoryImportError"
 ]
\ No newline at end of file
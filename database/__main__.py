@@ -0,0 +1,48 @@
+# database/__main__.py
+#
+# Command-line export and import of saved analyses.
+#
+# Usage: python -m database export backup.jsonl.gz [--username alice]
+#        python -m database import backup.jsonl.gz [--username alice] [--start-line N]
+
+import argparse
+
+from .connection import get_connection
+from .db_manager import init_db
+from .transfer import SELECT_USER_ID_SQL, export_history, import_history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import saved analyses as gzipped JSONL")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    export_parser = subcommands.add_parser("export", help="write analyses to a .jsonl.gz file")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--username", help="export one user's analyses (default: everyone)")
+    import_parser = subcommands.add_parser("import", help="load analyses from a .jsonl.gz file")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--username", help="add every analysis to this existing account")
+    import_parser.add_argument("--start-line", type=int, default=0, help="resume an interrupted import")
+    args = parser.parse_args()
+
+    init_db()
+    user_id = None
+    if args.username:
+        with get_connection() as conn:
+            row = conn.execute(SELECT_USER_ID_SQL, (args.username,)).fetchone()
+        if row is None:
+            parser.error(f"unknown user '{args.username}'")
+        user_id = row[0]
+
+    if args.command == "export":
+        with open(args.path, "wb") as f:
+            lines = export_history(f, user_id)
+        print(f"Wrote {lines} lines to {args.path}")
+    else:
+        with open(args.path, "rb") as f:
+            imported = import_history(f, user_id, start_line=args.start_line,
+                                      on_checkpoint=lambda lines: print(f"checkpoint: {lines} lines committed"))
+        print(f"Imported {imported} analyses from {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# --- CONSTANTS ---
+DB_NAME = os.environ.get("HIREDLY_DB_PATH", "hiredly.db")
+POOL_SIZE = int(os.environ.get("HIREDLY_DB_POOL_SIZE", "8"))
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256  # compiled statements kept per connection
+
+# Applied to every new connection. WAL lets readers proceed while a writer commits,
+# and synchronous=NORMAL is durable across application crashes in WAL mode.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-16000",    # ~16 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class ConnectionPool:
+    """
+    A small pool of long-lived SQLite connections shared by all sessions.
+
+    Streamlit runs every rerun on a fresh thread, so connections are pooled
+    rather than thread-local. Keeping them open means pragmas are applied once
+    and sqlite3's per-connection statement cache is reused across calls.
+    """
+
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._created -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=BUSY_TIMEOUT_MS / 1000)
+        except queue.Empty:
+            # Reported like SQLite's own busy timeout, the error callers already handle
+            raise sqlite3.OperationalError(
+                f"connection pool exhausted: all {self.size} connections busy for {BUSY_TIMEOUT_MS} ms"
+            ) from None
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection for the duration of the block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close_all(self):
+        """Closes every idle connection (used on shutdown and when re-pointing the pool)."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Returns the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_NAME)
+    return _pool
+
+
+def configure_database(path: str, pool_size: int = POOL_SIZE) -> None:
+    """Points the pool at a different database file (used by benchmarks and tooling)."""
+    global _pool, DB_NAME
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        DB_NAME = path
+        _pool = ConnectionPool(path, pool_size)
+
+
+@contextmanager
+def get_connection():
+    """Borrows a pooled connection without opening a transaction (for reads)."""
+    with get_pool().connection() as conn:
+        yield conn
+
+
+@contextmanager
+def transaction():
+    """Borrows a pooled connection and commits on success or rolls back on error."""
+    with get_pool().connection() as conn:
+        with conn:
+            yield conn
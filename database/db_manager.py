@@ -1,108 +1,388 @@
 import sqlite3
-import bcrypt
-import json
 import datetime
-from typing import List, Dict, Optional, Any
+from collections import namedtuple
+from typing import List, Dict, Optional, Any, Tuple
 
-# --- CONSTANTS ---
-DB_NAME = "hiredly.db" # Renamed for branding
+from .connection import get_connection, transaction
+from .storage import encode_resume, decode_resume, hash_text, role_label
+from .migrations import migrate_database
+from .passwords import hash_password, verify_password, needs_rehash, HashingBusyError
+from .search import SEARCH_COLUMNS, search_document, build_match_query
+
+# --- SQL STATEMENTS ---
+# Kept as constants so the identical SQL text hits each pooled connection's statement cache.
+INSERT_USER_SQL = "INSERT INTO users (username, password_hash) VALUES (?, ?)"
+SELECT_USER_SQL = "SELECT id, password_hash FROM users WHERE username = ?"
+# Only replaces the hash that was verified, so a concurrent password change is never overwritten
+REHASH_USER_SQL = "UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?"
+# Resume payloads are stored compressed; job descriptions are stored once per
+# distinct text in 'job_descriptions' and referenced by their SHA-256 hash.
+INSERT_JOB_DESCRIPTION_SQL = "INSERT OR IGNORE INTO job_descriptions (hash, content) VALUES (?, ?)"
+INSERT_RESUME_SQL = """
+INSERT INTO resumes (user_id, resume_blob, jd_hash, ats_score)
+VALUES (?, ?, ?, ?)
+"""
+SELECT_USER_RESUMES_SQL = """
+SELECT r.resume_blob, j.content, r.ats_score, r.created_at FROM resumes r
+LEFT JOIN job_descriptions j ON j.hash = r.jd_hash
+WHERE r.user_id = ? ORDER BY r.created_at DESC, r.id DESC
+"""
+# Keyset pagination: both listing queries walk idx_resumes_user_created, so each page
+# costs the same no matter how deep into the history it is. They only read the
+# light columns; the heavy ones are fetched per item by SELECT_RESUME_DETAILS_SQL.
+LIST_RESUMES_FIRST_PAGE_SQL = """
+SELECT id, created_at, ats_score FROM resumes
+WHERE user_id = ?
+ORDER BY created_at DESC, id DESC LIMIT ?
+"""
+LIST_RESUMES_NEXT_PAGE_SQL = """
+SELECT id, created_at, ats_score FROM resumes
+WHERE user_id = ? AND (created_at, id) < (?, ?)
+ORDER BY created_at DESC, id DESC LIMIT ?
+"""
+# Kept in step with 'resumes' by write_resume(), in the same transaction.
+INSERT_SEARCH_SQL = f"""
+INSERT INTO resume_search (rowid, {", ".join(SEARCH_COLUMNS)})
+VALUES (?, {", ".join("?" * len(SEARCH_COLUMNS))})
+"""
+# bm25 costs a few microseconds per matching row, so a broad query over a huge
+# history would spend most of its time ranking rows nobody pages to. Only the most
+# recent matches (a cheap rowid-ordered index walk) are ranked, using the weights
+# stored in the table's 'rank' setting; this bounds the cost of every search. Equal
+# ranks are common (identical analyses), so the id breaks ties for stable OFFSET pages.
+SEARCH_CANDIDATE_LIMIT = 2000
+SEARCH_RESUMES_SQL = f"""
+SELECT r.id, r.created_at, r.ats_score FROM (
+    SELECT rowid AS id, rank FROM resume_search
+    WHERE resume_search MATCH ?
+    ORDER BY rowid DESC LIMIT {SEARCH_CANDIDATE_LIMIT}
+) s
+JOIN resumes r ON r.id = s.id
+ORDER BY s.rank, r.id DESC LIMIT ? OFFSET ?
+"""
+# Whether any match lies beyond the candidates, i.e. older matches were left unranked
+SEARCH_TRUNCATED_SQL = f"""
+SELECT 1 FROM resume_search WHERE resume_search MATCH ?
+ORDER BY rowid DESC LIMIT 1 OFFSET {SEARCH_CANDIDATE_LIMIT}
+"""
+# Trend aggregates, upserted by write_resume() in the same transaction as the resume
+# row. Both read created_at back from that row so buckets match the stored timestamp.
+UPSERT_SCORE_WEEKLY_SQL = """
+INSERT INTO score_weekly (user_id, week_start, analyses, score_sum, best_score)
+SELECT user_id, date(created_at, 'weekday 0', '-6 days'), 1, ats_score, ats_score
+FROM resumes WHERE id = ?
+ON CONFLICT (user_id, week_start) DO UPDATE SET
+    analyses = analyses + 1,
+    score_sum = score_sum + excluded.score_sum,
+    best_score = MAX(best_score, excluded.best_score)
+"""
+UPSERT_SCORE_BY_ROLE_SQL = """
+INSERT INTO score_by_role (user_id, role, analyses, best_score, last_analysed_at)
+SELECT user_id, ?, 1, ats_score, created_at
+FROM resumes WHERE id = ?
+ON CONFLICT (user_id, role) DO UPDATE SET
+    analyses = analyses + 1,
+    best_score = MAX(best_score, excluded.best_score),
+    last_analysed_at = MAX(last_analysed_at, excluded.last_analysed_at)
+"""
+# Both read a bounded number of rows straight off the primary keys
+SELECT_SCORE_WEEKLY_SQL = """
+SELECT week_start, analyses, score_sum / analyses, best_score FROM score_weekly
+WHERE user_id = ? ORDER BY week_start DESC LIMIT ?
+"""
+SELECT_SCORE_BY_ROLE_SQL = """
+SELECT role, analyses, best_score, last_analysed_at FROM score_by_role
+WHERE user_id = ? ORDER BY best_score DESC, last_analysed_at DESC LIMIT ?
+"""
+TREND_WEEKS = 12
+TREND_ROLES = 10
+
+SELECT_RESUME_DETAILS_SQL = """
+SELECT r.resume_blob, j.content FROM resumes r
+LEFT JOIN job_descriptions j ON j.hash = r.jd_hash
+WHERE r.id = ? AND r.user_id = ?
+"""
+
+# Checkpoint times carry milliseconds so the latest of several quick analyses is unambiguous
+UPSERT_CHECKPOINT_SQL = """
+INSERT INTO analysis_checkpoints (user_id, input_hash, jd_hash, payload, updated_at)
+VALUES (?, ?, ?, ?, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+ON CONFLICT (user_id, input_hash) DO UPDATE SET
+    jd_hash = excluded.jd_hash,
+    payload = excluded.payload,
+    updated_at = excluded.updated_at
+"""
+PRUNE_CHECKPOINTS_SQL = """
+DELETE FROM analysis_checkpoints WHERE user_id = ? AND input_hash NOT IN (
+    SELECT input_hash FROM analysis_checkpoints WHERE user_id = ?
+    ORDER BY updated_at DESC LIMIT ?
+)
+"""
+SELECT_CHECKPOINT_SQL = """
+SELECT c.input_hash, c.payload, j.content FROM analysis_checkpoints c
+LEFT JOIN job_descriptions j ON j.hash = c.jd_hash
+WHERE c.user_id = ? AND c.input_hash = ?
+"""
+SELECT_LATEST_CHECKPOINT_SQL = """
+SELECT c.input_hash, c.payload, j.content FROM analysis_checkpoints c
+LEFT JOIN job_descriptions j ON j.hash = c.jd_hash
+WHERE c.user_id = ?
+ORDER BY c.updated_at DESC LIMIT 1
+"""
+CHECKPOINTS_PER_USER = 20
+
+HISTORY_PAGE_SIZE = 10
+
+# A page cursor is the (created_at, id) of the last row on the previous page.
+HistoryCursor = Tuple[str, int]
 
 # --- DATABASE INITIALIZATION ---
 def init_db() -> None:
     """
-    Initializes the database and creates the 'users' and 'resumes' tables
-    if they do not already exist.
-    """
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL
-        )
-        """)
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS resumes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            resume_data TEXT NOT NULL,       -- Stored as a JSON string
-            job_description TEXT,
-            ats_score REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-        """)
-        conn.commit()
-
-# --- PASSWORD MANAGEMENT ---
-def hash_password(password: str) -> str:
-    """Hashes a password using bcrypt for secure storage."""
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed_password.decode('utf-8')
-
-def verify_password(stored_hash: str, provided_password: str) -> bool:
-    """Verifies a provided password against a stored bcrypt hash."""
-    return bcrypt.checkpw(provided_password.encode('utf-8'), stored_hash.encode('utf-8'))
+    Brings the database schema up to date by running any pending migrations.
+
+    The migrations run once per server process; subsequent calls (for example
+    on every Streamlit rerun) return immediately without touching the database.
+    """
+    migrate_database()
 
 # --- USER MANAGEMENT ---
 def add_user(username: str, password: str) -> bool:
     """
     Adds a new user to the database.
     Returns True on success, False if the username already exists.
+    Raises HashingBusyError if the server is too busy to hash the password.
     """
-    conn = sqlite3.connect(DB_NAME)
+    password_hash = hash_password(password)  # Hash before borrowing a connection
     try:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO users (username, password_hash) VALUES (?, ?)",
-                       (username, hash_password(password)))
-        conn.commit()
+        with transaction() as conn:
+            conn.execute(INSERT_USER_SQL, (username, password_hash))
         return True
     except sqlite3.IntegrityError:  # This error occurs if the username is not unique
         return False
-    finally:
-        conn.close()
 
 def authenticate_user(username: str, password: str) -> Optional[int]:
     """
     Authenticates a user. Returns the user's ID if credentials are valid,
     otherwise returns None.
+
+    Hashes made with an outdated bcrypt cost are upgraded on successful login.
+    Raises HashingBusyError if the server is too busy to check the password.
     """
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, password_hash FROM users WHERE username = ?", (username,))
-        user_record = cursor.fetchone()
-        
-        if user_record and verify_password(user_record[1], password):
-            return user_record[0]  # Return user ID
-    return None
+    with get_connection() as conn:
+        user_record = conn.execute(SELECT_USER_SQL, (username,)).fetchone()
+
+    # Verify outside the pooled connection so slow hashing never holds it
+    if not user_record or not verify_password(user_record[1], password):
+        return None
+
+    user_id, stored_hash = user_record
+    if needs_rehash(stored_hash):
+        try:
+            new_hash = hash_password(password)
+        except HashingBusyError:
+            return user_id  # The upgrade can wait for a quieter login
+        with transaction() as conn:
+            conn.execute(REHASH_USER_SQL, (new_hash, user_id, stored_hash))
+    return user_id  # Return user ID
 
 # --- RESUME HISTORY MANAGEMENT ---
-def save_resume(user_id: int, resume_data: Dict[str, Any], job_description: str, ats_score: float) -> None:
-    """Saves a user's resume analysis to the database."""
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT INTO resumes (user_id, resume_data, job_description, ats_score)
-        VALUES (?, ?, ?, ?)
-        """, (user_id, json.dumps(resume_data), job_description, ats_score))
-        conn.commit()
+# Everything save_resume() writes for one analysis, computed up front so no
+# encoding work happens while the write lock is held.
+PendingResume = namedtuple("PendingResume", [
+    "user_id", "resume_blob", "jd_hash", "job_description", "ats_score", "search_document", "role"
+])
+
+def prepare_resume(user_id: int, resume_data: Dict[str, Any], job_description: str, ats_score: float) -> PendingResume:
+    """
+    Encodes an analysis for storage. The result is a snapshot: later changes to
+    resume_data do not affect what is written.
+    """
+    return PendingResume(
+        user_id=user_id,
+        resume_blob=encode_resume(resume_data),
+        jd_hash=hash_text(job_description),
+        job_description=job_description,
+        ats_score=ats_score,
+        search_document=search_document(user_id, resume_data, job_description),
+        role=role_label(job_description),
+    )
+
+def write_resume(conn: sqlite3.Connection, pending: PendingResume) -> int:
+    """
+    Writes one prepared analysis, its search entry and its trend aggregates on a
+    connection with a transaction already open. Returns the new resume id.
+    """
+    if pending.jd_hash:
+        conn.execute(INSERT_JOB_DESCRIPTION_SQL, (pending.jd_hash, pending.job_description))
+    resume_id = conn.execute(
+        INSERT_RESUME_SQL, (pending.user_id, pending.resume_blob, pending.jd_hash, pending.ats_score)
+    ).lastrowid
+    conn.execute(INSERT_SEARCH_SQL, (resume_id, *pending.search_document))
+    if pending.ats_score is not None:
+        conn.execute(UPSERT_SCORE_WEEKLY_SQL, (resume_id,))
+        if pending.role:
+            conn.execute(UPSERT_SCORE_BY_ROLE_SQL, (pending.role, resume_id))
+    return resume_id
+
+def save_resume(user_id: int, resume_data: Dict[str, Any], job_description: str, ats_score: float) -> int:
+    """
+    Saves a user's resume analysis to the database and returns its id.
+
+    This writes synchronously; request handlers should prefer
+    database.save_resume_async(), which batches writes from all sessions.
+    """
+    pending = prepare_resume(user_id, resume_data, job_description, ats_score)  # Encode before borrowing a connection
+    with transaction() as conn:
+        return write_resume(conn, pending)
 
 def get_user_resumes(user_id: int) -> List[Dict[str, Any]]:
     """Retrieves all saved resume analyses for a given user, ordered by most recent."""
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-        SELECT resume_data, job_description, ats_score, created_at FROM resumes
-        WHERE user_id = ? ORDER BY created_at DESC
-        """, (user_id,))
-        resumes = cursor.fetchall()
-        
-        # Use a more Pythonic list comprehension to parse the JSON data
-        return [{
-            "resume_data": json.loads(row[0]),
-            "job_description": row[1],
-            "ats_score": row[2],
-            "created_at": row[3]
-        } for row in resumes]
\ No newline at end of file
+    with get_connection() as conn:
+        resumes = conn.execute(SELECT_USER_RESUMES_SQL, (user_id,)).fetchall()
+
+    # Use a more Pythonic list comprehension to decode the stored payloads
+    return [{
+        "resume_data": decode_resume(row[0]),
+        "job_description": row[1],
+        "ats_score": row[2],
+        "created_at": row[3]
+    } for row in resumes]
+
+def list_user_resumes(
+    user_id: int, limit: int = HISTORY_PAGE_SIZE, cursor: Optional[HistoryCursor] = None
+) -> Tuple[List[Dict[str, Any]], Optional[HistoryCursor]]:
+    """
+    Lists one page of a user's saved analyses, most recent first.
+
+    Only the id, date and ATS score are returned; use get_resume_details() for
+    the stored resume and job description. Pass the returned cursor back in to
+    fetch the next page; it is None once the last page has been read.
+    """
+    with get_connection() as conn:
+        if cursor is None:
+            rows = conn.execute(LIST_RESUMES_FIRST_PAGE_SQL, (user_id, limit + 1)).fetchall()
+        else:
+            created_at, resume_id = cursor
+            rows = conn.execute(LIST_RESUMES_NEXT_PAGE_SQL, (user_id, created_at, resume_id, limit + 1)).fetchall()
+
+    # The extra row only tells us whether another page exists
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    page = [{"id": row[0], "created_at": row[1], "ats_score": row[2]} for row in rows]
+    next_cursor = (rows[-1][1], rows[-1][0]) if has_more else None
+    return page, next_cursor
+
+def search_user_resumes(
+    user_id: int, query: str, limit: int = HISTORY_PAGE_SIZE, offset: int = 0
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Full-text search over a user's saved analyses, best match first.
+
+    Matches the job description, skills, summary and experience of each
+    analysis; the SEARCH_CANDIDATE_LIMIT most recent matches are ranked, ties
+    newest first. Returns the same light items as list_user_resumes() plus
+    the offset of the next page, which is None once the last page has been read.
+    """
+    match_query = build_match_query(user_id, query)
+    if match_query is None:
+        return [], None
+    with get_connection() as conn:
+        rows = conn.execute(SEARCH_RESUMES_SQL, (match_query, limit + 1, offset)).fetchall()
+
+    has_more = len(rows) > limit
+    page = [{"id": row[0], "created_at": row[1], "ats_score": row[2]} for row in rows[:limit]]
+    return page, (offset + limit if has_more else None)
+
+def search_is_truncated(user_id: int, query: str) -> bool:
+    """
+    True if more than SEARCH_CANDIDATE_LIMIT analyses match, so the oldest
+    matches are missing from search_user_resumes(). A rowid-ordered index
+    walk, no ranking.
+    """
+    match_query = build_match_query(user_id, query)
+    if match_query is None:
+        return False
+    with get_connection() as conn:
+        return conn.execute(SEARCH_TRUNCATED_SQL, (match_query,)).fetchone() is not None
+
+def get_score_trends(user_id: int, weeks: int = TREND_WEEKS, roles: int = TREND_ROLES) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns a user's ATS score trends from the incrementally maintained aggregates.
+
+    'weekly' holds the analysis count, average and best score for each of the
+    most recent weeks that had analyses, oldest first; 'roles' holds the best
+    score per target role, best first. The cost depends only on the number of
+    buckets returned, never on the length of the history.
+    """
+    with get_connection() as conn:
+        weekly = conn.execute(SELECT_SCORE_WEEKLY_SQL, (user_id, weeks)).fetchall()
+        by_role = conn.execute(SELECT_SCORE_BY_ROLE_SQL, (user_id, roles)).fetchall()
+
+    return {
+        "weekly": [{
+            "week_start": row[0],
+            "analyses": row[1],
+            "average_score": row[2],
+            "best_score": row[3]
+        } for row in reversed(weekly)],
+        "roles": [{
+            "role": row[0],
+            "analyses": row[1],
+            "best_score": row[2],
+            "last_analysed_at": row[3]
+        } for row in by_role]
+    }
+
+def get_resume_details(user_id: int, resume_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Fetches and decodes the heavy columns of one saved analysis.
+
+    Scoped to the owning user so one user can never read another's analysis.
+    Returns None if the analysis does not exist.
+    """
+    with get_connection() as conn:
+        row = conn.execute(SELECT_RESUME_DETAILS_SQL, (resume_id, user_id)).fetchone()
+    if row is None:
+        return None
+    return {"resume_data": decode_resume(row[0]), "job_description": row[1]}
+
+# --- ANALYSIS CHECKPOINTS ---
+def save_analysis_checkpoint(user_id: int, input_hash: str, results: Dict[str, Any]) -> None:
+    """
+    Stores the full results of a Dashboard analysis under the user and a hash of
+    its inputs, replacing any earlier checkpoint for the same inputs. Only the
+    user's most recent CHECKPOINTS_PER_USER checkpoints are kept.
+    """
+    job_description = results.get('job_description') or ''
+    jd_hash = hash_text(job_description)
+    # Same compact encoding as resumes; the job description is stored by hash
+    payload = encode_resume({key: value for key, value in results.items()
+                             if key not in ('job_description', 'input_hash')})
+    with transaction() as conn:
+        if jd_hash:
+            conn.execute(INSERT_JOB_DESCRIPTION_SQL, (jd_hash, job_description))
+        conn.execute(UPSERT_CHECKPOINT_SQL, (user_id, input_hash, jd_hash, payload))
+        conn.execute(PRUNE_CHECKPOINTS_SQL, (user_id, user_id, CHECKPOINTS_PER_USER))
+
+def load_analysis_checkpoint(user_id: int, input_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Returns the checkpointed results for the given inputs, or the user's most
+    recent checkpoint if no input hash is given, with 'job_description' and
+    'input_hash' filled in. Returns None if there is none, or if it holds an
+    empty (failed) analysis. One indexed read.
+    """
+    with get_connection() as conn:
+        if input_hash is None:
+            row = conn.execute(SELECT_LATEST_CHECKPOINT_SQL, (user_id,)).fetchone()
+        else:
+            row = conn.execute(SELECT_CHECKPOINT_SQL, (user_id, input_hash)).fetchone()
+    if row is None:
+        return None
+    results = decode_resume(row[1])
+    # Analyses that failed used to be checkpointed too; never serve one
+    if not results.get('ats') or not any((results.get('resume_data') or {}).values()):
+        return None
+    results['job_description'] = row[2] or ''
+    results['input_hash'] = row[0]
+    return results
@@ -0,0 +1,271 @@
+import json
+import sqlite3
+import threading
+from collections import namedtuple
+
+from .connection import get_connection, get_pool
+from .storage import encode_resume, decode_resume, hash_text, role_label
+from .search import SEARCH_COLUMNS, SEARCH_RANK, search_document
+
+# A schema change. `apply` receives a connection with a write transaction already
+# open and must not commit; the runner records the version in the same transaction.
+# Migrations are frozen once released: add a new one instead of editing an old one.
+Migration = namedtuple("Migration", ["version", "name", "apply"])
+
+MIGRATION_BATCH_SIZE = 500
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+# --- MIGRATIONS ---
+def _create_base_tables(conn: sqlite3.Connection) -> None:
+    """Creates the users, job_descriptions and resumes tables on a fresh database."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS job_descriptions (
+        hash TEXT PRIMARY KEY,
+        content TEXT NOT NULL
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        resume_blob BLOB NOT NULL,       -- zlib-compressed compact JSON
+        jd_hash TEXT,                    -- SHA-256 of the job description
+        ats_score REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (jd_hash) REFERENCES job_descriptions (hash)
+    )
+    """)
+
+def _convert_to_compact_storage(conn: sqlite3.Connection) -> None:
+    """
+    Converts a 'resumes' table from the original layout (JSON text plus the full
+    job description on every row) to compressed payloads and hashed job
+    descriptions. Existing ids and timestamps are preserved. A no-op for
+    databases created in the compact layout.
+    """
+    if 'resume_data' not in _table_columns(conn, 'resumes'):
+        return
+
+    conn.execute("ALTER TABLE resumes RENAME TO resumes_legacy")
+    conn.execute("DROP INDEX IF EXISTS idx_resumes_user_created")
+    _create_base_tables(conn)
+
+    legacy_rows = conn.execute("""
+    SELECT id, user_id, resume_data, job_description, ats_score, created_at
+    FROM resumes_legacy ORDER BY id
+    """)
+    while True:
+        batch = legacy_rows.fetchmany(MIGRATION_BATCH_SIZE)
+        if not batch:
+            break
+        job_descriptions, resumes = [], []
+        for resume_id, user_id, resume_json, job_description, ats_score, created_at in batch:
+            jd_hash = hash_text(job_description)
+            if jd_hash:
+                job_descriptions.append((jd_hash, job_description))
+            resumes.append((resume_id, user_id, encode_resume(json.loads(resume_json)), jd_hash, ats_score, created_at))
+        conn.executemany("INSERT OR IGNORE INTO job_descriptions (hash, content) VALUES (?, ?)", job_descriptions)
+        conn.executemany("""
+        INSERT INTO resumes (id, user_id, resume_blob, jd_hash, ats_score, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, resumes)
+
+    conn.execute("DROP TABLE resumes_legacy")
+
+def _create_history_index(conn: sqlite3.Connection) -> None:
+    """Composite index behind the keyset-paginated history listing."""
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_resumes_user_created
+    ON resumes (user_id, created_at DESC, id DESC)
+    """)
+
+def _create_search_index(conn: sqlite3.Connection) -> None:
+    """
+    Full-text index over saved analyses, keyed by resume id. Contentless
+    (content=''), since the text already lives in 'resumes' and
+    'job_descriptions'; it stores only the index. Existing analyses are
+    backfilled in batches.
+    """
+    conn.execute(f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS resume_search USING fts5(
+        {", ".join(SEARCH_COLUMNS)},
+        content='', tokenize='porter unicode61'
+    )
+    """)
+    conn.execute("INSERT INTO resume_search (resume_search, rank) VALUES ('rank', ?)", (SEARCH_RANK,))
+
+    placeholders = ", ".join("?" * (len(SEARCH_COLUMNS) + 1))
+    existing_rows = conn.execute("""
+    SELECT r.id, r.user_id, r.resume_blob, j.content FROM resumes r
+    LEFT JOIN job_descriptions j ON j.hash = r.jd_hash ORDER BY r.id
+    """)
+    while True:
+        batch = existing_rows.fetchmany(MIGRATION_BATCH_SIZE)
+        if not batch:
+            break
+        conn.executemany(
+            f"INSERT INTO resume_search (rowid, {', '.join(SEARCH_COLUMNS)}) VALUES ({placeholders})",
+            [(resume_id, *search_document(user_id, decode_resume(blob), job_description))
+             for resume_id, user_id, blob, job_description in batch],
+        )
+
+def _create_score_aggregates(conn: sqlite3.Connection) -> None:
+    """
+    Per-user trend tables maintained incrementally by save_resume(): one row per
+    user and week (weeks start on Monday) and one per user and target role.
+    Backfilled from the existing history.
+    """
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS score_weekly (
+        user_id INTEGER NOT NULL,
+        week_start DATE NOT NULL,
+        analyses INTEGER NOT NULL,
+        score_sum REAL NOT NULL,
+        best_score REAL NOT NULL,
+        PRIMARY KEY (user_id, week_start),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS score_by_role (
+        user_id INTEGER NOT NULL,
+        role TEXT NOT NULL COLLATE NOCASE,
+        analyses INTEGER NOT NULL,
+        best_score REAL NOT NULL,
+        last_analysed_at TIMESTAMP NOT NULL,
+        PRIMARY KEY (user_id, role),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ) WITHOUT ROWID
+    """)
+
+    conn.execute("""
+    INSERT OR REPLACE INTO score_weekly (user_id, week_start, analyses, score_sum, best_score)
+    SELECT user_id, date(created_at, 'weekday 0', '-6 days'), COUNT(*), SUM(ats_score), MAX(ats_score)
+    FROM resumes WHERE ats_score IS NOT NULL
+    GROUP BY 1, 2
+    """)
+
+    # Roles are derived from the job description text, so aggregate per distinct
+    # description in SQL and let the upsert merge descriptions that share a role.
+    per_description = conn.execute("""
+    SELECT r.user_id, j.content, COUNT(*), MAX(r.ats_score), MAX(r.created_at) FROM resumes r
+    JOIN job_descriptions j ON j.hash = r.jd_hash
+    WHERE r.ats_score IS NOT NULL
+    GROUP BY r.user_id, r.jd_hash
+    """).fetchall()
+    conn.executemany("""
+    INSERT INTO score_by_role (user_id, role, analyses, best_score, last_analysed_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (user_id, role) DO UPDATE SET
+        analyses = analyses + excluded.analyses,
+        best_score = MAX(best_score, excluded.best_score),
+        last_analysed_at = MAX(last_analysed_at, excluded.last_analysed_at)
+    """, [
+        (user_id, role_label(job_description), analyses, best_score, last_analysed_at)
+        for user_id, job_description, analyses, best_score, last_analysed_at in per_description
+        if role_label(job_description)
+    ])
+
+def _create_analysis_checkpoints(conn: sqlite3.Connection) -> None:
+    """
+    Full Dashboard results per user and analysis inputs, so a new session can be
+    restored without repeating the AI calls. The job description is stored once
+    in job_descriptions, as for resumes.
+    """
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS analysis_checkpoints (
+        user_id INTEGER NOT NULL,
+        input_hash TEXT NOT NULL,        -- SHA-256 of the resume text and job description
+        jd_hash TEXT,
+        payload BLOB NOT NULL,           -- zlib-compressed compact JSON of the results
+        updated_at TIMESTAMP NOT NULL,
+        PRIMARY KEY (user_id, input_hash),
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (jd_hash) REFERENCES job_descriptions (hash)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_checkpoints_user_updated
+    ON analysis_checkpoints (user_id, updated_at DESC)
+    """)
+
+
+# Ordered list of every schema change. Databases created before versioning
+# existed start at version 0; the early migrations are idempotent so they
+# adopt such databases safely.
+MIGRATIONS = [
+    Migration(1, "base tables", _create_base_tables),
+    Migration(2, "compact resume storage", _convert_to_compact_storage),
+    Migration(3, "history index", _create_history_index),
+    Migration(4, "full-text search index", _create_search_index),
+    Migration(5, "score trend aggregates", _create_score_aggregates),
+    Migration(6, "analysis checkpoints", _create_analysis_checkpoints),
+]
+
+
+# --- RUNNER ---
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Applies every pending migration in order, each in its own IMMEDIATE
+    transaction. The version is re-checked after taking the write lock, so
+    several processes starting at once never apply a migration twice.
+    Returns the resulting schema version.
+    """
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    for migration in MIGRATIONS:
+        if get_schema_version(conn) >= migration.version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) < migration.version:
+                migration.apply(conn)
+                conn.execute("INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                             (migration.version, migration.name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return get_schema_version(conn)
+
+
+_migrated_paths = set()
+_migration_lock = threading.Lock()
+
+def migrate_database() -> None:
+    """
+    Brings the configured database up to date, once per server process.
+
+    After the first call for a database file this is a set lookup, so calling
+    it on every Streamlit rerun costs nothing.
+    """
+    path = get_pool().path
+    if path in _migrated_paths:
+        return
+    with _migration_lock:
+        if path in _migrated_paths:
+            return
+        with get_connection() as conn:
+            apply_migrations(conn)
+        _migrated_paths.add(path)
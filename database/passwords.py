@@ -0,0 +1,64 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+import bcrypt
+
+# --- CONSTANTS ---
+# bcrypt work factor for new hashes. Raising it makes existing hashes "outdated";
+# they are upgraded transparently the next time their owner logs in.
+BCRYPT_ROUNDS = int(os.environ.get("HIREDLY_BCRYPT_ROUNDS", "12"))
+# Maximum number of hashes computed at once. bcrypt releases the GIL, so these
+# threads run in parallel; bounding them keeps a login burst from pinning every core
+# and starving the other sessions served by this process.
+HASH_WORKERS = int(os.environ.get("HIREDLY_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+HASH_TIMEOUT_S = 30
+
+_COST_PATTERN = re.compile(r'^\$2[abxy]?\$(\d{2})\$')
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="bcrypt")
+
+
+class HashingBusyError(RuntimeError):
+    """The hashing pool could not get to a password within HASH_TIMEOUT_S, e.g. during a login burst."""
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+def _verify(stored_hash: str, provided_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(provided_password.encode('utf-8'), stored_hash.encode('utf-8'))
+    except ValueError:  # Malformed stored hash
+        return False
+
+
+def _run_on_pool(fn, *args):
+    """Runs fn on the hashing pool. Raises HashingBusyError if it has not finished within HASH_TIMEOUT_S."""
+    future = _executor.submit(fn, *args)
+    try:
+        return future.result(timeout=HASH_TIMEOUT_S)
+    except FutureTimeoutError:
+        future.cancel()  # Don't leave it queued behind the burst if it has not started
+        raise HashingBusyError("The server is busy. Please try again in a moment.") from None
+
+
+# --- PUBLIC API ---
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """Hashes a password with bcrypt on the bounded hashing pool."""
+    return _run_on_pool(_hash, password, rounds or BCRYPT_ROUNDS)
+
+def verify_password(stored_hash: str, provided_password: str) -> bool:
+    """Verifies a password against a stored bcrypt hash on the bounded hashing pool."""
+    return _run_on_pool(_verify, stored_hash, provided_password)
+
+def hash_cost(stored_hash: str) -> Optional[int]:
+    """Returns the work factor encoded in a bcrypt hash, or None if it cannot be read."""
+    match = _COST_PATTERN.match(stored_hash or '')
+    return int(match.group(1)) if match else None
+
+def needs_rehash(stored_hash: str, rounds: Optional[int] = None) -> bool:
+    """True if the hash was made with a lower work factor than the configured one."""
+    cost = hash_cost(stored_hash)
+    return cost is not None and cost < (rounds or BCRYPT_ROUNDS)
@@ -0,0 +1,61 @@
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# --- CONSTANTS ---
+# Column order of the 'resume_search' FTS5 table. 'owner' holds a single token per
+# row so the MATCH itself restricts results to one user, using the index instead of
+# filtering every match afterwards.
+SEARCH_COLUMNS = ("owner", "job_description", "skills", "summary", "experience")
+# bm25 weights in SEARCH_COLUMNS order: job description hits rank highest, since
+# users mostly remember which posting they analysed against.
+SEARCH_RANK = "bm25(0.0, 3.0, 2.0, 1.0, 1.0)"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def owner_token(user_id: int) -> str:
+    return f"owner{user_id}"
+
+def _flatten(value: Any) -> Iterable[str]:
+    """Yields every string inside a resume field, whatever mix of lists and dicts it is."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield str(value)
+
+
+# --- INDEXING ---
+def search_document(user_id: int, resume_data: Dict[str, Any], job_description: Optional[str]) -> Tuple[str, ...]:
+    """Returns the column values indexed for one saved analysis, in SEARCH_COLUMNS order."""
+    return (
+        owner_token(user_id),
+        job_description or "",
+        " ".join(_flatten(resume_data.get("skills"))),
+        " ".join(_flatten([resume_data.get("name"), resume_data.get("summary")])),
+        " ".join(_flatten([resume_data.get("experience"), resume_data.get("projects")])),
+    )
+
+
+# --- QUERYING ---
+def build_match_query(user_id: int, query: str) -> Optional[str]:
+    """
+    Turns free text typed by a user into a safe FTS5 MATCH expression.
+
+    Every word must match one of the content columns (quoted, so FTS5 operators
+    in the input are treated as plain text) and the last word also matches as a
+    prefix, so results appear while a word is still being typed. Returns None if
+    the query has no words.
+    """
+    words = _TOKEN_PATTERN.findall(query or "")
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    content_columns = " ".join(SEARCH_COLUMNS[1:])
+    return f'owner : "{owner_token(user_id)}" AND {{{content_columns}}} : ({" ".join(terms)})'
@@ -0,0 +1,42 @@
+import hashlib
+import json
+import re
+import zlib
+from typing import Any, Dict, Optional
+
+# --- CONSTANTS ---
+COMPRESSION_LEVEL = 6
+ROLE_LABEL_MAX_LENGTH = 80
+
+
+# --- PAYLOAD ENCODING ---
+def encode_resume(resume_data: Dict[str, Any]) -> bytes:
+    """Serialises resume data as compact JSON and compresses it for storage."""
+    compact = json.dumps(resume_data, separators=(',', ':'), ensure_ascii=False)
+    return zlib.compress(compact.encode('utf-8'), COMPRESSION_LEVEL)
+
+def decode_resume(blob: bytes) -> Dict[str, Any]:
+    """Reverses encode_resume()."""
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+# --- CONTENT ADDRESSING ---
+def hash_text(text: Optional[str]) -> Optional[str]:
+    """Returns the content address (SHA-256 hex) of a job description, or None if it is empty."""
+    if not text:
+        return None
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# --- DERIVED FIELDS ---
+def role_label(job_description: Optional[str]) -> Optional[str]:
+    """
+    Returns the role an analysis targeted: the first non-empty line of the job
+    description (postings open with the title), whitespace-collapsed and
+    truncated. Returns None if the job description is empty.
+    """
+    for line in (job_description or '').splitlines():
+        label = re.sub(r'\s+', ' ', line).strip(' \t-:|')
+        if label:
+            return label[:ROLE_LABEL_MAX_LENGTH]
+    return None
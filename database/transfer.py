@@ -0,0 +1,214 @@
+import gzip
+import io
+import json
+import zlib
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Iterator, Optional
+
+from .connection import get_connection, transaction
+from .db_manager import (
+    INSERT_JOB_DESCRIPTION_SQL,
+    INSERT_SEARCH_SQL,
+    UPSERT_SCORE_WEEKLY_SQL,
+    UPSERT_SCORE_BY_ROLE_SQL,
+    prepare_resume,
+    init_db,
+)
+
+# --- CONSTANTS ---
+FORMAT_VERSION = 1
+EXPORT_FETCH_SIZE = 500   # rows pulled from the cursor at a time
+IMPORT_CHUNK_SIZE = 1000  # lines committed per transaction; each commit is a checkpoint
+GZIP_LEVEL = 6
+
+# Both exports walk an index in order, so SQLite streams rows without sorting them first
+EXPORT_ALL_SQL = """
+SELECT u.username, r.created_at, r.ats_score, j.content, r.resume_blob FROM resumes r
+JOIN users u ON u.id = r.user_id
+LEFT JOIN job_descriptions j ON j.hash = r.jd_hash
+ORDER BY r.id
+"""
+EXPORT_USER_SQL = """
+SELECT u.username, r.created_at, r.ats_score, j.content, r.resume_blob FROM resumes r
+JOIN users u ON u.id = r.user_id
+LEFT JOIN job_descriptions j ON j.hash = r.jd_hash
+WHERE r.user_id = ?
+ORDER BY r.created_at, r.id
+"""
+EXPORT_USERS_SQL = "SELECT username, password_hash FROM users ORDER BY id"
+
+IMPORT_USER_SQL = "INSERT OR IGNORE INTO users (username, password_hash) VALUES (?, ?)"
+SELECT_USER_ID_SQL = "SELECT id FROM users WHERE username = ?"
+# Ids are allocated up front (under the write lock) so every table in a chunk can
+# be filled with executemany; AUTOINCREMENT never reuses ids, hence sqlite_sequence.
+NEXT_RESUME_ID_SQL = """
+SELECT MAX(COALESCE((SELECT MAX(id) FROM resumes), 0),
+           COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'resumes'), 0)) + 1
+"""
+# An analysis already saved for the user with the same timestamp and content is
+# skipped, so importing the same file twice adds nothing. Served by idx_resumes_user_created.
+EXISTING_RESUME_SQL = """
+SELECT 1 FROM resumes
+WHERE user_id = ? AND created_at = ? AND resume_blob = ? AND jd_hash IS ?
+LIMIT 1
+"""
+IMPORT_RESUME_SQL = """
+INSERT INTO resumes (id, user_id, resume_blob, jd_hash, ats_score, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+class HistoryImportError(Exception):
+    """Raised when an import stops part-way. Lines before `committed_lines` are already saved."""
+
+    def __init__(self, message: str, committed_lines: int):
+        super().__init__(f"{message} (the first {committed_lines} lines were imported; "
+                         f"pass start_line={committed_lines} to resume)")
+        self.committed_lines = committed_lines
+
+
+# --- EXPORT ---
+def iter_export_lines(user_id: Optional[int] = None) -> Iterator[str]:
+    """
+    Yields a history export as JSON lines: a header, then one line per analysis.
+
+    Exports one user's analyses, or every user's when user_id is None; a full
+    export also lists each account (with its password hash) before the
+    analyses, so it can restore a complete database. Rows are pulled from the
+    cursor in small batches and stored payloads are spliced in without being
+    parsed, so memory use does not grow with the size of the history. The
+    pooled connection is held until the generator is exhausted or closed.
+    """
+    yield json.dumps({"type": "header", "format_version": FORMAT_VERSION})
+    with get_connection() as conn:
+        if user_id is None:
+            for username, password_hash in conn.execute(EXPORT_USERS_SQL):
+                yield json.dumps({"type": "user", "username": username, "password_hash": password_hash})
+            cursor = conn.execute(EXPORT_ALL_SQL)
+        else:
+            cursor = conn.execute(EXPORT_USER_SQL, (user_id,))
+
+        while True:
+            rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                break
+            for username, created_at, ats_score, job_description, resume_blob in rows:
+                fields = json.dumps({
+                    "type": "analysis",
+                    "username": username,
+                    "created_at": created_at,
+                    "ats_score": ats_score,
+                    "job_description": job_description,
+                }, ensure_ascii=False)
+                # The stored payload is already compact JSON, so it is embedded as-is
+                yield f'{fields[:-1]}, "resume_data": {zlib.decompress(resume_blob).decode("utf-8")}}}'
+
+def export_history(fileobj: BinaryIO, user_id: Optional[int] = None) -> int:
+    """Writes a gzipped JSONL export to a binary file object. Returns the number of lines written."""
+    lines = 0
+    with gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=GZIP_LEVEL) as gz:
+        writer = io.TextIOWrapper(gz, encoding='utf-8', newline='\n')
+        for line in iter_export_lines(user_id):
+            writer.write(line)
+            writer.write('\n')
+            lines += 1
+        writer.flush()
+        writer.detach()  # Leave closing the gzip stream to the with block
+    return lines
+
+
+# --- IMPORT ---
+def _import_chunk(conn, records, user_ids: Dict[str, int], target_user_id: Optional[int]) -> int:
+    """
+    Writes one chunk of parsed lines with executemany, skipping analyses the
+    user already has. Returns the number of analyses imported.
+    """
+    for record in records:
+        if record.get("type") == "header" and record.get("format_version", 0) > FORMAT_VERSION:
+            raise ValueError(f"Export format {record['format_version']} is newer than this version supports.")
+        if record.get("type") == "user" and target_user_id is None:
+            conn.execute(IMPORT_USER_SQL, (record["username"], record["password_hash"]))
+
+    analyses = [record for record in records if record.get("type") == "analysis"]
+    if not analyses:
+        return 0
+
+    resume_id = conn.execute(NEXT_RESUME_ID_SQL).fetchone()[0]
+    job_descriptions, resumes, search_rows, weekly, by_role = [], [], [], [], []
+    seen = set()  # (user, created_at, blob, jd) already queued in this chunk
+    for record in analyses:
+        user_id = target_user_id
+        if user_id is None:
+            username = record["username"]
+            if username not in user_ids:
+                row = conn.execute(SELECT_USER_ID_SQL, (username,)).fetchone()
+                if row is None:
+                    raise ValueError(f"Analysis belongs to unknown user '{username}'.")
+                user_ids[username] = row[0]
+            user_id = user_ids[username]
+
+        pending = prepare_resume(user_id, record["resume_data"], record.get("job_description"), record.get("ats_score"))
+        identity = (user_id, record["created_at"], pending.resume_blob, pending.jd_hash)
+        if identity in seen or conn.execute(EXISTING_RESUME_SQL, identity).fetchone():
+            continue
+        seen.add(identity)
+        if pending.jd_hash:
+            job_descriptions.append((pending.jd_hash, pending.job_description))
+        resumes.append((resume_id, user_id, pending.resume_blob, pending.jd_hash, pending.ats_score, record["created_at"]))
+        search_rows.append((resume_id, *pending.search_document))
+        if pending.ats_score is not None:
+            weekly.append((resume_id,))
+            if pending.role:
+                by_role.append((pending.role, resume_id))
+        resume_id += 1
+
+    conn.executemany(INSERT_JOB_DESCRIPTION_SQL, job_descriptions)
+    conn.executemany(IMPORT_RESUME_SQL, resumes)
+    conn.executemany(INSERT_SEARCH_SQL, search_rows)
+    conn.executemany(UPSERT_SCORE_WEEKLY_SQL, weekly)
+    conn.executemany(UPSERT_SCORE_BY_ROLE_SQL, by_role)
+    return len(resumes)
+
+def import_history(
+    fileobj: BinaryIO,
+    target_user_id: Optional[int] = None,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    start_line: int = 0,
+    on_checkpoint: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Imports a gzipped JSONL export produced by export_history().
+
+    Analyses are added to the accounts named in the file (a full export
+    creates missing accounts), or all to target_user_id if given. The file is
+    read and committed chunk_size lines at a time, so memory use stays flat;
+    after each commit on_checkpoint receives the number of lines saved so far.
+    If a chunk fails, HistoryImportError reports that checkpoint, and passing
+    it back as start_line continues where the import stopped.
+
+    Importing is idempotent: an analysis the account already has (same
+    created_at, job description and resume content) is skipped, so
+    re-importing a file, or an overlapping one, adds only what is new. An
+    existing account with the same username is merged into, never replaced.
+    Returns the number of analyses imported.
+    """
+    init_db()
+    imported, committed_lines = 0, start_line
+    user_ids: Dict[str, int] = {}
+    with gzip.GzipFile(fileobj=fileobj, mode='rb') as gz:
+        lines = islice(io.TextIOWrapper(gz, encoding='utf-8'), start_line, None)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            try:
+                records = [json.loads(line) for line in chunk if line.strip()]
+                with transaction() as conn:
+                    conn.execute("BEGIN IMMEDIATE")  # Take the write lock before allocating ids
+                    imported += _import_chunk(conn, records, user_ids, target_user_id)
+            except Exception as e:
+                raise HistoryImportError(str(e), committed_lines) from e
+            committed_lines += len(chunk)
+            if on_checkpoint:
+                on_checkpoint(committed_lines)
+    return imported
@@ -0,0 +1,132 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from .connection import transaction
+from .db_manager import PendingResume, prepare_resume, write_resume
+
+logger = logging.getLogger(__name__)
+
+# --- CONSTANTS ---
+# How long the writer keeps collecting saves after the first one arrives before
+# committing them together. Bounds the extra latency a save sees.
+FLUSH_INTERVAL_S = float(os.environ.get("HIREDLY_WRITE_FLUSH_INTERVAL_S", "0.05"))
+MAX_BATCH_SIZE = 256
+SHUTDOWN_TIMEOUT_S = 10
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """
+    Batches analysis saves from every session onto a single writer thread.
+
+    Callers get a Future immediately; the writer commits everything that
+    arrived within one flush interval in a single transaction, so concurrent
+    saves never contend for the SQLite write lock. Pending saves are flushed
+    when the queue is closed, which happens automatically at interpreter exit.
+    """
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL_S, max_batch_size: int = MAX_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="hiredly-db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, pending: PendingResume) -> Future:
+        """Queues a prepared analysis. The Future resolves to its resume id once committed."""
+        future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("The write queue has been closed.")
+            self._queue.put((pending, future))
+        return future
+
+    def close(self) -> None:
+        """Stops accepting saves and waits for everything already queued to be written."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)  # Under the lock, so no save can be queued behind it
+        self._thread.join(SHUTDOWN_TIMEOUT_S)
+
+    # --- WRITER THREAD ---
+    def _collect_batch(self) -> Tuple[List[Tuple[PendingResume, Future]], bool]:
+        """Blocks for the first save, then gathers more until the interval elapses or the batch is full."""
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush(self, batch: List[Tuple[PendingResume, Future]]) -> None:
+        live = [(pending, future) for pending, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        try:
+            with transaction() as conn:
+                resume_ids = [write_resume(conn, pending) for pending, _ in live]
+        except Exception:
+            # Retry one by one so a single bad save does not fail the rest of the batch
+            logger.exception("Batched save failed; retrying %d saves individually", len(live))
+            for pending, future in live:
+                try:
+                    with transaction() as conn:
+                        future.set_result(write_resume(conn, pending))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (_, future), resume_id in zip(live, resume_ids):
+            future.set_result(resume_id)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect_batch()
+            if batch:
+                self._flush(batch)
+
+
+_write_queue: Optional[WriteBehindQueue] = None
+_write_queue_lock = threading.Lock()
+
+def get_write_queue() -> WriteBehindQueue:
+    """Returns the process-wide write queue, starting its writer thread on first use."""
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                _write_queue = WriteBehindQueue()
+                atexit.register(_write_queue.close)
+    return _write_queue
+
+def save_resume_async(user_id: int, resume_data: Dict[str, Any], job_description: str, ats_score: float) -> Future:
+    """
+    Queues a resume analysis for saving and returns immediately.
+
+    The analysis is encoded on the calling thread, so later changes to
+    resume_data are not saved. Call .result() on the returned Future to wait
+    for the commit (it resolves to the new resume id).
+    """
+    return get_write_queue().submit(prepare_resume(user_id, resume_data, job_description, ats_score))
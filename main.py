@@ -1,7 +1,15 @@
 import streamlit as st
 import datetime
-from database import init_db, authenticate_user, add_user, get_user_resumes
+import os
+from database import (init_db, authenticate_user, add_user, list_user_resumes, search_user_resumes, search_is_truncated,
+                      get_score_trends, get_resume_details, HashingBusyError, SEARCH_CANDIDATE_LIMIT)
+from components.visualizations import display_score_trends
 from utils.session_state import initialize_session_state
+from utils.session_memory import (enforce_session_budget, get_artifact_cache, get_session_registry,
+                                  SESSION_MEMORY_BUDGET_BYTES)
+
+# Usernames allowed to see operational pages, e.g. HIREDLY_ADMIN_USERS="alice,bob"
+ADMIN_USERS = {name.strip() for name in os.environ.get("HIREDLY_ADMIN_USERS", "").split(",") if name.strip()}
 
 # --- 1. PAGE CONFIGURATION ---
 # This must be the first Streamlit command in your script.
@@ -13,7 +21,8 @@ st.set_page_config(
 )
 
 # --- 2. DATABASE INITIALIZATION ---
-# Ensures the database and tables are created when the app starts.
+# Runs any pending schema migrations. This only touches the database on the
+# first run in each server process; later reruns return immediately.
 init_db()
 
 # --- 3. AUTHENTICATION UI ---
@@ -28,7 +37,11 @@ def show_login_page():
         submitted = st.form_submit_button("Login")
         
         if submitted:
-            user_id = authenticate_user(username, password)
+            try:
+                user_id = authenticate_user(username, password)
+            except HashingBusyError as e:
+                st.error(str(e))
+                return
             if user_id:
                 st.session_state['logged_in'] = True
                 st.session_state['username'] = username
@@ -52,7 +65,12 @@ def show_signup_page():
             if not all([new_username, new_password, confirm_password]):
                 st.error("Please fill out all fields.")
             elif new_password == confirm_password:
-                if add_user(new_username, new_password):
+                try:
+                    created = add_user(new_username, new_password)
+                except HashingBusyError as e:
+                    st.error(str(e))
+                    return
+                if created:
                     st.success("Account created successfully! Please log in.")
                 else:
                     st.error("Username already exists. Please choose another.")
@@ -60,35 +78,147 @@ def show_signup_page():
                 st.error("Passwords do not match.")
 
 # --- 4. POST-LOGIN UI ---
+def reset_history_pages():
+    """Forgets the loaded history pages so the next visit starts from the newest analysis."""
+    st.session_state.history_items = []
+    st.session_state.history_cursor = None
+    st.session_state.history_loaded = False
+    st.session_state.history_details = {}
+
+def load_next_history_page():
+    """Fetches the next page of saved analyses and appends it to the session."""
+    page, cursor = list_user_resumes(st.session_state['user_id'], cursor=st.session_state.history_cursor)
+    st.session_state.history_items.extend(page)
+    st.session_state.history_cursor = cursor
+    st.session_state.history_loaded = True
+
+def get_history_details(resume_id):
+    """Returns the decoded resume and job description for one analysis, cached in the session."""
+    details = st.session_state.history_details
+    if resume_id not in details:
+        details[resume_id] = get_resume_details(st.session_state['user_id'], resume_id)
+    return details[resume_id]
+
+def reset_search_results():
+    """Forgets the loaded search results, e.g. when the query changes."""
+    st.session_state.search_items = []
+    st.session_state.search_offset = 0
+    st.session_state.search_loaded_query = None
+    st.session_state.search_truncated = False
+
+def load_next_search_page(query):
+    """Fetches the next page of ranked search results and appends it to the session."""
+    if st.session_state.search_offset == 0:
+        st.session_state.search_truncated = search_is_truncated(st.session_state['user_id'], query)
+    page, offset = search_user_resumes(st.session_state['user_id'], query, offset=st.session_state.search_offset)
+    st.session_state.search_items.extend(page)
+    st.session_state.search_offset = offset
+    st.session_state.search_loaded_query = query
+
+def show_history_item(res):
+    """Displays one saved analysis as an expander that loads its details when opened."""
+    date = datetime.datetime.strptime(res['created_at'], '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y')
+    expander_title = f"Analysis from {date} - ATS Score: {res['ats_score']:.1f}%"
+
+    # Heavy columns are only fetched once the expander has been opened
+    expander_key = f"history_expander_{res['id']}"
+    with st.expander(expander_title, key=expander_key, on_change="rerun"):
+        if st.session_state.get(expander_key):
+            details = get_history_details(res['id'])
+            if details is None:
+                st.warning("This analysis is no longer available.")
+            else:
+                st.subheader("Resume Data Snapshot")
+                st.json(details['resume_data'])
+                st.subheader("Target Job Description")
+                st.code(details['job_description'], language='text')
+
 def show_history_page():
-    """Displays the user's saved resume analyses."""
+    """Displays the user's saved resume analyses, one page at a time, or the results of a search."""
     st.header(f"📜 {st.session_state.username}'s History")
     st.markdown("Here are your previously saved resume analyses, with the most recent first.")
-    
-    resumes = get_user_resumes(st.session_state['user_id'])
+
+    if 'history_items' not in st.session_state:
+        reset_history_pages()
+        reset_search_results()
+    if st.button("🔄 Refresh"):
+        reset_history_pages()
+        reset_search_results()
+
+    # Read from the per-week and per-role aggregates, so this stays cheap however long the history is
+    with st.expander("📈 Your Progress", expanded=True):
+        display_score_trends(get_score_trends(st.session_state['user_id']))
+
+    query = st.text_input("🔎 Search your analyses", placeholder="e.g. data engineer Acme",
+                          key="history_query").strip()
+    if query:
+        if st.session_state.search_loaded_query != query:
+            reset_search_results()
+            load_next_search_page(query)
+        if not st.session_state.search_items:
+            st.info(f"No saved analyses match \"{query}\".")
+        elif st.session_state.get('search_truncated'):
+            st.caption(f"Only your {SEARCH_CANDIDATE_LIMIT:,} most recent matching analyses are ranked; "
+                       "add more words to find older ones.")
+        for res in st.session_state.search_items:
+            show_history_item(res)
+        if st.session_state.search_offset is not None:
+            st.button("⬇️ More results", on_click=load_next_search_page, args=(query,))
+        return
+
+    if not st.session_state.history_loaded:
+        load_next_history_page()
+
+    resumes = st.session_state.history_items
     if not resumes:
         st.info("You have no saved analyses yet. Perform an analysis on the Dashboard to save it here.")
     else:
         for res in resumes:
-            date = datetime.datetime.strptime(res['created_at'], '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y')
-            expander_title = f"Analysis from {date} - ATS Score: {res['ats_score']:.1f}%"
-            
-            with st.expander(expander_title):
-                st.subheader("Resume Data Snapshot")
-                st.json(res['resume_data'])
-                st.subheader("Target Job Description")
-                st.code(res['job_description'], language='text')
+            show_history_item(res)
+
+        if st.session_state.history_cursor is not None:
+            st.button("⬇️ Load older analyses", on_click=load_next_history_page)
+
+def show_session_memory_page():
+    """Admin readout of the bytes each live session holds, and of the shared artifact cache."""
+    st.header("🧠 Session Memory")
+    sessions = get_session_registry().snapshot()
+    total = sum(entry['bytes'] for entry in sessions)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Live sessions", len(sessions))
+    col2.metric("Total held", f"{total / 1024:,.0f} KB")
+    col3.metric("Budget per session", f"{SESSION_MEMORY_BUDGET_BYTES / 1024:,.0f} KB")
+
+    st.dataframe([
+        {
+            "User": entry['username'],
+            "Session": entry['session'],
+            "KB held": round(entry['bytes'] / 1024, 1),
+            "Evicted artifacts": entry['evicted_artifacts'],
+            "Last seen": datetime.datetime.fromtimestamp(entry['last_seen']).strftime('%H:%M:%S'),
+        }
+        for entry in sessions
+    ], use_container_width=True, hide_index=True)
+
+    stats = get_artifact_cache().stats()
+    st.caption(f"Shared artifact cache: {stats['entries']} entries, {stats['bytes'] / 1024:,.0f} KB, "
+               f"{stats['hits']} hits, {stats['misses']} misses")
 
 def main_app():
     """The main application view after a user has logged in."""
     # Initialize the session state for the optimizer tools
     initialize_session_state()
+    enforce_session_budget()
 
     # --- Sidebar Navigation for Account ---
     st.sidebar.title(f"Welcome, {st.session_state.username}!")
     
     st.sidebar.markdown("---")
-    page_selection = st.sidebar.radio("My Account", ["Hiredly Tools", "My History", "Logout"])
+    pages = ["Hiredly Tools", "My History", "Logout"]
+    if st.session_state.username in ADMIN_USERS:
+        pages.insert(2, "Session Memory")
+    page_selection = st.sidebar.radio("My Account", pages)
     st.sidebar.markdown("---")
 
     # --- Page Content ---
@@ -102,6 +232,9 @@ def main_app():
 
     elif page_selection == "My History":
         show_history_page()
+
+    elif page_selection == "Session Memory":
+        show_session_memory_page()
         
     elif page_selection == "Logout":
         # Clear the entire session state to log out
@@ -1,12 +1,15 @@
 # pages/2_📊_ATS_Analysis.py
 
 import streamlit as st
-from components.visualizations import display_ats_gauge, display_keyword_wordcloud
+from components.visualizations import display_ats_gauge, display_keyword_wordcloud, prefetch_keyword_wordcloud
 from components.sidebar import create_sidebar
 from components.ui_utils import apply_hiredly_styles
+from utils.session_state import get_record
 
 def display_analysis_results(results):
     """A helper function to display the formatted ATS analysis results."""
+    # The word cloud renders on a worker thread while the rest of the report is drawn
+    prefetch_keyword_wordcloud(results.get('missing_critical_keywords', []))
     st.subheader("📈 AI Analysis Breakdown")
 
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -57,8 +60,8 @@ def page_ats_analysis():
     st.markdown("---")
     
     # Check if the analysis results exist in the session state
-    if 'ats_analysis_results' in st.session_state and isinstance(st.session_state.ats_analysis_results, dict):
-        results = st.session_state.ats_analysis_results
+    results = get_record('ats_analysis_results')
+    if results:
         display_analysis_results(results)
     else:
         # Guide the user back to the dashboard if no results are found
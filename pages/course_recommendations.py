@@ -1,48 +1,10 @@
 # pages/3_🎓_Course_Recommendations.py
 
 import streamlit as st
-import plotly.graph_objects as go
 from components.sidebar import create_sidebar
 from components.ui_utils import apply_hiredly_styles
-
-def display_skills_gap_chart(user_skills, missing_skills):
-    """
-    Creates a dynamic radar chart visualizing the actual skills gap.
-    """
-    user_skills_lower = {s.lower() for s in user_skills}
-    missing_skills_lower = {s.lower() for s in missing_skills}
-    
-    # The axes of our chart are the union of skills you have and skills you're missing.
-    labels = sorted(list(user_skills_lower.union(missing_skills_lower)))
-    
-    # A required skill is one you have OR one that's missing.
-    required_skills_lower = user_skills_lower.union(missing_skills_lower)
-
-    # Assign scores: 1 if present, 0.2 if missing (to create a visible shape).
-    user_scores = [1 if skill in user_skills_lower else 0.2 for skill in labels]
-    required_scores = [1 if skill in required_skills_lower else 0.2 for skill in labels]
-
-    fig = go.Figure()
-
-    # Your Skills (Blue Area)
-    fig.add_trace(go.Scatterpolar(
-        r=user_scores, theta=labels, fill='toself', name='Your Skills',
-        line=dict(color='#1E90FF')
-    ))
-    # Required Skills (Red Line Outline)
-    fig.add_trace(go.Scatterpolar(
-        r=required_scores, theta=labels, fill='none', name='Required Skills',
-        line=dict(color='rgba(255, 100, 100, 0.8)')
-    ))
-
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=False, range=[0, 1.1])),
-        showlegend=True,
-        title="Your Personalized Skills Gap",
-        font=dict(color="#262730")
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
+from components.visualizations import display_skills_gap_chart
+from utils.session_state import get_record
 
 def page_course_recommendations():
     """Defines the UI for the Course Recommendations results page."""
@@ -59,10 +21,10 @@ def page_course_recommendations():
     st.markdown("---")
 
     # --- Display Pre-Computed Results ---
-    if 'course_recommendations' in st.session_state and st.session_state.get('course_recommendations'):
-        courses = st.session_state.course_recommendations
-        ats_results = st.session_state.get('ats_analysis_results', {})
-        resume_data = st.session_state.get('resume_data', {})
+    courses = get_record('course_recommendations')
+    if courses:
+        ats_results = get_record('ats_analysis_results', {})
+        resume_data = get_record('resume_data', {})
         missing_keywords = ats_results.get('missing_critical_keywords', [])
         
         col1, col2 = st.columns([3, 2])
@@ -1,9 +1,10 @@
 # pages/5_📥_Download_Resume.py
 
 import streamlit as st
-from services.ai_services import GeminiAIHelper
+from services.ai_services import get_ai_helper
 from components.ui_utils import display_resume_preview, create_download_buttons, apply_hiredly_styles
 from components.sidebar import create_sidebar
+from utils.session_state import get_record, set_record
 
 def page_download_resume():
     """Defines the UI and logic for the final download page."""
@@ -19,13 +20,12 @@ def page_download_resume():
 
     create_sidebar()
 
-    if not st.session_state.get('resume_data'):
+    resume_data = get_record('resume_data')
+    if not resume_data:
         st.info("Your downloadable resume will appear here.")
         st.warning("👈 Please provide your resume and a job description on the **Dashboard** and click 'Analyze & Prepare' first.")
         return
 
-    resume_data = st.session_state.resume_data
-
     # --- Step 1: Template Selection ---
     st.subheader("🎨 Step 1: Choose Your Template")
     template_cols = st.columns(3)
@@ -54,11 +54,15 @@ def page_download_resume():
     with col1:
         st.subheader("Live Preview of Your Optimized Resume")
         with st.container(border=True):
-            display_resume_preview(resume_data)
+            display_resume_preview(resume_data, selected_template)
 
     with col2:
         # This helper function now creates all the download buttons
-        create_download_buttons(resume_data, selected_template)
+        create_download_buttons(
+            resume_data, selected_template,
+            cover_letter=get_record('cover_letter', ''),
+            linkedin_summary=get_record('linkedin_summary', '')
+        )
         
     # --- Additional AI-Generated Content ---
     st.markdown("---")
@@ -69,25 +73,27 @@ def page_download_resume():
         if st.button("📝 Generate AI Cover Letter", use_container_width=True):
             if st.session_state.get('job_description'):
                 with st.spinner("AI is writing your cover letter..."):
-                    ai_helper = GeminiAIHelper(st.session_state.gemini_model)
-                    st.session_state.cover_letter = ai_helper.generate_cover_letter(resume_data, st.session_state.job_description)
+                    ai_helper = get_ai_helper()
+                    set_record('cover_letter', ai_helper.generate_cover_letter(resume_data, st.session_state.job_description))
             else:
                 st.warning("A job description is required to generate a targeted cover letter.")
     
     with doc_col2:
         if st.button("💼 Generate LinkedIn Summary", use_container_width=True):
             with st.spinner("AI is crafting your LinkedIn summary..."):
-                ai_helper = GeminiAIHelper(st.session_state.gemini_model)
-                st.session_state.linkedin_summary = ai_helper.generate_linkedin_summary(resume_data)
+                ai_helper = get_ai_helper()
+                set_record('linkedin_summary', ai_helper.generate_linkedin_summary(resume_data))
 
     # Display generated content if it exists
-    if st.session_state.get('cover_letter'):
-        st.text_area("Your AI-Generated Cover Letter:", st.session_state.cover_letter, height=250)
-        st.download_button("📄 Download Cover Letter", st.session_state.cover_letter, "cover_letter.txt")
-
-    if st.session_state.get('linkedin_summary'):
-        st.text_area("Your AI-Generated LinkedIn Summary:", st.session_state.linkedin_summary, height=200)
-        st.download_button("💼 Download LinkedIn Summary", st.session_state.linkedin_summary, "linkedin_summary.txt")
+    cover_letter = get_record('cover_letter')
+    if cover_letter:
+        st.text_area("Your AI-Generated Cover Letter:", cover_letter, height=250)
+        st.download_button("📄 Download Cover Letter", cover_letter, "cover_letter.txt")
+
+    linkedin_summary = get_record('linkedin_summary')
+    if linkedin_summary:
+        st.text_area("Your AI-Generated LinkedIn Summary:", linkedin_summary, height=200)
+        st.download_button("💼 Download LinkedIn Summary", linkedin_summary, "linkedin_summary.txt")
 
 # --- Run the page ---
 if __name__ == "__main__":
@@ -2,53 +2,102 @@
 
 import streamlit as st
 import random
-import re
-import speech_recognition as sr
-from services.ai_services import GeminiAIHelper
-from components.ui_utils import display_star_method_guide, apply_hiredly_styles
+from services.ai_services import get_ai_helper
+from services.answer_analyzer import STAR_STEPS, analyze_answer, feedback_score, split_feedback
+from components.ui_utils import display_star_method_guide, apply_hiredly_styles, voice_text_area
 from components.sidebar import create_sidebar
-
-def display_structured_feedback(feedback):
-    """Parses and displays the AI's feedback in a structured format."""
-    st.subheader("📝 AI Feedback")
-    score_match = re.search(r"Overall Score:.*?(\d+)/10", feedback, re.IGNORECASE)
-    score = int(score_match.group(1)) if score_match else 0
-    
-    try:
-        well_section = feedback.split("✅ What Went Well:")[1].split("🔧 Areas for Improvement:")[0]
-        improve_section = feedback.split("🔧 Areas for Improvement:")[1].split("⭐ A Stronger Example Answer:")[0]
-        example_section = feedback.split("⭐ A Stronger Example Answer:")[1]
-    except IndexError:
+from utils.session_state import get_record, set_record
+
+def display_answer_analysis(analysis, provisional=True):
+    """Displays the instant, local structure check of an answer (see services/answer_analyzer.py)."""
+    if provisional:
+        st.metric("Provisional Score", f"{analysis.score}/10",
+                  help="From the answer's structure alone. Your AI coach's score replaces it when it arrives.")
+    step_cols = st.columns(len(STAR_STEPS))
+    for col, step in zip(step_cols, STAR_STEPS):
+        with col:
+            st.markdown(f"{'✅' if step.name in analysis.steps_found else '⬜'} {step.icon} **{step.name}**")
+    st.caption(f"{analysis.word_count} words · {len(analysis.quantified)} figures quoted · "
+               f"{analysis.filler_count} filler words")
+    for hint in analysis.hints:
+        st.markdown(f"- {hint}")
+
+def display_structured_feedback(feedback, heading="📝 AI Feedback", analysis=None):
+    """
+    Parses and displays the AI's feedback in a structured format, followed by
+    the local structure check of the answer if one is given.
+    """
+    if heading:
+        st.subheader(heading)
+    sections = split_feedback(feedback)
+    if sections is None:
         st.markdown(feedback)
+    else:
+        well_section, improve_section, example_section = sections
+        st.metric("Feedback Score", f"{feedback_score(feedback) or 0}/10")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**✅ What Went Well**")
+            st.success(well_section)
+        with col2:
+            st.markdown("**🔧 Areas for Improvement**")
+            st.warning(improve_section)
+        with st.expander("⭐ See a Stronger Example Answer"):
+            st.info(example_section)
+
+    if analysis is not None:
+        # Without usable AI feedback, the structure check is all there is, so show it open
+        with st.expander(f"📐 Structure Check ({analysis.score}/10)", expanded=sections is None):
+            display_answer_analysis(analysis, provisional=False)
+
+def next_mock_question(questions):
+    """Picks a question at random, preferring ones not yet answered in the practice round."""
+    answered = st.session_state.get('practice_answers', {})
+    unanswered = [q for q in questions if isinstance(q, dict) and q.get('question') not in answered]
+    return random.choice(unanswered or questions)
+
+def display_practice_round(job_description):
+    """The saved answers of the current practice round, evaluated together in one request."""
+    answers = st.session_state.get('practice_answers', {})
+    st.markdown("---")
+    st.markdown(f"#### 🏁 Practice Round ({len(answers)} answered)")
+    if not answers:
+        st.caption("Answer a question and click 'Save Answer & Next'. When you're done, get feedback on all of them at once.")
         return
 
-    st.metric("Feedback Score", f"{score}/10")
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("**✅ What Went Well**")
-        st.success(well_section)
+        evaluate = st.button("🤖 Evaluate Practice Round", type="primary")
     with col2:
-        st.markdown("**🔧 Areas for Improvement**")
-        st.warning(improve_section)
-    with st.expander("⭐ See a Stronger Example Answer"):
-        st.info(example_section)
-
-def transcribe_audio_from_mic():
-    """Listens for audio from the microphone and transcribes it."""
-    recognizer = sr.Recognizer()
-    try:
-        with sr.Microphone() as source:
-            st.info("Adjusting for ambient noise...")
-            recognizer.adjust_for_ambient_noise(source, duration=1)
-            st.info("Listening... Speak now!")
-            audio = recognizer.listen(source, timeout=10, phrase_time_limit=60)
-            st.info("Transcribing your answer...")
-            text = recognizer.recognize_google(audio)
-            st.toast("Transcription successful!", icon="✅")
-            return text
-    except Exception as e:
-        st.error(f"Could not transcribe. Ensure PyAudio is installed and your mic has permission. Error: {e}")
-    return ""
+        if st.button("🗑️ Start a New Round"):
+            st.session_state.practice_answers = {}
+            set_record('practice_feedback', ())
+            st.rerun()
+
+    results = () if evaluate else get_record('practice_feedback', ())
+    if not results:
+        # Instant structure scores, shown until (and while) the AI feedback is fetched
+        for question, answer in answers.items():
+            st.markdown(f"- {question} — instant check: **{analyze_answer(answer).score}/10**")
+    if evaluate:
+        with st.spinner(f"🤖 Evaluating {len(answers)} answers..."):
+            items = list(answers.items())
+            feedback = get_ai_helper().evaluate_practice_round(items, job_description)
+            set_record('practice_feedback', tuple((q, a, f) for (q, a), f in zip(items, feedback)))
+        st.rerun()
+    if not results:
+        return
+
+    scores = [feedback_score(feedback) for _, _, feedback in results]
+    scored = [score for score in scores if score is not None]
+    if scored:
+        st.metric("Average Score", f"{sum(scored) / len(scored):.1f}/10")
+    for (question, answer, feedback), score in zip(results, scores):
+        with st.container(border=True):
+            st.markdown(f"**{question}** — {score if score is not None else '–'}/10")
+            with st.expander("Your answer"):
+                st.write(answer)
+            display_structured_feedback(feedback, heading=None, analysis=analyze_answer(answer))
 
 def page_interview_prep():
     """Defines the UI and logic for the enhanced Interview Preparation page."""
@@ -65,7 +114,7 @@ def page_interview_prep():
     st.markdown("---")
     
     # --- Display Pre-Computed Results ---
-    questions = st.session_state.get('interview_questions', [])
+    questions = get_record('interview_questions', [])
 
     if not questions:
         st.info("Your personalized interview questions will appear here.")
@@ -105,35 +154,62 @@ def page_interview_prep():
             
             input_method = st.radio("Choose your answer method:", ["📝 Text", "🎤 Voice"], horizontal=True)
             
-            if 'user_answer' not in st.session_state: st.session_state.user_answer = ""
-            
+            # Spoken answers are transcribed into the same answer box as they are recorded
             if input_method == "🎤 Voice":
-                if st.button("🎤 Start Recording"):
-                    transcribed_text = transcribe_audio_from_mic()
-                    if transcribed_text: st.session_state.user_answer = transcribed_text
-            
-            st.session_state.user_answer = st.text_area("Your Answer:", value=st.session_state.user_answer, height=150, key="mock_answer_text")
+                st.session_state.user_answer = voice_text_area("Your Answer:", key="mock_answer_text", height=150)
+            else:
+                st.session_state.user_answer = st.text_area("Your Answer:", height=150, key="mock_answer_text")
+
+            practice_round = st.toggle("🏁 Practice round: answer several questions, then get feedback on all of them at once")
 
+            evaluate = False
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("➡️ Get New Question"):
-                    st.session_state.current_mock_question = random.choice(filtered_questions)
-                    st.session_state.last_feedback = ""
+                    st.session_state.current_mock_question = next_mock_question(filtered_questions)
+                    set_record('last_feedback', "")
                     st.session_state.user_answer = ""
+                    st.session_state.pop('mock_answer_text', None)  # Empties the answer box
                     st.rerun()
             with col2:
-                if st.button("🤖 Get AI Feedback", type="primary"):
+                if practice_round:
+                    if st.button("💾 Save Answer & Next", type="primary"):
+                        if st.session_state.user_answer:
+                            st.session_state.setdefault('practice_answers', {})[q.get('question')] = st.session_state.user_answer
+                            st.session_state.current_mock_question = next_mock_question(filtered_questions)
+                            st.session_state.user_answer = ""
+                            st.session_state.pop('mock_answer_text', None)
+                            st.rerun()
+                        else:
+                            st.warning("Please provide an answer before saving it.")
+                elif st.button("🤖 Get AI Feedback", type="primary"):
                     if st.session_state.user_answer:
-                        with st.spinner("🤖 Evaluating your answer..."):
-                            ai_helper = GeminiAIHelper(st.session_state.gemini_model)
-                            feedback = ai_helper.evaluate_interview_answer(q.get('question'), st.session_state.user_answer, st.session_state.get('job_description', ''))
-                            st.session_state.last_feedback = feedback
+                        evaluate = True
                     else:
                         st.warning("Please provide an answer to get feedback.")
             
-            if st.session_state.get('last_feedback'):
-                st.markdown("---")
-                display_structured_feedback(st.session_state.last_feedback)
+            if practice_round:
+                display_practice_round(st.session_state.get('job_description', ''))
+            else:
+                analysis = analyze_answer(st.session_state.user_answer) if st.session_state.user_answer else None
+                if evaluate:
+                    # The local structure check shows at once; the AI feedback replaces it when it arrives
+                    st.markdown("---")
+                    provisional = st.empty()
+                    with provisional.container():
+                        st.subheader("📐 Instant Structure Check")
+                        display_answer_analysis(analysis)
+                    with st.spinner("🤖 Your AI coach is evaluating your answer..."):
+                        ai_helper = get_ai_helper()
+                        feedback = ai_helper.evaluate_interview_answer(q.get('question'), st.session_state.user_answer, st.session_state.get('job_description', ''))
+                        set_record('last_feedback', feedback)
+                    provisional.empty()
+
+                last_feedback = get_record('last_feedback')
+                if last_feedback:
+                    if not evaluate:
+                        st.markdown("---")
+                    display_structured_feedback(last_feedback, analysis=analysis)
         else:
             st.error("Could not load a mock interview question. Please try generating questions again.")
 
@@ -6,33 +6,23 @@ from services.file_processors import (
     extract_text_from_docx,
     process_video_resume
 )
-from services.ai_services import GeminiAIHelper
-from components.ui_utils import apply_hiredly_styles, display_resume_preview
-from agents import ResumeAgent
-import speech_recognition as sr
+from components.ui_utils import apply_hiredly_styles, display_resume_preview, voice_text_area
+from agents import start_dashboard_analysis, current_analysis_job, sync_analysis_results
+from services.job_runner import FAILED
+from utils.session_state import get_record, release_uploaded_file
+from utils.session_memory import enforce_session_budget
 
-def transcribe_audio_from_mic():
-    """Listens for audio from the microphone and transcribes it."""
-    recognizer = sr.Recognizer()
-    try:
-        with sr.Microphone() as source:
-            st.info("Adjusting for ambient noise...")
-            recognizer.adjust_for_ambient_noise(source, duration=1)
-            st.info("Listening... Speak now!")
-            audio = recognizer.listen(source, timeout=10, phrase_time_limit=60)
-            st.info("Transcribing your answer...")
-            text = recognizer.recognize_google(audio)
-            st.toast("Transcription successful!", icon="✅")
-            return text
-    except sr.WaitTimeoutError:
-        st.error("No speech detected. Please try again.")
-    except sr.UnknownValueError:
-        st.error("Could not understand the audio. Please speak clearly.")
-    except sr.RequestError as e:
-        st.error(f"API unavailable. Could not request results; {e}")
-    except Exception as e:
-        st.error(f"An error occurred with the microphone. Ensure PyAudio is installed and your mic has permission. Error: {e}")
-    return ""
+@st.fragment(run_every=1.0)
+def show_analysis_progress():
+    """Polls this session's background analysis and shows its progress until it finishes."""
+    job = current_analysis_job()
+    if job.finished:
+        st.rerun()  # Redraw the whole page with the results (or the error)
+
+    fraction, message = job.progress()
+    with st.status("🚀 Engaging AI Co-Pilot...", expanded=True):
+        st.progress(fraction, text=message)
+        st.caption("You can keep browsing; the analysis continues in the background.")
 
 def page_dashboard():
     """Defines the UI and logic for the Hiredly Dashboard."""
@@ -46,7 +36,7 @@ def page_dashboard():
         st.warning("Please log in from the main page to access the optimizer tools.")
         st.stop()
 
-    ai_helper = GeminiAIHelper(st.session_state.gemini_model)
+    enforce_session_budget()
     resume_text_to_process = ""
 
     # --- Main Layout: Two columns for inputs ---
@@ -60,16 +50,16 @@ def page_dashboard():
             resume_text_area = st.text_area("Paste your full resume text:", height=250)
         
         with input_tabs[1]: # Upload File
-            uploaded_file = st.file_uploader("PDF or DOCX", type=['pdf', 'docx'])
+            uploaded_file = st.file_uploader("PDF or DOCX", type=['pdf', 'docx'],
+                                             key=f"resume_upload_{st.session_state.get('resume_upload_generation', 0)}")
         
         with input_tabs[2]: # Record Voice
-            if st.button("🎤 Start Recording Your Summary"):
-                transcribed_text = transcribe_audio_from_mic()
-                st.session_state.voice_input = transcribed_text
-            resume_text_to_process = st.text_area("Transcribed Text:", value=st.session_state.get('voice_input', ''), key="voice_text")
+            resume_text_to_process = voice_text_area("Transcribed Text:", key="voice_text",
+                                                     record_label="🎤 Start Recording Your Summary")
             
         with input_tabs[3]: # Upload Video
-            video_file = st.file_uploader("MP4, MOV, AVI", type=['mp4', 'mov', 'avi'])
+            video_file = st.file_uploader("MP4, MOV, AVI", type=['mp4', 'mov', 'avi'],
+                                          key=f"video_upload_{st.session_state.get('video_upload_generation', 0)}")
 
     with col2:
         st.subheader("Step 2: Add Target Job Description")
@@ -88,11 +78,15 @@ def page_dashboard():
                     resume_text_to_process = extract_text_from_pdf(uploaded_file)
                 else:
                     resume_text_to_process = extract_text_from_docx(uploaded_file)
-        elif st.session_state.get('voice_input'):
-            resume_text_to_process = st.session_state.voice_input
+            if resume_text_to_process:
+                release_uploaded_file(uploaded_file, 'resume_upload_generation')
+        elif st.session_state.get('voice_text'):
+            resume_text_to_process = st.session_state.voice_text
         elif video_file:
             with st.spinner("Extracting audio from video..."):
                 resume_text_to_process = process_video_resume(video_file)
+            if resume_text_to_process:
+                release_uploaded_file(video_file, 'video_upload_generation')
         
         # --- Validation and Full Analysis ---
         if not resume_text_to_process:
@@ -100,40 +94,26 @@ def page_dashboard():
         elif not job_desc:
             st.error("Please paste the job description.")
         else:
-            # This is the core of the new, fast workflow
-            agent = ResumeAgent()
-            with st.status("🚀 Engaging AI Co-Pilot...", expanded=True) as status:
-                st.info(" Parsing and structuring your resume...")
-                initial_data = ai_helper.analyze_resume_content(resume_text_to_process)
-                st.session_state.resume_data = initial_data
-                
-                # Run the agent's full analysis to get everything at once
-                all_results = agent.run_full_analysis(initial_data, job_desc)
-                
-                # Update session state with all the pre-computed results
-                st.session_state.ats_analysis_results = all_results.get('ats')
-                st.session_state.ats_score = all_results.get('ats', {}).get('ats_score', 0)
-                st.session_state.interview_questions = all_results.get('questions')
-                st.session_state.course_recommendations = all_results.get('courses')
-                
-                # Auto-apply the optimizations from the analysis
-                optimization = all_results.get('optimization', {})
-                if isinstance(optimization, dict):
-                    st.info(" Applying automatic optimizations...")
-                    st.session_state.resume_data['summary'] = optimization.get('optimized_summary', initial_data.get('summary', ''))
-                    current_skills = set(st.session_state.resume_data.get('skills', []))
-                    current_skills.update(optimization.get('missing_keywords', []))
-                    st.session_state.resume_data['skills'] = sorted(list(current_skills))
-                
-                status.update(label="✅ Analysis Complete! You're ready to go.", state="complete")
-            
+            # The analysis runs on a background worker, so reruns and navigation don't interrupt it
+            start_dashboard_analysis(resume_text_to_process, job_desc)
+
+    job = current_analysis_job()
+    if job is not None and job.status == FAILED:
+        st.error(f"The analysis failed: {job.error}. Please try again.")
+    elif job is not None and not job.finished:
+        show_analysis_progress()  # Only polls while an analysis is in flight
+    else:
+        # The sidebar usually applies the results first in this run; the flag records it either way
+        sync_analysis_results()
+        if st.session_state.pop('analysis_completed', False):
             st.balloons()
 
     # --- Display Results Preview ---
-    if 'resume_data' in st.session_state and st.session_state.resume_data:
+    resume_data = get_record('resume_data')
+    if resume_data:
         st.markdown("---")
         st.header("Your AI-Powered Analysis is Ready")
-        display_resume_preview(st.session_state.resume_data)
+        display_resume_preview(resume_data)
 
 # --- Run the page ---
 if __name__ == "__main__":
@@ -1,29 +1,50 @@
 # services/__init__.py
+#
+# The public names below are resolved lazily (PEP 562): importing 'services',
+# or any one of its modules, no longer loads ReportLab, python-docx, PyPDF2,
+# pydub and the Gemini SDK together. Each submodule is imported the first time
+# one of its names is used.
 
-from .ai_services import GeminiAIHelper
-from .file_processors import (
-    extract_text_from_pdf,
-    extract_text_from_docx,
-    process_voice_input,
-    process_video_resume
-)
-from .resume_generator import (
-    create_enhanced_pdf_resume,
-    create_word_resume,
-    create_html_resume,
-    create_resume_package
-)
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "GeminiAIHelper": "ai_services",
+    "get_ai_helper": "ai_services",
+    "GeminiClient": "gemini_client",
+    "get_gemini_client": "gemini_client",
+    "extract_text_from_pdf": "file_processors",
+    "extract_text_from_docx": "file_processors",
+    "process_voice_input": "file_processors",
+    "process_video_resume": "file_processors",
+    "create_enhanced_pdf_resume": "resume_generator",
+    "create_word_resume": "resume_generator",
+    "create_html_resume": "resume_generator",
+    "create_html_preview": "resume_generator",
+    "create_resume_package": "resume_generator",
+    "stream_resume_package": "resume_generator",
+    "render_resume": "resume_generator",
+    "PackageMember": "package_writer",
+    "stream_package": "package_writer",
+    "write_package": "package_writer",
+    "iter_render_batch": "batch_renderer",
+    "render_batch_to_directory": "batch_renderer",
+    "render_batch_to_zip": "batch_renderer",
+    "render_all_templates": "batch_renderer",
+}
 
 # Explicitly define the public API of the 'services' package.
 # When another module uses 'from services import *', only these names will be imported.
-__all__ = [
-    "GeminiAIHelper",
-    "extract_text_from_pdf",
-    "extract_text_from_docx",
-    "process_voice_input",
-    "process_video_resume",
-    "create_enhanced_pdf_resume",
-    "create_word_resume",
-    "create_html_resume",
-    "create_resume_package"
-]
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
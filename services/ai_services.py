@@ -1,12 +1,64 @@
 import streamlit as st
+import hashlib
 import json
 import re
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from io import BytesIO
+import threading
+from collections import OrderedDict
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from services.gemini_client import get_gemini_client
+
+# --- CONSTANTS ---
+EVALUATION_CACHE_SIZE = 1024
+PRACTICE_ROUND_BATCH_SIZE = 8  # answers evaluated per request in a practice round
+FEEDBACK_FALLBACK = "Feedback could not be generated."
+
+# Batched evaluations are returned as JSON and rendered into the same Markdown
+# a single evaluation produces, so the page parses both the same way.
+FEEDBACK_TEMPLATE = """- **Overall Score:** {score}/10
+- **✅ What Went Well:**
+{went_well}
+- **🔧 Areas for Improvement:**
+{improvements}
+- **⭐ A Stronger Example Answer:**
+{example_answer}"""
+
+
+class AIServiceError(RuntimeError):
+    """
+    An AI call failed, or its response could not be parsed, where there is no
+    page to report it on, e.g. in a background job.
+    """
+
+
+def _on_script_thread():
+    """Whether st.error and st.warning reach a page; on other threads (e.g. job workers) they are dropped."""
+    return get_script_run_ctx(suppress_warning=True) is not None
+
+def _normalize(text):
+    return " ".join(str(text or "").casefold().split())
+
+def evaluation_key(question, answer, job_description):
+    """
+    The cache key of an answer evaluation. Case and whitespace are ignored, so
+    resubmitting the same answer (or a re-transcribed one) is a cache hit.
+    """
+    jd_hash = hashlib.sha256(_normalize(job_description).encode('utf-8')).hexdigest()
+    return hashlib.sha256(f"{_normalize(question)}\0{_normalize(answer)}\0{jd_hash}".encode('utf-8')).hexdigest()
+
+def format_feedback(evaluation):
+    """Renders one evaluation from a batched response as feedback Markdown. Returns None if unusable."""
+    try:
+        score = max(0, min(10, round(float(evaluation.get('score')))))
+    except (TypeError, ValueError):
+        return None
+    bullets = lambda items: "\n".join(f"  - {item}" for item in (items or []) if item) or "  - (none)"
+    return FEEDBACK_TEMPLATE.format(
+        score=score,
+        went_well=bullets(evaluation.get('what_went_well')),
+        improvements=bullets(evaluation.get('areas_for_improvement')),
+        example_answer=evaluation.get('stronger_example_answer') or "(none)",
+    )
+
 
 class GeminiAIHelper:
     """
@@ -14,17 +66,22 @@ class GeminiAIHelper:
     It abstracts the prompt engineering and API call logic away from the UI.
     """
     
-    def __init__(self, model):
-        """Initializes the helper with a configured Gemini model instance."""
-        self.model = model
+    def __init__(self, client=None, evaluation_cache_size=EVALUATION_CACHE_SIZE):
+        """Initializes the helper with a Gemini client (the shared process-wide one by default)."""
+        self.client = client or get_gemini_client()
+        self.evaluation_cache_size = evaluation_cache_size
+        self._evaluations = OrderedDict()  # evaluation key -> feedback Markdown
+        self._evaluations_lock = threading.Lock()
 
-    def _safe_generate_content(self, prompt):
-        """A wrapper for API calls to handle potential errors."""
+    def _safe_generate_content(self, prompt, cache=True):
+        """A wrapper for API calls to handle potential errors. cache=False asks for a fresh response."""
         try:
-            response = self.model.generate_content(prompt)
-            # Accessing parts can sometimes be safer
-            return response.text
+            # Retries and response caching happen in the shared client
+            return self.client.generate_text(prompt, cache=cache)
         except Exception as e:
+            if not _on_script_thread():
+                # Off the script thread st.error shows nothing; fail the caller (e.g. its job) instead
+                raise AIServiceError(f"An error occurred with the AI service: {e}") from e
             st.error(f"An error occurred with the AI service: {e}")
             return None
 
@@ -48,6 +105,8 @@ class GeminiAIHelper:
                 # Fallback for simple cases where the whole text might be the json
                 return json.loads(text)
         except (json.JSONDecodeError, IndexError) as e:
+            if not _on_script_thread():
+                raise AIServiceError(f"Could not parse AI response into JSON. Error: {e}") from e
             st.warning(f"Could not parse AI response into JSON. Error: {e}")
         
         return {} if start_char == '{' else []
@@ -158,8 +217,28 @@ class GeminiAIHelper:
         response_text = self._safe_generate_content(prompt)
         return self._extract_json(response_text, start_char='[', end_char=']')
 
+    # --- ANSWER EVALUATIONS ---
+    def _cached_evaluation(self, key):
+        with self._evaluations_lock:
+            feedback = self._evaluations.get(key)
+            if feedback is not None:
+                self._evaluations.move_to_end(key)
+            return feedback
+
+    def _store_evaluation(self, key, feedback):
+        with self._evaluations_lock:
+            self._evaluations[key] = feedback
+            self._evaluations.move_to_end(key)
+            while len(self._evaluations) > self.evaluation_cache_size:
+                self._evaluations.popitem(last=False)
+
     def evaluate_interview_answer(self, question, answer, job_description):
         """Evaluates a candidate's answer to an interview question."""
+        key = evaluation_key(question, answer, job_description)
+        cached = self._cached_evaluation(key)
+        if cached is not None:
+            return cached
+
         prompt = f"""
         Act as a professional career coach. Evaluate the interview answer in the context of the job description.
         Provide constructive, concise feedback. Your response MUST be ONLY in Markdown format using the exact headings specified below.
@@ -174,7 +253,76 @@ class GeminiAIHelper:
         - **🔧 Areas for Improvement:** (List 2 specific, actionable suggestions)
         - **⭐ A Stronger Example Answer:** (Rewrite the user's answer to be more impactful)
         """
-        return self._safe_generate_content(prompt) or "Feedback could not be generated."
+        feedback = self._safe_generate_content(prompt)
+        if not feedback:
+            return FEEDBACK_FALLBACK
+        self._store_evaluation(key, feedback)
+        return feedback
+
+    def evaluate_practice_round(self, answers, job_description):
+        """
+        Evaluates several (question, answer) pairs, returning feedback Markdown
+        for each in the same order. Answers evaluated before come from the
+        cache; the rest are sent PRACTICE_ROUND_BATCH_SIZE at a time in one
+        request that returns structured JSON. Any answer a batch leaves out
+        is evaluated on its own.
+        """
+        keys = [evaluation_key(question, answer, job_description) for question, answer in answers]
+        # First occurrence of each answer not yet evaluated; repeats share its feedback
+        pending = {}
+        for i, key in enumerate(keys):
+            if key not in pending and self._cached_evaluation(key) is None:
+                pending[key] = i
+        pending = list(pending.values())
+
+        for start in range(0, len(pending), PRACTICE_ROUND_BATCH_SIZE):
+            batch = pending[start:start + PRACTICE_ROUND_BATCH_SIZE]
+            for i, text in zip(batch, self._evaluate_answer_batch([answers[i] for i in batch], job_description)):
+                if text:
+                    self._store_evaluation(keys[i], text)
+
+        feedback = [self._cached_evaluation(key) for key in keys]
+        for i, text in enumerate(feedback):
+            if text is None:
+                feedback[i] = self.evaluate_interview_answer(*answers[i], job_description)
+        return feedback
+
+    def _evaluate_answer_batch(self, answers, job_description):
+        """One request for a batch of answers. Returns feedback Markdown (or None) per answer."""
+        numbered = "\n\n".join(
+            f'Answer {number}:\nInterview Question: "{question}"\nCandidate\'s Answer: "{answer}"'
+            for number, (question, answer) in enumerate(answers, start=1)
+        )
+        prompt = f"""
+        Act as a professional career coach. Evaluate each of the following interview answers independently,
+        in the context of the job description. Provide constructive, concise feedback.
+        Your response MUST be a single, valid JSON array and nothing else, with exactly one object per answer.
+
+        Job Description Context: {job_description}
+
+        {numbered}
+
+        Return a JSON array where each object has this structure:
+        {{
+            "answer_number": number,
+            "score": number from 0 to 10,
+            "what_went_well": ["2 specific strengths"],
+            "areas_for_improvement": ["2 specific, actionable suggestions"],
+            "stronger_example_answer": "The candidate's answer rewritten to be more impactful."
+        }}
+        """
+        evaluations = self._extract_json(self._safe_generate_content(prompt), start_char='[', end_char=']')
+        feedback = [None] * len(answers)
+        for evaluation in evaluations if isinstance(evaluations, list) else []:
+            if not isinstance(evaluation, dict):
+                continue
+            try:
+                index = int(evaluation.get('answer_number')) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(answers) and feedback[index] is None:
+                feedback[index] = format_feedback(evaluation)
+        return feedback
 
     def generate_cover_letter(self, resume_data, job_description):
         """Generates a compelling cover letter."""
@@ -186,7 +334,8 @@ class GeminiAIHelper:
         Resume Data: {json.dumps(resume_data)}
         Job Description: {job_description}
         """
-        return self._safe_generate_content(prompt) or "Cover letter could not be generated."
+        # A new draft every time the user asks, never the cached one
+        return self._safe_generate_content(prompt, cache=False) or "Cover letter could not be generated."
 
     def generate_linkedin_summary(self, resume_data):
         """Generates an engaging LinkedIn 'About' section summary."""
@@ -197,56 +346,14 @@ class GeminiAIHelper:
 
         Resume Data: {json.dumps(resume_data)}
         """
-        return self._safe_generate_content(prompt) or "LinkedIn summary could not be generated."
-    def create_enhanced_pdf_resume(resume_data, template_style="professional"):
-        """
-        Generates an enhanced PDF resume with multiple template options.
-        """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
-        styles = getSampleStyleSheet()
-        story = []
-
-        # --- Template-based Styling ---
-        if template_style == "modern":
-            primary_color = colors.HexColor('#1E90FF')
-        elif template_style == "creative":
-            primary_color = colors.HexColor('#8E44AD')
-        else:  # professional
-            primary_color = colors.HexColor('#000080')
-
-        # --- Custom Styles ---
-        name_style = ParagraphStyle('NameStyle', parent=styles['h1'], fontSize=24, textColor=primary_color, alignment=1, spaceAfter=6)
-        contact_style = ParagraphStyle('ContactStyle', parent=styles['Normal'], fontSize=10, alignment=1, spaceAfter=12)
-        section_style = ParagraphStyle('SectionStyle', parent=styles['h2'], fontSize=14, textColor=primary_color, fontName='Helvetica-Bold', spaceBefore=12, spaceAfter=6, borderBottomWidth=1, borderBottomColor=primary_color, paddingBottom=2)
-    
-        # FIX 1: Create a dedicated style for bullet points with indentation.
-        bullet_style = ParagraphStyle('BulletStyle', parent=styles['Normal'], leftIndent=20, spaceAfter=6)
-    
-        # --- Build Document Story ---
-        story.append(Paragraph(resume_data.get('name', 'Your Name'), name_style))
-        story.append(Paragraph(f"{resume_data.get('email', '')} | {resume_data.get('phone', '')}", contact_style))
-
-        sections = {
-            "summary": "Professional Summary", "skills": "Core Competencies", "experience": "Professional Experience",
-            "education": "Education", "projects": "Key Projects", "certifications": "Certifications"
-        }
-
-        for key, title in sections.items():
-            if resume_data.get(key):
-                story.append(Paragraph(title.upper(), section_style))
-                content = resume_data[key]
-                if isinstance(content, list):
-                    if key == 'skills':
-                        skill_rows = [content[i:i+3] for i in range(0, len(content), 3)]
-                        story.append(Table(skill_rows, colWidths=[2.2*inch, 2.2*inch, 2.2*inch], style=[('VALIGN', (0,0), (-1,-1), 'TOP')]))
-                    else:
-                        for item in content:
-                            # FIX 2: Use the new 'bullet_style' here.
-                            story.append(Paragraph(f"• {item}", bullet_style))
-                else:
-                    story.append(Paragraph(content, styles['Normal']))
-
-        doc.build(story)
-        buffer.seek(0)
-        return buffer
\ No newline at end of file
+        # A new draft every time the user asks, never the cached one
+        return self._safe_generate_content(prompt, cache=False) or "LinkedIn summary could not be generated."
+
+
+@st.cache_resource(show_spinner=False)
+def get_ai_helper():
+    """
+    Returns the shared GeminiAIHelper. The helper holds no per-session state,
+    so every session and page uses this one instance instead of building its own.
+    """
+    return GeminiAIHelper(get_gemini_client())
@@ -0,0 +1,160 @@
+import re
+from dataclasses import dataclass
+
+# --- CONSTANTS ---
+IDEAL_WORDS = (120, 300)       # roughly one to two minutes spoken
+ACCEPTABLE_WORDS = (50, 400)
+FILLER_DENSITY_OK = 0.02       # filler words per word
+FILLER_DENSITY_HIGH = 0.05
+
+# Points out of 10: each STAR step, a quantified result, length and fluency
+STEP_POINTS = 1.5
+QUANTIFIED_POINTS = 1.5
+LENGTH_POINTS = 1.5
+FILLER_POINTS = 1.0
+
+
+# --- STAR METHOD ---
+@dataclass(frozen=True)
+class StarStep:
+    """One step of the STAR method, with the phrases that tend to mark it in an answer."""
+    name: str
+    icon: str
+    guidance: str
+    hint: str
+    markers: tuple
+
+
+STAR_STEPS = (
+    StarStep(
+        "Situation", "🎯", "Set the scene and provide context (when, where).",
+        "Open with the situation: where you were and what was going on.",
+        (r"\b(when|while) (i|we) (was|were|worked|joined)\b", r"\b(at|in) my (last|previous|current|former|first) \w+",
+         r"\b(last|this past|earlier this) (year|quarter|month|summer)\b", r"\bthe (situation|context|background)\b",
+         r"\b(our|the) (team|company|client|startup|project) (was|had|were)\b", r"\bback in\b"),
+    ),
+    StarStep(
+        "Task", "📋", "Describe your responsibility or the challenge.",
+        "Say what you were responsible for, or what the challenge was.",
+        (r"\b(my|our|the) (goal|task|job|responsibility|objective|challenge|mandate)\b",
+         r"\bi was (asked|responsible|tasked|assigned|charged|expected)\b", r"\b(i|we) (needed|had) to\b",
+         r"\bwas (to|supposed to)\b", r"\bdeadline\b"),
+    ),
+    StarStep(
+        "Action", "⚡", "Explain the specific steps YOU took. Use 'I' statements.",
+        "Walk through the specific steps you took yourself, using 'I' statements.",
+        (r"\bi (first |then |also |personally )?(led|built|designed|created|implemented|developed|organi[sz]ed|"
+         r"analy[sz]ed|wrote|launched|introduced|set up|proposed|negotiated|coordinated|automated|migrated|"
+         r"refactored|decided|reached out|met|worked with|started|identified|prioriti[sz]ed|researched|"
+         r"presented|trained|mentored|convinced|rewrote|tested|fixed|scheduled)\b",),
+    ),
+    StarStep(
+        "Result", "🏆", "Share the outcome and quantify your success with numbers.",
+        "Finish with the result: what changed because of what you did.",
+        (r"\bas a result\b", r"\bresult(ed|ing)? in\b", r"\b(outcome|in the end|ultimately|eventually)\b",
+         r"\b(increased|decreased|reduced|improved|saved|grew|cut|boosted|raised|lowered|doubled|tripled|"
+         r"halved|delivered|achieved|won|shipped)\b", r"\bwhich (led|meant|allowed)\b"),
+    ),
+)
+
+_STEP_PATTERNS = tuple(re.compile("|".join(step.markers), re.IGNORECASE) for step in STAR_STEPS)
+_QUANTIFIED_PATTERN = re.compile(
+    r"[$€£]\s?\d[\d,.]*\s?[kmb]?\b|\b\d[\d,.]*\s?(%|percent|x\b|k\b|million|thousand|hours?|days?|weeks?|months?|"
+    r"years?|users?|customers?|clients?|people|engineers?|members?|tickets?|requests?|ms\b|seconds?)",
+    re.IGNORECASE,
+)
+_FILLER_PATTERN = re.compile(
+    r"\b(um+|uh+|er+m?|you know|i mean|sort of|kind of|basically|actually|literally|like,)(?=\W|$)", re.IGNORECASE
+)
+_WORD_PATTERN = re.compile(r"[\w'’-]+")
+_FIRST_PERSON = re.compile(r"\bi\b", re.IGNORECASE)
+_TEAM_PERSON = re.compile(r"\bwe\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class AnswerAnalysis:
+    """The local, provisional assessment of an interview answer."""
+    score: int
+    steps_found: tuple
+    quantified: tuple
+    word_count: int
+    filler_count: int
+    hints: tuple
+
+    @property
+    def filler_density(self):
+        return self.filler_count / self.word_count if self.word_count else 0.0
+
+
+def analyze_answer(answer):
+    """
+    Scores an answer out of 10 from its structure alone, without the AI:
+    which STAR steps it covers, whether it quantifies its result, its length
+    and how many filler words it uses. Returns the score with hints for
+    whatever is missing. Runs in well under a millisecond for a typical
+    answer, so it can be shown while the AI feedback is on its way.
+    """
+    text = " ".join(str(answer or "").split())
+    word_count = len(_WORD_PATTERN.findall(text))
+    steps_found = tuple(step.name for step, pattern in zip(STAR_STEPS, _STEP_PATTERNS) if pattern.search(text))
+    quantified = tuple(dict.fromkeys(match.group(0).strip() for match in _QUANTIFIED_PATTERN.finditer(text)))
+    filler_count = len(_FILLER_PATTERN.findall(text))
+    filler_density = filler_count / word_count if word_count else 0.0
+
+    hints = [step.hint for step in STAR_STEPS if step.name not in steps_found]
+    score = STEP_POINTS * len(steps_found)
+    if quantified:
+        score += QUANTIFIED_POINTS
+    else:
+        hints.append("Quantify the result: a percentage, an amount, or the time or money saved.")
+    if IDEAL_WORDS[0] <= word_count <= IDEAL_WORDS[1]:
+        score += LENGTH_POINTS
+    elif ACCEPTABLE_WORDS[0] <= word_count <= ACCEPTABLE_WORDS[1]:
+        score += LENGTH_POINTS / 2
+    if word_count < IDEAL_WORDS[0]:
+        hints.append(f"At {word_count} words the answer is short; aim for {IDEAL_WORDS[0]}-{IDEAL_WORDS[1]}.")
+    elif word_count > IDEAL_WORDS[1]:
+        hints.append(f"At {word_count} words the answer runs long; aim for {IDEAL_WORDS[0]}-{IDEAL_WORDS[1]}.")
+    if word_count and filler_density < FILLER_DENSITY_OK:
+        score += FILLER_POINTS
+    elif word_count and filler_density < FILLER_DENSITY_HIGH:
+        score += FILLER_POINTS / 2
+    if filler_density >= FILLER_DENSITY_OK:
+        hints.append(f"Cut the filler words ({filler_count} of them, e.g. 'um', 'basically', 'you know').")
+    if len(_TEAM_PERSON.findall(text)) > len(_FIRST_PERSON.findall(text)):
+        hints.append("Say more about your own part: use 'I' rather than 'we' for what you did.")
+
+    return AnswerAnalysis(
+        score=round(score) if word_count else 0,
+        steps_found=steps_found,
+        quantified=quantified,
+        word_count=word_count,
+        filler_count=filler_count,
+        hints=tuple(hints),
+    )
+
+
+# --- AI FEEDBACK ---
+_SCORE_PATTERN = re.compile(r"Overall Score:.*?(\d+)/10", re.IGNORECASE)
+FEEDBACK_HEADINGS = ("✅ What Went Well:", "🔧 Areas for Improvement:", "⭐ A Stronger Example Answer:")
+
+
+def feedback_score(feedback):
+    """The score out of 10 in a piece of AI feedback, or None if it has none."""
+    score_match = _SCORE_PATTERN.search(feedback or "")
+    return int(score_match.group(1)) if score_match else None
+
+def split_feedback(feedback):
+    """
+    Splits AI feedback into its (went well, improvements, example answer)
+    sections, or returns None if any heading is missing.
+    """
+    well, improve, example = FEEDBACK_HEADINGS
+    try:
+        return (
+            feedback.split(well)[1].split(improve)[0],
+            feedback.split(improve)[1].split(example)[0],
+            feedback.split(example)[1],
+        )
+    except (AttributeError, IndexError):
+        return None
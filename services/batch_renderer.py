@@ -0,0 +1,116 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .package_writer import PackageMember, write_package
+from .resume_generator import RENDER_FORMATS, TEMPLATE_NAMES, render_resume, warm_template_styles
+
+# Formats whose files are already compressed and are stored in archives as-is.
+STORED_EXTENSIONS = ('.pdf', '.docx')
+# Chunks submitted ahead of the consumer, per worker
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _init_worker():
+    """Runs once in every worker process so template style sheets are compiled up front."""
+    warm_template_styles()
+
+
+def _safe_name(value):
+    """Turns a candidate name into a filesystem- and archive-safe slug."""
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', str(value or 'user')).strip('_')
+    return slug or 'user'
+
+
+def _render_job(job):
+    """Renders one (index, resume_data, template, format) job inside a worker process."""
+    index, resume_data, template_style, output_format = job
+    file_name = f"{index:04d}_{_safe_name(resume_data.get('name'))}_{template_style}.{output_format}"
+    return index, file_name, render_resume(resume_data, template_style, output_format)
+
+
+def _render_chunk(chunk):
+    """Renders a list of jobs in one worker round trip."""
+    return [_render_job(job) for job in chunk]
+
+
+def _validate_jobs(jobs):
+    """Checks each (resume_data, template, format) job and tags it with its position."""
+    for index, (resume_data, template_style, output_format) in enumerate(jobs):
+        if template_style not in TEMPLATE_NAMES:
+            raise ValueError(f"Unknown resume template: {template_style!r}")
+        if output_format not in RENDER_FORMATS:
+            raise ValueError(f"Unsupported resume format: {output_format!r}")
+        yield index, resume_data, template_style, output_format
+
+
+def iter_render_batch(jobs, max_workers=None, chunksize=4):
+    """
+    Renders many (resume_data, template, format) jobs across a process pool.
+
+    Results are yielded as (index, file_name, data) tuples in job order as soon
+    as they are ready, so callers can stream them out without holding the whole
+    batch in memory. Jobs are read and submitted in chunks of `chunksize`, at
+    most CHUNKS_IN_FLIGHT_PER_WORKER chunks per worker ahead of the consumer,
+    so a slow writer holds back rendering instead of letting outputs pile up.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    window = max_workers * CHUNKS_IN_FLIGHT_PER_WORKER
+    jobs = _validate_jobs(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        in_flight = deque()
+        while True:
+            while len(in_flight) < window:
+                chunk = list(islice(jobs, chunksize))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_render_chunk, chunk))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+def render_batch_to_directory(jobs, output_dir, max_workers=None):
+    """Renders a batch of jobs and writes each output to its own file. Returns the written paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for _, file_name, data in iter_render_batch(jobs, max_workers=max_workers):
+        path = os.path.join(output_dir, file_name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        written.append(path)
+    return written
+
+
+def render_batch_to_zip(jobs, zip_target, max_workers=None):
+    """
+    Renders a batch of jobs straight into a streamed ZIP archive.
+
+    `zip_target` may be a path or a writable file object. Returns the number of
+    members written.
+    """
+    count = 0
+
+    def members():
+        nonlocal count
+        for _, file_name, data in iter_render_batch(jobs, max_workers=max_workers):
+            count += 1
+            yield PackageMember(file_name, lambda data=data: data, not file_name.endswith(STORED_EXTENSIONS))
+
+    if isinstance(zip_target, (str, os.PathLike)):
+        with open(zip_target, 'wb') as f:
+            write_package(members(), f)
+    else:
+        write_package(members(), zip_target)
+    return count
+
+
+def render_all_templates(resume_data, output_format="pdf", max_workers=None):
+    """Pre-generates one resume in every template, e.g. for side-by-side previews."""
+    jobs = [(resume_data, template_style, output_format) for template_style in TEMPLATE_NAMES]
+    return {
+        TEMPLATE_NAMES[index]: data
+        for index, _, data in iter_render_batch(jobs, max_workers=max_workers or len(jobs), chunksize=1)
+    }
@@ -0,0 +1,123 @@
+import re
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from docx import Document
+
+DOCUMENT_PART = 'word/document.xml'
+STYLES_PART = 'word/styles.xml'
+
+DOCX_SECTION_MAP = {
+    "Professional Summary": "summary", "Core Skills": "skills", "Professional Experience": "experience",
+    "Education": "education", "Key Projects": "projects", "Certifications": "certifications"
+}
+
+# XML 1.0 forbids most control characters; python-docx rejects them, so strip them here.
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_STYLE_BLOCK = '<w:style w:type="paragraph" w:styleId="{}">'
+
+
+@lru_cache(maxsize=1)
+def _load_base_template():
+    """
+    Loads the base Word template package into memory once per process.
+
+    Returns (members, document_head, document_tail) where `members` maps every
+    package part except the main document to its bytes, and the head/tail are the
+    main document XML around the body content (namespaces and section properties).
+    """
+    template_buffer = BytesIO()
+    Document().save(template_buffer)
+    with zipfile.ZipFile(template_buffer) as package:
+        members = {name: package.read(name) for name in package.namelist()}
+
+    document_xml = members.pop(DOCUMENT_PART).decode('utf-8')
+    body_start = document_xml.index('<w:body>') + len('<w:body>')
+    sect_start = document_xml.index('<w:sectPr')
+    return members, document_xml[:body_start], document_xml[sect_start:]
+
+
+def _brand_styles(styles_xml, color_hex):
+    """Recolours the Title and Heading 1 styles so Word output matches the PDF template colour."""
+    color = color_hex.lstrip('#').upper()
+    for style_id in ("Title", "Heading1"):
+        start = styles_xml.index(_STYLE_BLOCK.format(style_id))
+        end = styles_xml.index('</w:style>', start)
+        block = re.sub(r'<w:color [^>]*/>', f'<w:color w:val="{color}"/>', styles_xml[start:end])
+        styles_xml = styles_xml[:start] + block + styles_xml[end:]
+    return styles_xml
+
+
+@lru_cache(maxsize=None)
+def _template_package(color_hex):
+    """
+    Builds the compressed ZIP of every static part for one template colour.
+
+    Done once per template per process; each render only copies these bytes and
+    appends its own document part.
+    """
+    members, _, _ = _load_base_template()
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as package:
+        for name, data in members.items():
+            if name == STYLES_PART:
+                data = _brand_styles(data.decode('utf-8'), color_hex).encode('utf-8')
+            package.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _run_xml(text):
+    """Escapes text for a single run, turning newlines and tabs into Word breaks and tabs."""
+    text = escape(_INVALID_XML_CHARS.sub('', str(text)))
+    text = text.replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+    text = text.replace('\n', '</w:t><w:br/><w:t xml:space="preserve">')
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _paragraph_xml(text, style=None, centered=False):
+    properties = ''
+    if style:
+        properties += f'<w:pStyle w:val="{style}"/>'
+    if centered:
+        properties += '<w:jc w:val="center"/>'
+    if properties:
+        properties = f'<w:pPr>{properties}</w:pPr>'
+    return f'<w:p>{properties}{_run_xml(text)}</w:p>'
+
+
+def build_document_xml(resume_data):
+    """Generates the whole main document part in one pass, mirroring the python-docx layout."""
+    _, head, tail = _load_base_template()
+    parts = [
+        head,
+        _paragraph_xml(resume_data.get('name', 'Your Name'), style="Title", centered=True),
+        _paragraph_xml(f"{resume_data.get('email', '')} | {resume_data.get('phone', '')}", centered=True),
+    ]
+
+    for title, key in DOCX_SECTION_MAP.items():
+        content = resume_data.get(key)
+        if content:
+            parts.append(_paragraph_xml(title.upper(), style="Heading1"))
+            if isinstance(content, list):
+                parts.extend(_paragraph_xml(item, style="ListBullet") for item in content)
+            else:
+                parts.append(_paragraph_xml(content))
+
+    parts.append(tail)
+    return ''.join(parts).encode('utf-8')
+
+
+def render_docx(resume_data, color_hex):
+    """
+    Renders a .docx resume and returns it as a BytesIO positioned at the start.
+
+    The preloaded template package is cloned into the output buffer and the freshly
+    generated document part is streamed in after it.
+    """
+    buffer = BytesIO(_template_package(color_hex))
+    with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as docx_file:
+        docx_file.writestr(DOCUMENT_PART, build_document_xml(resume_data))
+    buffer.seek(0)
+    return buffer
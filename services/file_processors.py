@@ -1,10 +1,13 @@
 import streamlit as st
-import PyPDF2
-import docx
-import speech_recognition as sr
-from pydub import AudioSegment
 import tempfile
 import os
+from utils.lazy_imports import lazy_import
+
+# Parsers and audio libraries load on first use
+PyPDF2 = lazy_import("PyPDF2")
+docx = lazy_import("docx")
+sr = lazy_import("speech_recognition")
+pydub = lazy_import("pydub")
 
 def extract_text_from_pdf(pdf_file):
     """
@@ -60,7 +63,7 @@ def process_voice_input(audio_file):
     """
     try:
         # pydub reads the audio file and its format
-        sound = AudioSegment.from_file(audio_file)
+        sound = pydub.AudioSegment.from_file(audio_file)
         
         # Create a temporary file to store the WAV version
         with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_wav:
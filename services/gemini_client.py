@@ -0,0 +1,112 @@
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+from utils.lazy_imports import lazy_import
+
+# The Gemini SDK takes the best part of a second to import; defer it until
+# the first session actually needs the client.
+genai = lazy_import("google.generativeai")
+google_exceptions = lazy_import("google.api_core.exceptions")
+
+# --- CONSTANTS ---
+MODEL_NAME = 'gemini-2.5-flash'
+REQUEST_TIMEOUT_S = 60
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_S = 1.0  # doubled after each failed attempt, plus jitter
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL_S = 3600
+
+# Errors worth retrying: rate limits, overload and timeouts. Anything else
+# (bad key, blocked prompt, invalid request) fails immediately.
+RETRYABLE_ERRORS = (
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "DeadlineExceeded",
+    "GatewayTimeout",
+)
+
+
+class GeminiClient:
+    """
+    The process-wide Gemini client shared by every session.
+
+    Owns the one configured model (and with it the underlying connection to
+    the API), retries transient failures with exponential backoff, and keeps
+    a small LRU cache of responses so identical analysis prompts, such as
+    several sessions analysing the same resume and job, are answered once.
+    """
+
+    def __init__(self, model, cache_size=RESPONSE_CACHE_SIZE, cache_ttl=RESPONSE_CACHE_TTL_S):
+        self.model = model
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()  # prompt digest -> (stored_at, text)
+        self._lock = threading.Lock()
+
+    def _cache_key(self, prompt):
+        return hashlib.sha256(f"{self.model.model_name}\0{prompt}".encode('utf-8')).hexdigest()
+
+    def _cached(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, text = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return text
+
+    def _store(self, key, text):
+        with self._lock:
+            self._cache[key] = (time.monotonic(), text)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def generate_text(self, prompt, cache=True):
+        """
+        Returns the model's text response for a prompt. Raises once all retries are exhausted.
+
+        Pass cache=False for generative requests (drafts the user may ask for
+        again to get a different one); their responses are neither looked up
+        nor stored.
+        """
+        key = self._cache_key(prompt)
+        cached = self._cached(key) if cache else None
+        if cached is not None:
+            return cached
+
+        retryable = tuple(getattr(google_exceptions, name) for name in RETRYABLE_ERRORS)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                response = self.model.generate_content(prompt, request_options={"timeout": REQUEST_TIMEOUT_S})
+                text = response.text
+                break
+            except retryable:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+                time.sleep(BACKOFF_BASE_S * 2 ** (attempt - 1) + random.uniform(0, BACKOFF_BASE_S))
+
+        if cache:
+            self._store(key, text)
+        return text
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_client():
+    """
+    Configures the Gemini API once per server process and returns the shared client.
+
+    Reads GEMINI_API_KEY from Streamlit secrets. A failure is not cached, so the
+    next call retries (e.g. after the secret has been fixed).
+    """
+    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
+    return GeminiClient(genai.GenerativeModel(MODEL_NAME))
@@ -0,0 +1,108 @@
+from functools import lru_cache
+from html import escape
+
+# --- Shared Template Definition ---
+# One definition drives both the downloadable HTML resume and the Streamlit live
+# preview, so the two can never drift apart. Each entry is (key, title, kind).
+HTML_SECTIONS = (
+    ("summary", "Professional Summary", "text"),
+    ("skills", "Core Skills", "tags"),
+    ("experience", "Professional Experience", "list"),
+    ("education", "Education", "list"),
+    ("projects", "Key Projects", "list"),
+    ("certifications", "Certifications", "list"),
+)
+
+# All rules are scoped to the template root so the fragment can be embedded in
+# the Streamlit page without restyling anything around it.
+BASE_CSS = """
+.hiredly-resume{{font-family: Arial, sans-serif; max-width: 800px; margin: auto; padding: 20px; line-height: 1.6; color: #262730;}}
+.hiredly-resume .name{{font-size: 2.5em; color: {color}; text-align: center;}}
+.hiredly-resume .contact{{text-align: center; color: #555; margin-bottom: 20px;}}
+.hiredly-resume .section-title{{font-size: 1.4em; color: {color}; border-bottom: 2px solid {color}; padding-bottom: 5px; margin-top: 20px;}}
+.hiredly-resume .skill-tag{{display: inline-block; background: {color}; color: white; padding: 5px 12px; border-radius: 15px; margin: 5px; font-size: 0.9em;}}
+.hiredly-resume ul{{padding-left: 20px;}}
+"""
+
+TEMPLATE_CSS = {
+    "professional": """
+.hiredly-professional{{font-family: Georgia, 'Times New Roman', serif;}}
+.hiredly-professional .section-title{{text-transform: uppercase; letter-spacing: 1px; font-size: 1.1em;}}
+.hiredly-professional .skill-tag{{border-radius: 3px; background: transparent; color: {color}; border: 1px solid {color};}}
+""",
+    "modern": "",
+    "creative": """
+.hiredly-creative .name{{background: linear-gradient(90deg, {color}, #E67E22); -webkit-background-clip: text; color: transparent;}}
+.hiredly-creative .section-title{{border-bottom-style: dashed;}}
+.hiredly-creative .skill-tag{{background: linear-gradient(90deg, {color}, #E67E22);}}
+""",
+}
+
+DOCUMENT_WRAPPER = (
+    '<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>{title}</title>'
+    '<style>{css}</style></head><body>{body}</body></html>'
+)
+
+
+class CompiledHtmlTemplate:
+    """
+    An HTML resume template with its CSS and markup fragments prepared up front.
+
+    Rendering only escapes the user's values and joins precomputed strings, which
+    keeps it cheap enough to serve as the live-preview format.
+    """
+
+    __slots__ = ("template_style", "css", "_root_open", "_style_block", "_section_open")
+
+    def __init__(self, template_style, color_hex):
+        self.template_style = template_style
+        self.css = (BASE_CSS + TEMPLATE_CSS.get(template_style, "")).format(color=color_hex).strip()
+        self._root_open = f'<div class="hiredly-resume hiredly-{template_style}">'
+        self._style_block = f'<style>{self.css}</style>'
+        self._section_open = {
+            key: f'<div class="section-title">{escape(title)}</div>' for key, title, _ in HTML_SECTIONS
+        }
+
+    def _render_section(self, key, kind, content):
+        if kind == "text" or not isinstance(content, list):
+            return f'{self._section_open[key]}<p>{escape(str(content))}</p>'
+        if kind == "tags":
+            items = ''.join(f'<span class="skill-tag">{escape(str(item))}</span>' for item in content)
+            return f'{self._section_open[key]}<div>{items}</div>'
+        items = ''.join(f'<li>{escape(str(item))}</li>' for item in content)
+        return f'{self._section_open[key]}<ul>{items}</ul>'
+
+    def render_body(self, resume_data):
+        """Renders the resume markup (without CSS) with every user value escaped."""
+        contact = ' | '.join(
+            escape(str(resume_data[field])) for field in ('email', 'phone') if resume_data.get(field)
+        )
+        parts = [
+            self._root_open,
+            f'<div class="name">{escape(str(resume_data.get("name") or "Your Name"))}</div>',
+            f'<div class="contact">{contact}</div>',
+        ]
+        for key, _, kind in HTML_SECTIONS:
+            content = resume_data.get(key)
+            if content:
+                parts.append(self._render_section(key, kind, content))
+        parts.append('</div>')
+        return ''.join(parts)
+
+    def render_fragment(self, resume_data):
+        """Renders an embeddable fragment with its scoped style block (used by the live preview)."""
+        return self._style_block + self.render_body(resume_data)
+
+    def render_document(self, resume_data):
+        """Renders a complete single-file HTML document."""
+        return DOCUMENT_WRAPPER.format(
+            title=escape(str(resume_data.get('name') or 'Resume')),
+            css=self.css,
+            body=self.render_body(resume_data),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_html_template(template_style, color_hex):
+    """Returns the compiled template for a style, compiling it once per process."""
+    return CompiledHtmlTemplate(template_style, color_hex)
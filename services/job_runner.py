@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+# --- CONSTANTS ---
+JOB_WORKERS = int(os.environ.get("HIREDLY_JOB_WORKERS", "4"))
+# Jobs of owners not seen for this long are dropped (queued ones are cancelled)
+JOB_IDLE_TTL_S = int(os.environ.get("HIREDLY_JOB_IDLE_TTL_S", "1800"))
+CLEANUP_INTERVAL_S = 60
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+class Job:
+    """One unit of background work and everything a later rerun needs to know about it."""
+
+    def __init__(self, owner, input_hash):
+        self.job_id = uuid.uuid4().hex
+        self.owner = owner
+        self.input_hash = input_hash
+        self.status = QUEUED
+        self.events = []  # (step, total_steps, message), oldest first
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.future = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def report(self, step, total_steps, message):
+        """Progress callback handed to the job function."""
+        with self._lock:
+            self.events.append((step, total_steps, message))
+
+    def progress(self):
+        """Returns (fraction complete, latest message) for display."""
+        with self._lock:
+            if not self.events:
+                return 0.0, "Waiting for a free worker..." if self.status == QUEUED else "Starting..."
+            step, total_steps, message = self.events[-1]
+        return min(step / total_steps, 1.0) if total_steps else 0.0, message
+
+
+class JobRunner:
+    """
+    Runs long tasks on a worker pool, outside any Streamlit script thread.
+
+    Jobs are keyed by owner (a session) and a hash of their inputs. Submitting
+    the same inputs again returns the existing job instead of starting a new
+    one, so a task runs exactly once however often the page reruns, and its
+    result stays retrievable from any later rerun or page. Jobs belonging to
+    owners that have gone idle are cleaned up.
+    """
+
+    def __init__(self, max_workers=JOB_WORKERS, idle_ttl=JOB_IDLE_TTL_S):
+        self.idle_ttl = idle_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hiredly-job")
+        self._jobs = {}       # (owner, input_hash) -> Job
+        self._last_seen = {}  # owner -> time of last activity
+        self._last_cleanup = time.monotonic()
+        self._lock = threading.Lock()
+
+    def submit(self, owner, input_hash, fn, *args, **kwargs):
+        """
+        Starts fn(*args, progress=job.report, **kwargs) unless this owner already
+        has a job for the same inputs that has not failed. Returns the job.
+        """
+        self.touch(owner)
+        with self._lock:
+            job = self._jobs.get((owner, input_hash))
+            if job is not None and job.status not in (FAILED, CANCELLED):
+                return job
+            job = Job(owner, input_hash)
+            self._jobs[(owner, input_hash)] = job
+            job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+            return job
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = RUNNING
+        try:
+            job.result = fn(*args, progress=job.report, **kwargs)
+            job.status = DONE
+        except Exception as e:
+            job.error = e
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, owner, input_hash):
+        self.touch(owner)
+        with self._lock:
+            return self._jobs.get((owner, input_hash))
+
+    def touch(self, owner):
+        """Marks the owner as active, and now and then sweeps up idle owners' jobs."""
+        now = time.monotonic()
+        with self._lock:
+            self._last_seen[owner] = now
+            if now - self._last_cleanup < CLEANUP_INTERVAL_S:
+                return
+            self._last_cleanup = now
+        self.cleanup()
+
+    def cleanup(self):
+        """Drops the jobs of owners idle for longer than idle_ttl. Returns how many were removed."""
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._lock:
+            idle_owners = {owner for owner, seen in self._last_seen.items() if seen < cutoff}
+            removed = 0
+            for key in [key for key, job in self._jobs.items() if job.owner in idle_owners]:
+                job = self._jobs[key]
+                if job.status == QUEUED and job.future.cancel():
+                    job.status = CANCELLED
+                if job.finished:  # Running jobs are left to finish and swept next time
+                    del self._jobs[key]
+                    removed += 1
+            # Forget owners once nothing of theirs is left running
+            active_owners = {job.owner for job in self._jobs.values()}
+            for owner in idle_owners - active_owners:
+                del self._last_seen[owner]
+        return removed
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_runner():
+    """Returns the process-wide job runner shared by all sessions."""
+    return JobRunner()
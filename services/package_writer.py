@@ -0,0 +1,92 @@
+import time
+import zipfile
+from collections import namedtuple
+
+# A single archive entry. `producer` is a zero-argument callable returning bytes,
+# a str, a file-like object or an iterable of byte chunks; it is only called when
+# the writer reaches that member, so at most one member is materialised at a time.
+# Set `compress=False` for content that is already compressed (PDF, DOCX).
+PackageMember = namedtuple("PackageMember", ["arcname", "producer", "compress"], defaults=[True])
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkSink:
+    """
+    Write-only, non-seekable target for ZipFile.
+
+    Because it cannot seek, ZipFile writes each entry sequentially with a trailing
+    data descriptor, and the bytes written so far can be handed out and forgotten.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def _iter_member_chunks(content, chunk_size=CHUNK_SIZE):
+    """Normalises whatever a producer returned into a stream of byte chunks."""
+    if content is None:
+        return
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+    elif hasattr(content, 'read'):
+        while True:
+            chunk = content.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+    else:
+        for chunk in content:
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def stream_package(members, chunk_size=CHUNK_SIZE):
+    """
+    Yields a ZIP archive as a sequence of byte chunks, one member at a time.
+
+    Each member's producer is called only when it is written, its output is fed
+    through the compressor in `chunk_size` pieces, and the finished bytes are
+    yielded straight away, so the archive is never assembled in memory.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for member in members:
+            info = zipfile.ZipInfo(member.arcname, date_time=time.localtime(time.time())[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if member.compress else zipfile.ZIP_STORED
+            info.external_attr = 0o600 << 16
+            with zip_file.open(info, 'w') as entry:
+                for chunk in _iter_member_chunks(member.producer(), chunk_size):
+                    entry.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    # Closing the archive writes the central directory.
+    yield from sink.drain()
+
+
+def write_package(members, fileobj, chunk_size=CHUNK_SIZE):
+    """Streams a ZIP archive into a writable file object. Returns the number of bytes written."""
+    written = 0
+    for chunk in stream_package(members, chunk_size):
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,206 @@
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+# --- Page Geometry ---
+# Mirrors SimpleDocTemplate(pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
+# and the 6pt padding of its default Frame, so both renderers place text identically.
+PAGE_WIDTH, PAGE_HEIGHT = letter
+FRAME_PADDING = 6
+FRAME_LEFT = inch + FRAME_PADDING
+FRAME_WIDTH = PAGE_WIDTH - 2 * inch - 2 * FRAME_PADDING
+FRAME_TOP = PAGE_HEIGHT - 0.75 * inch - FRAME_PADDING
+FRAME_BOTTOM = 0.75 * inch + FRAME_PADDING
+
+# --- Skills Table Geometry (ReportLab Table defaults) ---
+SKILL_COLUMNS = 3
+SKILL_COL_WIDTH = 2.2 * inch
+SKILL_FONT = ('Helvetica', 10, 12)  # fontName, fontSize, leading
+SKILL_PADDING_X, SKILL_PADDING_Y = 6, 3
+
+# Characters that Platypus treats as markup; such content always takes the Platypus path.
+MARKUP_CHARS = frozenset('<>&')
+
+
+class FastPathOverflow(Exception):
+    """Raised when content cannot be laid out by the fast path (it needs Platypus)."""
+
+
+class FontMetrics:
+    """
+    Per-font, per-size character width table used for line wrapping.
+
+    Widths are looked up once per character and then summed, which is far cheaper
+    than asking ReportLab to measure every candidate line.
+    """
+
+    _cache = {}
+
+    def __init__(self, font_name, font_size):
+        self.font_name = font_name
+        self.font_size = font_size
+        self._widths = {}
+        self.space_width = self.char_width(' ')
+
+    @classmethod
+    def get(cls, font_name, font_size):
+        key = (font_name, font_size)
+        if key not in cls._cache:
+            cls._cache[key] = cls(font_name, font_size)
+        return cls._cache[key]
+
+    def char_width(self, char):
+        width = self._widths.get(char)
+        if width is None:
+            width = self._widths[char] = stringWidth(char, self.font_name, self.font_size)
+        return width
+
+    def text_width(self, text):
+        widths = self._widths
+        total = 0.0
+        for char in text:
+            width = widths.get(char)
+            total += width if width is not None else self.char_width(char)
+        return total
+
+    def wrap(self, words, max_width, space_shrinkage=0):
+        """
+        Greedy word wrap matching Platypus' Paragraph line breaking, including its
+        allowance for squeezing inter-word spaces. Returns (words, width) pairs.
+
+        Raises FastPathOverflow for a word wider than the line (e.g. a long URL),
+        which Platypus would split across lines.
+        """
+        lines = []
+        current, current_width = [], 0.0
+        shrink_per_space = space_shrinkage * self.space_width
+        for word in words:
+            word_width = self.text_width(word)
+            if word_width > max_width:
+                raise FastPathOverflow("Word wider than the line.")
+            candidate = current_width + self.space_width + word_width if current else word_width
+            if current and candidate > max_width + shrink_per_space * len(current):
+                lines.append((current, current_width))
+                current, current_width = [word], word_width
+            else:
+                current.append(word)
+                current_width = candidate
+        if current:
+            lines.append((current, current_width))
+        return lines
+
+
+class _FastPage:
+    """Tracks the cursor on a single page and the Platypus-style vertical spacing."""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.y = FRAME_TOP
+        self.prev_space_after = None  # None means "at top of frame"
+
+    def reserve(self, height, space_before, space_after):
+        """Moves the cursor past the gap and the block, returning the block's top edge."""
+        if self.prev_space_after is None:
+            gap = 0
+        else:
+            gap = max(space_before - self.prev_space_after, 0)
+        top = self.y - gap
+        if top - height < FRAME_BOTTOM:
+            raise FastPathOverflow("Content does not fit on a single page.")
+        self.y = top - height - space_after
+        self.prev_space_after = space_after
+        return top
+
+    def paragraph(self, text, style):
+        if MARKUP_CHARS.intersection(text):
+            raise FastPathOverflow("Paragraph contains markup.")
+        metrics = FontMetrics.get(style.fontName, style.fontSize)
+        available = FRAME_WIDTH - style.leftIndent - style.rightIndent
+        lines = metrics.wrap(text.split(), available, style.spaceShrinkage)
+        if not lines:
+            raise FastPathOverflow("Empty paragraph.")
+
+        top = self.reserve(len(lines) * style.leading, style.spaceBefore, style.spaceAfter)
+        left = FRAME_LEFT + style.leftIndent
+        text = self.pdf.beginText(left, top - style.fontSize)
+        text.setFont(style.fontName, style.fontSize, style.leading)
+        text.setFillColor(style.textColor)
+        for words, line_width in lines:
+            extra_space = available - line_width
+            if extra_space < 0 and len(words) > 1:
+                # Over-full line: squeeze the spaces exactly as Platypus does.
+                text.setWordSpace(extra_space / (len(words) - 1))
+                text.textLine(' '.join(words))
+                text.setWordSpace(0)
+                continue
+            if style.alignment == 1:
+                offset = extra_space / 2.0
+            elif style.alignment == 2:
+                offset = extra_space
+            else:
+                offset = 0
+            text.moveCursor(offset, 0)
+            text.textLine(' '.join(words))
+            text.moveCursor(-offset, 0)
+        self.pdf.drawText(text)
+
+    def skills_table(self, skills):
+        font_name, font_size, leading = SKILL_FONT
+        rows = [skills[i:i + SKILL_COLUMNS] for i in range(0, len(skills), SKILL_COLUMNS)]
+        row_height = leading + 2 * SKILL_PADDING_Y
+        top = self.reserve(len(rows) * row_height, 0, 0)
+
+        metrics = FontMetrics.get(font_name, font_size)
+        cell_width = SKILL_COL_WIDTH - 2 * SKILL_PADDING_X
+
+        self.pdf.setFont(font_name, font_size, leading)
+        self.pdf.setFillColor('black')
+        left = FRAME_LEFT + (FRAME_WIDTH - SKILL_COLUMNS * SKILL_COL_WIDTH) / 2.0
+        baseline = top - SKILL_PADDING_Y - font_size
+        for row in rows:
+            for col, skill in enumerate(row):
+                skill = str(skill)
+                if '\n' in skill:
+                    raise FastPathOverflow("Multi-line table cell.")
+                if metrics.text_width(skill) > cell_width:
+                    raise FastPathOverflow("Table cell wider than its column.")
+                self.pdf.drawString(left + col * SKILL_COL_WIDTH + SKILL_PADDING_X, baseline, skill)
+            baseline -= row_height
+
+
+def render_fast_pdf(resume_data, styles, section_map):
+    """
+    Draws a one-page resume directly on the ReportLab canvas.
+
+    Uses the same precompiled template styles and section order as the Platypus
+    renderer. Raises FastPathOverflow when the resume needs anything the fast path
+    does not handle (page breaks, inline markup, words or cells too wide to fit),
+    so the caller can fall back.
+    """
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    page = _FastPage(pdf)
+
+    page.paragraph(resume_data.get('name', 'Your Name'), styles['name'])
+    page.paragraph(f"{resume_data.get('email', '')} | {resume_data.get('phone', '')}", styles['contact'])
+
+    for key, title in section_map.items():
+        content = resume_data.get(key)
+        if content:
+            page.paragraph(title.upper(), styles['section'])
+            if isinstance(content, list):
+                if key == 'skills':
+                    page.skills_table(content)
+                else:
+                    for item in content:
+                        page.paragraph(f"• {item}", styles['bullet'])
+            else:
+                page.paragraph(str(content), styles['normal'])
+
+    pdf.showPage()
+    pdf.save()
+    buffer.seek(0)
+    return buffer
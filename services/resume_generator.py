@@ -1,6 +1,6 @@
 import json
 import datetime
-import zipfile
+from functools import lru_cache
 from io import BytesIO
 
 # --- ReportLab for PDF Generation ---
@@ -10,54 +10,84 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 
-# --- python-docx for Word Document Generation ---
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from .docx_builder import render_docx
+from .html_templates import get_html_template
+from .package_writer import PackageMember, stream_package
+from .pdf_fastpath import FastPathOverflow, render_fast_pdf
 
 
-def create_enhanced_pdf_resume(resume_data, template_style="professional"):
+# --- Template Definitions ---
+# Primary accent colour for each resume template, shared by every output format.
+TEMPLATE_COLORS = {
+    "professional": '#000080',  # Navy Blue
+    "modern": '#1E90FF',        # Hiredly Blue
+    "creative": '#8E44AD',      # Creative Purple
+}
+TEMPLATE_NAMES = tuple(TEMPLATE_COLORS)
+
+PDF_SECTION_MAP = {
+    "summary": "Professional Summary", "skills": "Core Competencies", "experience": "Professional Experience",
+    "education": "Education", "projects": "Key Projects", "certifications": "Certifications"
+}
+
+
+@lru_cache(maxsize=None)
+def get_template_styles(template_style="professional"):
+    """
+    Builds the ReportLab paragraph styles for a template.
+
+    Style sheets are immutable once built, so they are compiled once per process
+    and reused by every render instead of calling getSampleStyleSheet() each time.
+    """
+    styles = getSampleStyleSheet()
+    primary_color = colors.HexColor(TEMPLATE_COLORS.get(template_style, TEMPLATE_COLORS["professional"]))
+    section_font = 'Helvetica-Bold'
+
+    return {
+        "primary_color": primary_color,
+        "normal": styles['Normal'],
+        "name": ParagraphStyle('NameStyle', parent=styles['h1'], fontSize=24, textColor=primary_color, alignment=1, spaceAfter=6),
+        "contact": ParagraphStyle('ContactStyle', parent=styles['Normal'], fontSize=10, alignment=1, spaceAfter=12),
+        "section": ParagraphStyle('SectionStyle', parent=styles['h2'], fontSize=14, textColor=primary_color, fontName=section_font, spaceBefore=12, spaceAfter=6, borderBottomWidth=1, borderBottomColor=primary_color, paddingBottom=2),
+        # FIX: Create a dedicated style for bullet points with proper indentation.
+        "bullet": ParagraphStyle('BulletStyle', parent=styles['Normal'], leftIndent=20, spaceAfter=6),
+    }
+
+
+def warm_template_styles():
+    """Precompiles the style sheets for every template (used by batch render workers)."""
+    for template_style in TEMPLATE_NAMES:
+        get_template_styles(template_style)
+
+
+def create_enhanced_pdf_resume(resume_data, template_style="professional", fast_path=True):
     """
     Generates an enhanced PDF resume with multiple template options.
+
+    Single-page resumes are drawn directly on the canvas by the fast path; anything
+    it cannot lay out (page breaks, inline markup, words wider than a line) falls
+    back to Platypus.
     """
+    styles = get_template_styles(template_style)
+    if fast_path:
+        try:
+            return render_fast_pdf(resume_data, styles, PDF_SECTION_MAP)
+        except FastPathOverflow:
+            pass
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
-    styles = getSampleStyleSheet()
     story = []
 
-    # --- Template-based Styling for Hiredly ---
-    if template_style == "modern":
-        primary_color = colors.HexColor('#1E90FF') # Hiredly Blue
-        section_font = 'Helvetica-Bold'
-    elif template_style == "creative":
-        primary_color = colors.HexColor('#8E44AD') # Creative Purple
-        section_font = 'Helvetica-Bold'
-    else:  # professional
-        primary_color = colors.HexColor('#000080') # Navy Blue
-        section_font = 'Helvetica-Bold'
-
-    # --- Custom Styles ---
-    name_style = ParagraphStyle('NameStyle', parent=styles['h1'], fontSize=24, textColor=primary_color, alignment=1, spaceAfter=6)
-    contact_style = ParagraphStyle('ContactStyle', parent=styles['Normal'], fontSize=10, alignment=1, spaceAfter=12)
-    section_style = ParagraphStyle('SectionStyle', parent=styles['h2'], fontSize=14, textColor=primary_color, fontName=section_font, spaceBefore=12, spaceAfter=6, borderBottomWidth=1, borderBottomColor=primary_color, paddingBottom=2)
-    
-    # FIX: Create a dedicated style for bullet points with proper indentation.
-    bullet_style = ParagraphStyle('BulletStyle', parent=styles['Normal'], leftIndent=20, spaceAfter=6)
-    
     # --- Build Document Story ---
-    story.append(Paragraph(resume_data.get('name', 'Your Name'), name_style))
+    story.append(Paragraph(resume_data.get('name', 'Your Name'), styles['name']))
     contact_info = f"{resume_data.get('email', '')} | {resume_data.get('phone', '')}"
-    story.append(Paragraph(contact_info, contact_style))
+    story.append(Paragraph(contact_info, styles['contact']))
 
-    section_map = {
-        "summary": "Professional Summary", "skills": "Core Competencies", "experience": "Professional Experience",
-        "education": "Education", "projects": "Key Projects", "certifications": "Certifications"
-    }
-
-    for key, title in section_map.items():
+    for key, title in PDF_SECTION_MAP.items():
         content = resume_data.get(key)
         if content:
-            story.append(Paragraph(title.upper(), section_style))
+            story.append(Paragraph(title.upper(), styles['section']))
             if isinstance(content, list):
                 if key == 'skills':
                     skill_rows = [content[i:i+3] for i in range(0, len(content), 3)]
@@ -66,94 +96,119 @@ def create_enhanced_pdf_resume(resume_data, template_style="professional"):
                     story.append(skills_table)
                 else:
                     for item in content:
-                        # FIX: Use the new 'bullet_style' here.
-                        story.append(Paragraph(f"• {item}", bullet_style))
+                        story.append(Paragraph(f"• {item}", styles['bullet']))
             else: # For summary string
-                story.append(Paragraph(content, styles['Normal']))
+                story.append(Paragraph(content, styles['normal']))
 
     doc.build(story)
     buffer.seek(0)
     return buffer
 
 
-def create_word_resume(resume_data):
-    """Generates a Word document (.docx) from the resume data."""
-    doc = Document()
-    doc.add_heading(resume_data.get('name', 'Your Name'), 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    contact_info = f"{resume_data.get('email', '')} | {resume_data.get('phone', '')}"
-    doc.add_paragraph(contact_info).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    section_map = {
-        "Professional Summary": "summary", "Core Skills": "skills", "Professional Experience": "experience",
-        "Education": "education", "Key Projects": "projects", "Certifications": "certifications"
-    }
+def create_word_resume(resume_data, template_style="professional"):
+    """
+    Generates a Word document (.docx) from the resume data.
 
-    for title, key in section_map.items():
-        content = resume_data.get(key)
-        if content:
-            doc.add_heading(title.upper(), level=1)
-            if isinstance(content, list):
-                for item in content:
-                    doc.add_paragraph(str(item), style='List Bullet')
-            else:
-                doc.add_paragraph(str(content))
+    Built from a base template package preloaded once per process, with the
+    heading colours of the chosen template so Word output matches the PDF.
+    """
+    color_hex = TEMPLATE_COLORS.get(template_style, TEMPLATE_COLORS["professional"])
+    return render_docx(resume_data, color_hex)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
 
+def _html_template(template_style):
+    if template_style not in TEMPLATE_COLORS:
+        template_style = "modern"
+    return get_html_template(template_style, TEMPLATE_COLORS[template_style])
 
-def create_html_resume(resume_data):
-    """Generates a single-file HTML resume."""
-    skills_html = ''.join([f'<span class="skill-tag">{skill}</span>' for skill in resume_data.get('skills', [])])
-    experience_html = ''.join([f'<li>{exp}</li>' for exp in resume_data.get('experience', [])])
-    
-    html_template = f"""
-    <!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>{resume_data.get('name', 'Resume')}</title>
-    <style>body{{font-family: Arial, sans-serif; max-width: 800px; margin: auto; padding: 20px; line-height: 1.6;}} .name{{font-size: 2.5em; color: #1E90FF; text-align: center;}} .contact{{text-align: center; color: #555; margin-bottom: 20px;}} .section-title{{font-size: 1.4em; color: #1E90FF; border-bottom: 2px solid #1E90FF; padding-bottom: 5px; margin-top: 20px;}} .skill-tag{{display: inline-block; background: #1E90FF; color: white; padding: 5px 12px; border-radius: 15px; margin: 5px; font-size: 0.9em;}} ul{{padding-left: 20px;}}</style></head>
-    <body>
-        <div class="name">{resume_data.get('name', '')}</div>
-        <div class="contact">{resume_data.get('email', '')} | {resume_data.get('phone', '')}</div>
-        <div class="section-title">Professional Summary</div><p>{resume_data.get('summary', '')}</p>
-        <div class="section-title">Core Skills</div><div>{skills_html}</div>
-        <div class="section-title">Experience</div><ul>{experience_html}</ul>
-    </body></html>
-    """
-    return html_template.encode('utf-8')
 
+def create_html_resume(resume_data, template_style="modern"):
+    """Generates a single-file HTML resume covering every section, with user content escaped."""
+    return _html_template(template_style).render_document(resume_data).encode('utf-8')
 
-def create_resume_package(resume_data, template_style):
-    """
-    Creates a ZIP file containing the resume in multiple formats (PDF, DOCX, HTML, JSON).
-    """
-    zip_buffer = BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # 1. Add PDF resume
-        pdf_buffer = create_enhanced_pdf_resume(resume_data, template_style)
-        zip_file.writestr("Hiredly_Resume.pdf", pdf_buffer.getvalue())
-
-        # 2. Add Word resume
-        word_buffer = create_word_resume(resume_data)
-        zip_file.writestr("Hiredly_Resume.docx", word_buffer.getvalue())
-
-        # 3. Add HTML resume
-        html_content = create_html_resume(resume_data)
-        zip_file.writestr("Hiredly_Resume.html", html_content)
-        
-        # 4. Add JSON data backup
-        json_content = json.dumps(resume_data, indent=2)
-        zip_file.writestr("resume_data.json", json_content)
-
-        # 5. Add a README file
-        readme_content = f"""
+
+def create_html_preview(resume_data, template_style="modern"):
+    """Generates the embeddable HTML fragment used for the in-app live preview."""
+    return _html_template(template_style).render_fragment(resume_data)
+
+
+def _package_readme():
+    return f"""
         Hiredly AI Resume Package
         =========================
         Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
         This package contains your AI-optimized resume in multiple formats.
-        """
-        zip_file.writestr("README.txt", readme_content.strip())
-    
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
\ No newline at end of file
+        """.strip()
+
+
+def resume_package_members(resume_data, template_style, cover_letter="", linkedin_summary="", extra_templates=()):
+    """
+    Describes the members of a resume package, in archive order.
+
+    Each member is produced lazily by the package writer. PDF and DOCX files are
+    already compressed, so they are stored rather than deflated again.
+    """
+    # 1. PDF resume (plus any additional templates requested)
+    yield PackageMember("Hiredly_Resume.pdf", lambda: create_enhanced_pdf_resume(resume_data, template_style), False)
+    for extra_style in extra_templates:
+        if extra_style != template_style:
+            yield PackageMember(f"Hiredly_Resume_{extra_style}.pdf",
+                                lambda style=extra_style: create_enhanced_pdf_resume(resume_data, style), False)
+
+    # 2. Word resume
+    yield PackageMember("Hiredly_Resume.docx", lambda: create_word_resume(resume_data, template_style), False)
+
+    # 3. HTML resume
+    yield PackageMember("Hiredly_Resume.html", lambda: create_html_resume(resume_data, template_style))
+
+    # 4. Optional AI-generated documents
+    if cover_letter:
+        yield PackageMember("Cover_Letter.txt", lambda: cover_letter)
+    if linkedin_summary:
+        yield PackageMember("LinkedIn_Summary.txt", lambda: linkedin_summary)
+
+    # 5. JSON data backup
+    yield PackageMember("resume_data.json", lambda: json.dumps(resume_data, indent=2))
+
+    # 6. README file
+    yield PackageMember("README.txt", _package_readme)
+
+
+def stream_resume_package(resume_data, template_style, **extras):
+    """Yields the resume package ZIP as byte chunks without assembling it in memory."""
+    return stream_package(resume_package_members(resume_data, template_style, **extras))
+
+
+def create_resume_package(resume_data, template_style, **extras):
+    """
+    Creates a ZIP file containing the resume in multiple formats (PDF, DOCX, HTML, JSON).
+
+    Optional keyword arguments `cover_letter`, `linkedin_summary` and `extra_templates`
+    add the generated documents and additional template PDFs to the package.
+    The whole archive is held in memory; use stream_resume_package() where the
+    output can be written as it is produced.
+    """
+    return b''.join(stream_resume_package(resume_data, template_style, **extras))
+
+
+# --- Format Dispatch ---
+RENDER_FORMATS = ("pdf", "docx", "html", "json")
+
+
+def render_resume(resume_data, template_style="professional", output_format="pdf"):
+    """
+    Renders a resume in a single format and returns the raw bytes.
+
+    This is the common entry point used by the batch renderer so every job,
+    whatever its format, produces the same kind of output.
+    """
+    if output_format == "pdf":
+        return create_enhanced_pdf_resume(resume_data, template_style).getvalue()
+    if output_format == "docx":
+        return create_word_resume(resume_data, template_style).getvalue()
+    if output_format == "html":
+        return create_html_resume(resume_data, template_style)
+    if output_format == "json":
+        return json.dumps(resume_data, indent=2).encode('utf-8')
+    raise ValueError(f"Unsupported resume format: {output_format!r}")
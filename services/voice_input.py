@@ -0,0 +1,240 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from utils.lazy_imports import lazy_import
+
+sr = lazy_import("speech_recognition")
+
+# --- CONSTANTS ---
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2               # 16-bit PCM
+FRAME_SAMPLES = 1024           # about 64 ms per frame at 16 kHz
+
+# Voice activity detection: a frame is speech when its RMS energy is above
+# ENERGY_RATIO times the ambient level measured at the start (and above the floor)
+CALIBRATION_S = 0.5
+ENERGY_RATIO = 2.0
+ENERGY_FLOOR = 300
+PRE_ROLL_S = 0.25              # audio kept from just before speech starts, so onsets are not clipped
+SEGMENT_PAUSE_S = 0.5          # a pause this long closes a segment and sends it for transcription
+MAX_SEGMENT_S = 8.0            # long stretches without a pause are cut here
+MIN_SEGMENT_S = 0.25           # shorter bursts (clicks, bumps) are dropped
+END_OF_SPEECH_S = 1.5          # silence this long after speech ends the recording
+START_TIMEOUT_S = 10.0         # no speech at all within this long ends it too
+MAX_CAPTURE_S = 120.0
+
+TRANSCRIBE_WORKERS = 4
+
+LISTENING, TRANSCRIBING, DONE = "listening", "transcribing", "done"
+
+_transcribe_pool = ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS, thread_name_prefix="hiredly-voice")
+
+
+def frame_energy(frame):
+    """RMS energy of a frame of 16-bit PCM."""
+    samples = np.frombuffer(frame, dtype=np.int16)
+    if not samples.size:
+        return 0.0
+    return float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+
+
+class SpeechSegmenter:
+    """
+    Energy-based voice activity detection over a stream of PCM frames.
+
+    feed() takes one frame at a time and returns the speech segments (PCM
+    bytes) completed by it, so each can be transcribed while the speaker
+    carries on. `ended` turns True once the speaker has stopped (or never
+    started) and capture can stop.
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE, frame_samples=FRAME_SAMPLES):
+        frame_s = frame_samples / sample_rate
+        self._calibration_frames = max(1, round(CALIBRATION_S / frame_s))
+        self._pause_frames = max(1, round(SEGMENT_PAUSE_S / frame_s))
+        self._max_frames = max(1, round(MAX_SEGMENT_S / frame_s))
+        self._min_frames = max(1, round(MIN_SEGMENT_S / frame_s))
+        self._end_frames = max(1, round(END_OF_SPEECH_S / frame_s))
+        self._start_timeout_frames = round(START_TIMEOUT_S / frame_s)
+        self._max_capture_frames = round(MAX_CAPTURE_S / frame_s)
+
+        self._ambient = []
+        self.threshold = None
+        self._pre_roll = deque(maxlen=max(1, round(PRE_ROLL_S / frame_s)))
+        self._segment = []             # frames of the segment being collected
+        self._voiced_frames = 0        # speech frames in the current segment
+        self._silent_run = 0           # consecutive silent frames
+        self._frames_seen = 0
+        self.heard_speech = False
+        self.ended = False
+
+    def feed(self, frame):
+        self._frames_seen += 1
+        energy = frame_energy(frame)
+        if self.threshold is None:
+            self._ambient.append(energy)
+            if len(self._ambient) >= self._calibration_frames:
+                self.threshold = max(ENERGY_FLOOR, ENERGY_RATIO * float(np.mean(self._ambient)))
+            return []
+
+        completed = []
+        if energy > self.threshold:
+            if not self._segment:
+                self._segment.extend(self._pre_roll)
+                self._pre_roll.clear()
+            self._segment.append(frame)
+            self._voiced_frames += 1
+            self._silent_run = 0
+            self.heard_speech = True
+            if len(self._segment) >= self._max_frames:
+                completed.extend(self._close_segment())
+        else:
+            self._silent_run += 1
+            if self._segment:
+                self._segment.append(frame)
+                if self._silent_run >= self._pause_frames:
+                    completed.extend(self._close_segment())
+            else:
+                self._pre_roll.append(frame)
+
+        if self.heard_speech and self._silent_run >= self._end_frames:
+            self.ended = True
+        elif not self.heard_speech and self._frames_seen >= self._start_timeout_frames:
+            self.ended = True
+        elif self._frames_seen >= self._max_capture_frames:
+            self.ended = True
+        if self.ended:
+            completed.extend(self.flush())
+        return completed
+
+    def flush(self):
+        """Closes the segment in progress, e.g. when the user stops the recording."""
+        return self._close_segment() if self._segment else []
+
+    def _close_segment(self):
+        frames, voiced = self._segment, self._voiced_frames
+        self._segment, self._voiced_frames = [], 0
+        if voiced < self._min_frames:
+            return []
+        return [b"".join(frames)]
+
+
+def transcribe_segment(pcm, sample_rate=SAMPLE_RATE):
+    """Transcribes one speech segment. Returns "" when nothing intelligible was said."""
+    try:
+        return sr.Recognizer().recognize_google(sr.AudioData(pcm, sample_rate, SAMPLE_WIDTH))
+    except sr.UnknownValueError:
+        return ""
+
+
+def microphone_frames():
+    """Yields frames from the default microphone until the generator is closed."""
+    with sr.Microphone(sample_rate=SAMPLE_RATE, chunk_size=FRAME_SAMPLES) as source:
+        while True:
+            yield source.stream.read(source.CHUNK)
+
+
+class VoiceCapture:
+    """
+    One recording: frames are read and segmented on a background thread, and
+    every segment is transcribed on a shared pool as soon as it closes. Pages
+    poll text() for the transcript so far; once the speaker stops, only the
+    last segment is still being transcribed.
+    """
+
+    def __init__(self, frames=None, transcribe=transcribe_segment):
+        self._frames = frames
+        self._transcribe = transcribe
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._results = []             # one future per segment, in order
+        self._transcribed = 0          # segments whose transcription has completed
+        self._capturing = True
+        self.error = None
+        self.started_at = time.monotonic()
+        self.speech_ended_at = None    # when the segmenter decided the speaker had finished
+
+    def start(self):
+        threading.Thread(target=self._capture, name="hiredly-voice-capture", daemon=True).start()
+        return self
+
+    def stop(self):
+        """Ends the recording early; segments already captured are still transcribed."""
+        self._stop.set()
+
+    def _capture(self):
+        frames = self._frames if self._frames is not None else microphone_frames()
+        segmenter = SpeechSegmenter()
+        try:
+            for frame in frames:
+                for segment in segmenter.feed(frame):
+                    self._submit(segment)
+                if segmenter.ended or self._stop.is_set():
+                    break
+            for segment in segmenter.flush():
+                self._submit(segment)
+            if not segmenter.heard_speech:
+                self.error = "No speech detected. Please try again."
+        except Exception as e:
+            self.error = (f"An error occurred with the microphone. Ensure PyAudio is installed "
+                          f"and your mic has permission. Error: {e}")
+        finally:
+            if hasattr(frames, "close"):
+                frames.close()  # Releases the microphone
+            self.speech_ended_at = time.monotonic()
+            with self._lock:
+                self._capturing = False
+
+    def _submit(self, segment):
+        future = _transcribe_pool.submit(self._transcribe, segment)
+        with self._lock:
+            self._results.append(future)
+        future.add_done_callback(self._segment_done)
+
+    def _segment_done(self, future):
+        """Runs as each segment's transcription completes, so a failure is recorded as it happens."""
+        error = future.exception()
+        with self._lock:
+            if error is not None and self.error is None:
+                # A failed segment leaves a gap; the rest of the answer is kept
+                self.error = f"Part of the recording could not be transcribed: {error}"
+            self._transcribed += 1
+
+    @property
+    def status(self):
+        with self._lock:
+            if self._capturing:
+                return LISTENING
+            # Counted by _segment_done, so an error is always recorded before the capture reads as done
+            return DONE if self._transcribed == len(self._results) else TRANSCRIBING
+
+    @property
+    def finished(self):
+        return self.status == DONE
+
+    def pending(self):
+        """Segments captured but not yet transcribed."""
+        with self._lock:
+            return len(self._results) - self._transcribed
+
+    def text(self):
+        """The transcript so far: every transcribed segment, in order, up to the first still pending."""
+        with self._lock:
+            results = list(self._results)
+        parts = []
+        for future in results:
+            if not future.done():
+                break
+            if future.exception() is None:
+                parts.append(future.result())
+        return " ".join(part for part in parts if part)
+
+
+def start_voice_capture(frames=None, transcribe=transcribe_segment):
+    """Starts recording from the microphone (or the given frames) and returns the capture."""
+    if frames is None:
+        sr.Microphone  # Import speech_recognition here, not on the capture thread
+    return VoiceCapture(frames, transcribe).start()
@@ -0,0 +1,109 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import streamlit as st
+from utils.lazy_imports import lazy_import
+
+wordcloud = lazy_import("wordcloud")
+
+# --- CONSTANTS ---
+WORDCLOUD_WIDTH = 800
+WORDCLOUD_HEIGHT = 400
+WORDCLOUD_MAX_WORDS = 50
+WORDCLOUD_CACHE_SIZE = 128  # images, roughly 30-60 KB each
+RENDER_WORKERS = 2
+# Hiredly blue (#1E90FF is hue 210), in shades from dark to mid
+WORDCLOUD_HUE = 210
+WORDCLOUD_LIGHTNESS = (20, 60)
+
+
+def keyword_key(keywords):
+    """The cache key for a keyword set: order and duplicates do not change the cloud."""
+    joined = "\n".join(sorted({str(keyword) for keyword in keywords}))
+    return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+
+def _blue_shades(word, font_size, position, orientation, random_state=None, **kwargs):
+    return f"hsl({WORDCLOUD_HUE}, 85%, {random_state.randint(*WORDCLOUD_LIGHTNESS)}%)"
+
+def render_wordcloud_png(keywords):
+    """
+    Renders a word cloud of the keywords straight to PNG bytes with Pillow; no
+    matplotlib figure is created. The layout is seeded from the keyword set, so
+    the same keywords always give the same image.
+    """
+    key = keyword_key(keywords)
+    cloud = wordcloud.WordCloud(
+        width=WORDCLOUD_WIDTH,
+        height=WORDCLOUD_HEIGHT,
+        background_color='white',
+        color_func=_blue_shades,
+        max_words=WORDCLOUD_MAX_WORDS,
+        collocations=False,
+        random_state=int(key[:8], 16),
+    ).generate(" ".join(sorted(set(map(str, keywords)))))
+
+    buffer = io.BytesIO()
+    cloud.to_image().save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+class WordCloudRenderer:
+    """
+    Renders word clouds on a small thread pool and keeps the PNGs in an LRU
+    cache keyed by keyword set, shared by all sessions. Concurrent requests for
+    the same keywords share one render.
+    """
+
+    def __init__(self, cache_size=WORDCLOUD_CACHE_SIZE, max_workers=RENDER_WORKERS):
+        self.cache_size = cache_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hiredly-wordcloud")
+        self._cache = OrderedDict()  # keyword key -> PNG bytes
+        self._pending = {}           # keyword key -> Future
+        self._lock = threading.Lock()
+
+    def cached(self, keywords):
+        """The PNG for these keywords if it has been rendered, else None."""
+        key = keyword_key(keywords)
+        with self._lock:
+            png = self._cache.get(key)
+            if png is not None:
+                self._cache.move_to_end(key)
+            return png
+
+    def submit(self, keywords):
+        """Starts rendering these keywords unless cached or in flight. Returns a Future of the PNG."""
+        key = keyword_key(keywords)
+        with self._lock:
+            if key in self._cache:
+                future = Future()
+                future.set_result(self._cache[key])
+                return future
+            future = self._pending.get(key)
+            if future is None:
+                # Finish importing wordcloud (and numpy) on the calling thread: a
+                # half-imported numpy seen from the script thread breaks plotly.
+                wordcloud.WordCloud
+                future = self._executor.submit(self._render, key, list(keywords))
+                self._pending[key] = future
+            return future
+
+    def _render(self, key, keywords):
+        try:
+            png = render_wordcloud_png(keywords)
+            with self._lock:
+                self._cache[key] = png
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return png
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_wordcloud_renderer():
+    """Returns the process-wide word cloud renderer."""
+    return WordCloudRenderer()
@@ -0,0 +1,24 @@
+import pytest
+
+from database import add_user, configure_database, init_db
+from database.connection import get_connection, get_pool
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A migrated database of its own for each test."""
+    configure_database(str(tmp_path / "hiredly.db"))
+    init_db()
+    yield tmp_path / "hiredly.db"
+    get_pool().close_all()
+
+
+def create_user(username):
+    add_user(username, "correct horse battery")
+    with get_connection() as conn:
+        return conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()[0]
+
+
+@pytest.fixture
+def user_id(db):
+    return create_user("ada")
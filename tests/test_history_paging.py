@@ -0,0 +1,52 @@
+from database import list_user_resumes, save_resume
+from database.connection import transaction
+
+from .conftest import create_user
+
+
+def save_analyses(user_id, count):
+    return [save_resume(user_id, {"skills": ["Python"], "summary": f"Analysis {i}"}, "Data Engineer", 50.0 + i)
+            for i in range(count)]
+
+
+def read_all_pages(user_id, limit):
+    pages, cursor = [], None
+    while True:
+        page, cursor = list_user_resumes(user_id, limit=limit, cursor=cursor)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_every_analysis_once_when_timestamps_tie(user_id):
+    ids = save_analyses(user_id, 25)
+    with transaction() as conn:
+        conn.execute("UPDATE resumes SET created_at = '2026-01-05 09:00:00'")
+
+    pages = read_all_pages(user_id, limit=10)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [item["id"] for page in pages for item in page] == sorted(ids, reverse=True)
+
+
+def test_pages_are_most_recent_first(user_id):
+    ids = save_analyses(user_id, 6)
+    with transaction() as conn:
+        conn.executemany("UPDATE resumes SET created_at = ? WHERE id = ?",
+                         [(f"2026-01-0{day} 09:00:00", resume_id) for day, resume_id in zip((3, 1, 6, 2, 5, 4), ids)])
+
+    items = [item for page in read_all_pages(user_id, limit=4) for item in page]
+    assert [item["created_at"][:10] for item in items] == [f"2026-01-0{day}" for day in (6, 5, 4, 3, 2, 1)]
+    assert set(items[0]) == {"id", "created_at", "ats_score"}
+
+
+def test_exact_multiple_of_the_page_size_ends_without_an_empty_page(user_id):
+    save_analyses(user_id, 20)
+    assert [len(page) for page in read_all_pages(user_id, limit=10)] == [10, 10]
+
+
+def test_pages_only_list_the_users_own_analyses(user_id):
+    other_id = create_user("grace")
+    save_analyses(other_id, 3)
+    mine = save_analyses(user_id, 2)
+    assert [item["id"] for item in list_user_resumes(user_id)[0]] == sorted(mine, reverse=True)
+    assert list_user_resumes(create_user("linus")) == ([], None)
@@ -0,0 +1,105 @@
+import json
+import sqlite3
+
+import pytest
+
+from database import configure_database, get_resume_details, get_score_trends, init_db, search_user_resumes
+from database import migrations
+from database.connection import get_connection, get_pool
+from database.migrations import MIGRATIONS, Migration, apply_migrations, get_schema_version
+
+LEGACY_ROWS = [
+    # id, user_id, resume_data, job_description, ats_score, created_at
+    (1, 1, {"skills": ["Python", "Airflow"], "summary": "Pipelines"}, "Data Engineer\nAcme", 62.0, "2025-03-03 10:00:00"),
+    (2, 1, {"skills": ["React"], "summary": "Interfaces"}, "Frontend Developer", 71.5, "2025-03-05 10:00:00"),
+    (5, 1, {"skills": ["Python", "dbt"], "summary": "Models"}, "Data Engineer\nGlobex", 80.0, "2025-03-12 10:00:00"),
+    (7, 2, {"skills": ["Go"], "summary": "Services"}, None, 55.0, "2025-03-12 11:00:00"),
+]
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A database in the original, pre-migration layout: JSON text and the full job description per row."""
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("""
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL
+        )
+        """)
+        conn.execute("""
+        CREATE TABLE resumes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            resume_data TEXT NOT NULL,
+            job_description TEXT,
+            ats_score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        """)
+        conn.executemany("INSERT INTO users (id, username, password_hash) VALUES (?, ?, 'x')", [(1, "ada"), (2, "grace")])
+        conn.executemany("INSERT INTO resumes VALUES (?, ?, ?, ?, ?, ?)",
+                         [(rid, uid, json.dumps(data), jd, score, at) for rid, uid, data, jd, score, at in LEGACY_ROWS])
+    conn.close()
+    configure_database(str(path))
+    yield path
+    get_pool().close_all()
+
+
+def test_legacy_database_is_brought_to_the_latest_version(legacy_db):
+    init_db()
+    with get_connection() as conn:
+        assert get_schema_version(conn) == MIGRATIONS[-1].version
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(resumes)")}
+        assert "resume_blob" in columns and "resume_data" not in columns
+        assert conn.execute("SELECT COUNT(*) FROM job_descriptions").fetchone()[0] == 3
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'resumes_legacy'").fetchone() is None
+
+
+def test_legacy_rows_keep_their_ids_timestamps_and_content(legacy_db):
+    init_db()
+    with get_connection() as conn:
+        rows = conn.execute("SELECT id, user_id, ats_score, created_at FROM resumes ORDER BY id").fetchall()
+    assert rows == [(rid, uid, score, at) for rid, uid, _, _, score, at in LEGACY_ROWS]
+    for rid, uid, data, jd, _, _ in LEGACY_ROWS:
+        assert get_resume_details(uid, rid) == {"resume_data": data, "job_description": jd}
+
+
+def test_legacy_rows_are_searchable_and_aggregated(legacy_db):
+    init_db()
+    assert [item["id"] for item in search_user_resumes(1, "python")[0]] == [5, 1]
+    assert search_user_resumes(2, "python") == ([], None)
+
+    trends = get_score_trends(1)
+    assert sum(week["analyses"] for week in trends["weekly"]) == 3
+    assert {role["role"]: role["analyses"] for role in trends["roles"]} == {"Data Engineer": 2, "Frontend Developer": 1}
+    assert trends["roles"][0]["best_score"] == 80.0
+
+
+def test_migrations_apply_once(legacy_db):
+    with get_connection() as conn:
+        assert apply_migrations(conn) == MIGRATIONS[-1].version
+        applied = conn.execute("SELECT version FROM schema_version ORDER BY version").fetchall()
+        assert apply_migrations(conn) == MIGRATIONS[-1].version
+        assert conn.execute("SELECT version FROM schema_version ORDER BY version").fetchall() == applied
+        assert conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0] == len(LEGACY_ROWS)
+
+
+def test_failed_migration_rolls_back_and_can_be_retried(legacy_db, monkeypatch):
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", MIGRATIONS[:2] + [Migration(3, "broken", broken)])
+    with get_connection() as conn:
+        with pytest.raises(RuntimeError):
+            apply_migrations(conn)
+        assert get_schema_version(conn) == 2
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", MIGRATIONS)
+    with get_connection() as conn:
+        assert apply_migrations(conn) == MIGRATIONS[-1].version
@@ -0,0 +1,77 @@
+import io
+import json
+import zipfile
+
+from services.package_writer import PackageMember, stream_package, write_package
+from services.resume_generator import stream_resume_package
+
+RESUME = {
+    "name": "Ada Lovelace",
+    "email": "ada@example.com",
+    "summary": "Analytical engineer.",
+    "skills": ["Python", "SQL"],
+}
+
+
+def open_zip(chunks):
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+def test_members_keep_order_content_and_compression():
+    members = [
+        PackageMember("bytes.bin", lambda: b"\x00\x01" * 100_000, False),
+        PackageMember("text.txt", lambda: "héllo " * 1000),
+        PackageMember("file.txt", lambda: io.StringIO("from a file object")),
+        PackageMember("chunks.txt", lambda: iter([b"one ", "two ", b"three"])),
+        PackageMember("empty.txt", lambda: None),
+    ]
+    with open_zip(stream_package(members, chunk_size=4096)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [member.arcname for member in members]
+        assert archive.read("bytes.bin") == b"\x00\x01" * 100_000
+        assert archive.read("text.txt").decode("utf-8") == "héllo " * 1000
+        assert archive.read("file.txt") == b"from a file object"
+        assert archive.read("chunks.txt") == b"one two three"
+        assert archive.read("empty.txt") == b""
+        assert archive.getinfo("bytes.bin").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("text.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_producers_run_one_member_at_a_time():
+    produced = []
+
+    def producer(name):
+        def produce():
+            produced.append(name)
+            return name.encode() * 1000
+        return produce
+
+    stream = stream_package(PackageMember(name, producer(name)) for name in ("a", "b", "c"))
+    next(stream)
+    assert produced == ["a"]
+    chunks = list(stream)
+    assert produced == ["a", "b", "c"]
+    assert chunks
+
+
+def test_write_package_reports_bytes_written():
+    members = [PackageMember("a.txt", lambda: "alpha" * 5000), PackageMember("b.txt", lambda: "beta")]
+    buffer = io.BytesIO()
+    assert write_package(members, buffer) == len(buffer.getvalue())
+    with zipfile.ZipFile(buffer) as archive:
+        assert archive.read("b.txt") == b"beta"
+
+
+def test_resume_package_layout():
+    chunks = stream_resume_package(RESUME, "modern", cover_letter="Dear team,", extra_templates=("creative",))
+    with open_zip(chunks) as archive:
+        assert archive.namelist() == [
+            "Hiredly_Resume.pdf", "Hiredly_Resume_creative.pdf", "Hiredly_Resume.docx", "Hiredly_Resume.html",
+            "Cover_Letter.txt", "resume_data.json", "README.txt",
+        ]
+        assert archive.read("Hiredly_Resume.pdf").startswith(b"%PDF")
+        assert archive.read("Hiredly_Resume.docx").startswith(b"PK")
+        assert archive.getinfo("Hiredly_Resume.pdf").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("Hiredly_Resume.docx").compress_type == zipfile.ZIP_STORED
+        assert archive.read("Cover_Letter.txt") == b"Dear team,"
+        assert json.loads(archive.read("resume_data.json")) == RESUME
@@ -0,0 +1,54 @@
+import pytest
+from reportlab.platypus import Paragraph
+
+from services.pdf_fastpath import FRAME_WIDTH, FastPathOverflow, FontMetrics, render_fast_pdf
+from services.resume_generator import PDF_SECTION_MAP, create_enhanced_pdf_resume, get_template_styles
+
+STYLES = get_template_styles("professional")
+
+SIMPLE_RESUME = {
+    "name": "Ada Lovelace",
+    "email": "ada@example.com",
+    "phone": "555-0100",
+    "summary": "Analytical engineer who turns ambiguous problems into reliable systems.",
+    "skills": ["Python", "SQL", "Airflow", "Docker", "AWS"],
+    "experience": ["Built a data pipeline serving 40 analysts.", "Cut report latency by 60%."],
+}
+
+
+def render(resume):
+    return render_fast_pdf(resume, STYLES, PDF_SECTION_MAP)
+
+
+def test_simple_resume_takes_the_fast_path():
+    assert render(SIMPLE_RESUME).getvalue().startswith(b"%PDF")
+
+
+@pytest.mark.parametrize("change", [
+    {"summary": "Led R&D for <b>three</b> products."},
+    {"summary": "See https://example.com/" + "a" * 200},
+    {"skills": ["Python", "Distributed systems observability and reliability engineering"]},
+    {"skills": ["Python", "SQL\nNoSQL"]},
+    {"experience": [f"Achievement number {i} with enough words to need a full line." for i in range(80)]},
+], ids=["markup", "long word", "wide cell", "multi-line cell", "second page"])
+def test_content_the_fast_path_cannot_draw_overflows(change):
+    with pytest.raises(FastPathOverflow):
+        render({**SIMPLE_RESUME, **change})
+
+
+def test_overflowing_resume_falls_back_to_platypus():
+    resume = {**SIMPLE_RESUME, "summary": "See https://example.com/" + "a" * 200}
+    assert create_enhanced_pdf_resume(resume).getvalue().startswith(b"%PDF")
+
+
+@pytest.mark.parametrize("words", [8, 40, 120])
+def test_wrap_breaks_lines_like_platypus(words):
+    text = " ".join((["Reliable", "pipelines", "for", "analytics", "teams,", "shipped", "weekly."] * words)[:words])
+    style = STYLES["normal"]
+    metrics = FontMetrics.get(style.fontName, style.fontSize)
+    fast_lines = metrics.wrap(text.split(), FRAME_WIDTH, style.spaceShrinkage)
+
+    paragraph = Paragraph(text, style)
+    paragraph.wrap(FRAME_WIDTH, 10_000)
+    # Plain-text paragraphs break into (extra space, words) lines
+    assert [words for words, _ in fast_lines] == [words for _, words in paragraph.blPara.lines]
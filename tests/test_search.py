@@ -0,0 +1,64 @@
+from database import SEARCH_CANDIDATE_LIMIT, save_resume, search_is_truncated, search_user_resumes
+from database.connection import transaction
+from database.db_manager import INSERT_SEARCH_SQL
+from database.search import build_match_query, search_document
+
+from .conftest import create_user
+
+
+def save(user_id, skills, job_description="Data Engineer", summary=""):
+    return save_resume(user_id, {"skills": skills, "summary": summary}, job_description, 60.0)
+
+
+def read_all_pages(user_id, query, limit):
+    items, offset = [], 0
+    while offset is not None:
+        page, offset = search_user_resumes(user_id, query, limit=limit, offset=offset)
+        items.extend(page)
+    return items
+
+
+def test_equal_ranks_page_without_duplicates_newest_first(user_id):
+    ids = [save(user_id, ["Python", "SQL"]) for _ in range(25)]
+    items = read_all_pages(user_id, "python", limit=10)
+    assert [item["id"] for item in items] == sorted(ids, reverse=True)
+
+
+def test_job_description_matches_rank_first(user_id):
+    in_skills = save(user_id, ["Kafka"], job_description="Backend Engineer")
+    in_posting = save(user_id, ["Python"], job_description="Kafka Platform Engineer")
+    in_summary = save(user_id, ["Python"], job_description="Backend Engineer", summary="Ran Kafka clusters")
+    assert [item["id"] for item in search_user_resumes(user_id, "kafka")[0]] == [in_posting, in_skills, in_summary]
+
+
+def test_every_word_must_match_and_the_last_is_a_prefix(user_id):
+    both = save(user_id, ["Python", "Airflow"])
+    save(user_id, ["Python"])
+    assert [item["id"] for item in search_user_resumes(user_id, "python airf")[0]] == [both]
+
+
+def test_search_is_scoped_to_the_user(user_id):
+    save(create_user("grace"), ["Python"])
+    assert search_user_resumes(user_id, "python") == ([], None)
+
+
+def test_queries_without_words_or_with_fts_syntax_are_safe(user_id):
+    resume_id = save(user_id, ["C++", "Rust"])
+    assert search_user_resumes(user_id, "  ?! ") == ([], None)
+    assert build_match_query(user_id, "") is None
+    assert [item["id"] for item in search_user_resumes(user_id, 'c++ ("rust*')[0]] == [resume_id]
+    # Operators are plain words, so "OR" must appear in the analysis like any other word
+    assert search_user_resumes(user_id, "java OR rust") == ([], None)
+
+
+def test_truncation_is_reported_past_the_candidate_limit(user_id):
+    document = search_document(user_id, {"skills": ["Python"]}, "Data Engineer")
+    with transaction() as conn:
+        conn.executemany(INSERT_SEARCH_SQL, [(rowid, *document) for rowid in range(1, SEARCH_CANDIDATE_LIMIT + 1)])
+    assert not search_is_truncated(user_id, "python")
+
+    with transaction() as conn:
+        conn.execute(INSERT_SEARCH_SQL, (SEARCH_CANDIDATE_LIMIT + 1, *document))
+    assert search_is_truncated(user_id, "python")
+    assert not search_is_truncated(user_id, "java")
+    assert not search_is_truncated(user_id, "")
@@ -0,0 +1,102 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from database import (HistoryImportError, authenticate_user, configure_database, export_history, get_score_trends,
+                      get_user_resumes, import_history, init_db, save_resume, search_user_resumes)
+
+from .conftest import create_user
+
+
+def save_history(user_id, count, role="Data Engineer"):
+    for i in range(count):
+        save_resume(user_id, {"name": "Ada", "skills": ["Python", f"Skill{i}"], "summary": "Pipelines"},
+                    f"{role}\nTeam {i % 3}", 50.0 + i)
+
+
+def export(user_id=None):
+    buffer = io.BytesIO()
+    export_history(buffer, user_id)
+    buffer.seek(0)
+    return buffer
+
+
+def switch_database(tmp_path, name):
+    configure_database(str(tmp_path / name))
+    init_db()
+
+
+def snapshot(user_id):
+    return get_user_resumes(user_id), get_score_trends(user_id), search_user_resumes(user_id, "python skill2")[0]
+
+
+def test_full_export_round_trips_into_an_empty_database(db, tmp_path):
+    ada, grace = create_user("ada"), create_user("grace")
+    save_history(ada, 7)
+    save_history(grace, 3, role="Frontend Developer")
+    before = snapshot(ada), snapshot(grace)
+    assert all(trends["roles"] and found for _, trends, found in before)
+    dump = export()
+
+    switch_database(tmp_path, "restored.db")
+    assert import_history(dump) == 10
+    restored = [authenticate_user(username, "correct horse battery") for username in ("ada", "grace")]
+    assert tuple(snapshot(user_id) for user_id in restored) == before
+
+
+def test_importing_twice_adds_nothing_the_second_time(db):
+    user_id = create_user("ada")
+    save_history(user_id, 5)
+    dump = export().getvalue()
+
+    assert import_history(io.BytesIO(dump)) == 0
+    assert len(get_user_resumes(user_id)) == 5
+    assert get_score_trends(user_id)["weekly"][-1]["analyses"] == 5
+
+
+def test_duplicate_lines_within_one_file_are_imported_once(db, tmp_path):
+    user_id = create_user("ada")
+    save_history(user_id, 2)
+    lines = gzip.decompress(export(user_id).read()).decode("utf-8").splitlines()
+    doubled = io.BytesIO(gzip.compress("\n".join(lines + lines[1:]).encode("utf-8")))
+
+    switch_database(tmp_path, "target.db")
+    target = create_user("grace")
+    assert import_history(doubled, target_user_id=target) == 2
+
+
+def test_user_export_imports_into_the_target_account(db):
+    ada, grace = create_user("ada"), create_user("grace")
+    save_history(ada, 4)
+    assert import_history(export(ada), target_user_id=grace) == 4
+    assert [r["resume_data"] for r in get_user_resumes(grace)] == [r["resume_data"] for r in get_user_resumes(ada)]
+
+
+def test_failed_import_resumes_from_its_checkpoint(db, tmp_path):
+    user_id = create_user("ada")
+    save_history(user_id, 9)
+    expected = get_user_resumes(user_id)
+    lines = gzip.decompress(export().read()).decode("utf-8").splitlines()
+    broken = list(lines)
+    broken[5] = "{not json"
+
+    switch_database(tmp_path, "restored.db")
+    checkpoints = []
+    with pytest.raises(HistoryImportError) as failure:
+        import_history(io.BytesIO(gzip.compress("\n".join(broken).encode())), chunk_size=4,
+                       on_checkpoint=checkpoints.append)
+    assert checkpoints == [4] and failure.value.committed_lines == 4
+
+    resumed = import_history(io.BytesIO(gzip.compress("\n".join(lines).encode())), chunk_size=4,
+                             start_line=failure.value.committed_lines)
+    restored = authenticate_user("ada", "correct horse battery")
+    assert resumed + 2 == 9  # The first chunk held the header, the account and two analyses
+    assert get_user_resumes(restored) == expected
+
+
+def test_newer_export_format_is_rejected(db):
+    newer = json.dumps({"type": "header", "format_version": 99})
+    with pytest.raises(HistoryImportError, match="newer"):
+        import_history(io.BytesIO(gzip.compress(newer.encode())))
@@ -0,0 +1,137 @@
+import time
+
+import numpy as np
+import pytest
+
+from services.voice_input import (CALIBRATION_S, DONE, END_OF_SPEECH_S, FRAME_SAMPLES, MAX_SEGMENT_S, MIN_SEGMENT_S,
+                                  PRE_ROLL_S, SAMPLE_RATE, SAMPLE_WIDTH, SEGMENT_PAUSE_S, START_TIMEOUT_S,
+                                  SpeechSegmenter, start_voice_capture)
+
+FRAME_S = FRAME_SAMPLES / SAMPLE_RATE
+FRAME_BYTES = FRAME_SAMPLES * SAMPLE_WIDTH
+RNG = np.random.default_rng(7)
+
+
+def frame_count(seconds):
+    return max(1, round(seconds / FRAME_S))
+
+
+def silence(seconds):
+    return [RNG.normal(0, 80, FRAME_SAMPLES).astype(np.int16).tobytes() for _ in range(frame_count(seconds))]
+
+
+def speech(seconds, amplitude=4000):
+    t = np.arange(FRAME_SAMPLES) / SAMPLE_RATE
+    tone = (amplitude * np.sin(2 * np.pi * 250 * t)).astype(np.int16).tobytes()
+    return [tone] * frame_count(seconds)
+
+
+def segment(frames):
+    """Feeds frames after the calibration period. Returns the segmenter and the segments it completed."""
+    segmenter = SpeechSegmenter()
+    completed = []
+    for frame in silence(CALIBRATION_S) + frames:
+        completed.extend(segmenter.feed(frame))
+    return segmenter, completed
+
+
+def test_calibration_sets_the_threshold_above_the_noise_floor():
+    segmenter, completed = segment([])
+    assert completed == [] and segmenter.threshold is not None
+    assert not segmenter.ended and not segmenter.heard_speech
+
+
+def test_a_pause_closes_a_segment_including_its_onset():
+    segmenter, completed = segment(silence(1.0) + speech(1.0) + silence(SEGMENT_PAUSE_S + 0.2))
+    frames = frame_count(PRE_ROLL_S) + frame_count(1.0) + frame_count(SEGMENT_PAUSE_S)
+    assert [len(pcm) for pcm in completed] == [frames * FRAME_BYTES]
+    assert segmenter.heard_speech and not segmenter.ended
+
+
+def test_short_gaps_stay_in_one_segment_and_pauses_split():
+    short_gap = speech(1.0) + silence(SEGMENT_PAUSE_S / 2) + speech(1.0)
+    _, completed = segment(short_gap + silence(SEGMENT_PAUSE_S + 0.2) + speech(1.0) + silence(SEGMENT_PAUSE_S + 0.2))
+    assert len(completed) == 2
+
+
+def test_long_speech_is_cut_at_the_maximum_segment_length():
+    _, completed = segment(speech(2.5 * MAX_SEGMENT_S))
+    assert len(completed) == 2
+    assert all(len(pcm) <= frame_count(MAX_SEGMENT_S) * FRAME_BYTES for pcm in completed)
+
+
+def test_bursts_shorter_than_the_minimum_are_dropped():
+    segmenter, completed = segment(speech(MIN_SEGMENT_S / 2) + silence(SEGMENT_PAUSE_S + 0.2))
+    assert completed == [] and segmenter.heard_speech
+
+
+def test_silence_after_speech_ends_the_recording_and_flushes():
+    segmenter, completed = segment(speech(1.0) + silence(END_OF_SPEECH_S + 0.2))
+    assert segmenter.ended and len(completed) == 1
+
+
+def test_no_speech_ends_at_the_start_timeout():
+    segmenter = SpeechSegmenter()
+    fed = 0
+    for frame in silence(START_TIMEOUT_S + 1.0):
+        assert segmenter.feed(frame) == []
+        fed += 1
+        if segmenter.ended:
+            break
+    assert segmenter.ended and not segmenter.heard_speech
+    assert fed == frame_count(START_TIMEOUT_S)
+
+
+def test_flush_returns_the_segment_in_progress():
+    segmenter, completed = segment(speech(1.0))
+    assert completed == []
+    assert len(segmenter.flush()) == 1
+    assert segmenter.flush() == []
+
+
+def wait_until_finished(capture, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not capture.finished:
+        assert time.monotonic() < deadline, "capture did not finish"
+        time.sleep(0.01)
+
+
+def test_capture_joins_segment_transcripts_in_order():
+    # Each sentence is spoken at its own loudness, which tells the fake recogniser which one it got
+    words = {3000: ("first", 0.2), 4000: ("second", 0.0), 5000: ("third", 0.1)}  # Later ones finish first
+    spoken = silence(CALIBRATION_S)
+    for amplitude in words:
+        spoken += speech(1.0, amplitude) + silence(SEGMENT_PAUSE_S + 0.2)
+    spoken += silence(END_OF_SPEECH_S)
+
+    def transcribe(pcm):
+        word, delay = words[int(np.frombuffer(pcm, dtype=np.int16).max()) // 1000 * 1000]
+        time.sleep(delay)
+        return word
+
+    capture = start_voice_capture(iter(spoken), transcribe)
+    wait_until_finished(capture)
+    assert capture.status == DONE and capture.error is None
+    assert capture.text() == "first second third"
+
+
+def test_failed_segment_is_reported_and_the_rest_kept():
+    spoken = silence(CALIBRATION_S) + speech(1.0, 3000) + silence(SEGMENT_PAUSE_S + 0.2) + speech(1.0, 5000)
+
+    def transcribe(pcm):
+        if np.frombuffer(pcm, dtype=np.int16).max() > 4000:
+            raise RuntimeError("quota exceeded")
+        return "kept"
+
+    capture = start_voice_capture(iter(spoken), transcribe)
+    wait_until_finished(capture)
+    assert "quota exceeded" in capture.error
+    assert capture.text() == "kept"
+
+
+@pytest.mark.parametrize("frames", [[], silence(CALIBRATION_S + 1.0)])
+def test_capture_without_speech_reports_it(frames):
+    capture = start_voice_capture(iter(frames), lambda pcm: pytest.fail("nothing to transcribe"))
+    wait_until_finished(capture)
+    assert capture.error == "No speech detected. Please try again."
+    assert capture.text() == ""
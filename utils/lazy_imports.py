@@ -0,0 +1,40 @@
+import importlib
+import sys
+import threading
+
+
+class LazyModule:
+    """
+    Stands in for a module until one of its attributes is first used.
+
+    Heavy optional dependencies (plotting, audio, document parsing, the Gemini
+    SDK) are bound at module top through lazy_import(), so code reads as
+    usual, but the import cost is only paid by the request that actually needs
+    the library rather than by every cold start.
+    """
+
+    __slots__ = ("_name", "_module", "_lock")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """Returns the module if it is already imported, otherwise a LazyModule for it."""
+    return sys.modules.get(name) or LazyModule(name)
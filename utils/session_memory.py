@@ -0,0 +1,168 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from .session_records import deep_sizeof
+
+# --- CONSTANTS ---
+SESSION_MEMORY_BUDGET_BYTES = int(os.environ.get("HIREDLY_SESSION_BUDGET_KB", "256")) * 1024
+SHARED_ARTIFACT_CACHE_BYTES = int(os.environ.get("HIREDLY_SHARED_ARTIFACT_CACHE_MB", "64")) * 1024 * 1024
+# Sessions that have not run for this long are dropped from the admin readout
+SESSION_STALE_AFTER_S = 1800
+
+# Session keys whose values can be produced again (by the AI, or on request),
+# so an over-budget session may hand them to the shared cache. Listed roughly
+# from least to most used; within the budget check the largest go first.
+REGENERABLE_KEYS = (
+    "cover_letter",
+    "linkedin_summary",
+    "last_feedback",
+    "practice_feedback",
+    "course_recommendations",
+    "interview_questions",
+)
+# Per-session caches of database rows, simply emptied when over budget
+DATABASE_CACHE_KEYS = ("history_details",)
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactRef:
+    """Stands in session state for a value moved to the shared artifact cache."""
+    key: str
+    nbytes: int
+
+
+class SharedArtifactCache:
+    """
+    A process-wide LRU of evicted session artifacts, bounded in bytes.
+
+    Values are immutable (strings, tuples of frozen records) and stored under
+    a digest of their contents, so identical artifacts from many sessions,
+    e.g. the same generated questions for the same job, are held once.
+    """
+
+    def __init__(self, max_bytes=SHARED_ARTIFACT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def put(self, value):
+        """Stores value and returns the reference a session keeps instead."""
+        key = hashlib.sha256(repr(value).encode("utf-8")).hexdigest()
+        nbytes = deep_sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._entries[key] = (value, nbytes)
+                self.bytes += nbytes
+                while self.bytes > self.max_bytes and len(self._entries) > 1:
+                    _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                    self.bytes -= evicted_bytes
+        return ArtifactRef(key, nbytes)
+
+    def get(self, ref):
+        """The value behind ref, or None once it has been evicted from here too."""
+        with self._lock:
+            entry = self._entries.get(ref.key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(ref.key)
+            return entry[0]
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits, "misses": self.misses}
+
+
+class SessionMemoryRegistry:
+    """Bytes held by each live session, as last measured, for the admin readout."""
+
+    def __init__(self, stale_after=SESSION_STALE_AFTER_S):
+        self.stale_after = stale_after
+        self._sessions = {}  # session id -> dict
+        self._lock = threading.Lock()
+
+    def record(self, session_id, username, nbytes, evicted):
+        with self._lock:
+            self._sessions[session_id] = {
+                "session": session_id[:8],
+                "username": username,
+                "bytes": nbytes,
+                "evicted_artifacts": evicted,
+                "last_seen": time.time(),
+            }
+
+    def snapshot(self):
+        """Live sessions, largest first. Stale ones are dropped on the way."""
+        cutoff = time.time() - self.stale_after
+        with self._lock:
+            for session_id in [sid for sid, entry in self._sessions.items() if entry["last_seen"] < cutoff]:
+                del self._sessions[session_id]
+            entries = [dict(entry) for entry in self._sessions.values()]
+        return sorted(entries, key=lambda entry: entry["bytes"], reverse=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_artifact_cache():
+    """Returns the process-wide cache that over-budget sessions evict to."""
+    return SharedArtifactCache()
+
+@st.cache_resource(show_spinner=False)
+def get_session_registry():
+    """Returns the process-wide per-session memory registry."""
+    return SessionMemoryRegistry()
+
+
+def session_bytes():
+    """Bytes held by this session's state, with a per-key breakdown."""
+    seen = set()
+    sizes = {key: deep_sizeof(value, seen) for key, value in st.session_state.items()}
+    return sum(sizes.values()), sizes
+
+def enforce_session_budget(budget=SESSION_MEMORY_BUDGET_BYTES):
+    """
+    Keeps this session's state within budget and records its size for the
+    admin readout. Over budget, regenerable artifacts are moved to the shared
+    cache, largest first, and per-session database caches are emptied.
+    Returns the bytes the session holds afterwards.
+
+    Runs once per script run: main_app, the sidebar and individual pages all
+    call it, and later calls in the same run return the first result.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    # Streamlit gives every run (and fragment rerun) a fresh cursors dict on the same context
+    run = ctx.cursors if ctx is not None else None
+    last = getattr(ctx, "_hiredly_budget_run", None)
+    if run is not None and last is not None and last[0] is run:
+        return last[1]
+
+    total, sizes = session_bytes()
+    if total > budget:
+        cache = get_artifact_cache()
+        candidates = [key for key in REGENERABLE_KEYS + DATABASE_CACHE_KEYS
+                      if st.session_state.get(key) and not isinstance(st.session_state[key], ArtifactRef)]
+        for key in sorted(candidates, key=sizes.get, reverse=True):
+            if total <= budget:
+                break
+            if key in DATABASE_CACHE_KEYS:
+                st.session_state[key] = {}
+            else:
+                st.session_state[key] = cache.put(st.session_state[key])
+            total -= sizes[key]
+
+    if ctx is not None:
+        ctx._hiredly_budget_run = (run, total)
+        evicted = sum(isinstance(st.session_state.get(key), ArtifactRef) for key in REGENERABLE_KEYS)
+        get_session_registry().record(ctx.session_id, st.session_state.get("username", ""), total, evicted)
+    return total
@@ -0,0 +1,126 @@
+import sys
+from dataclasses import dataclass, field, fields, is_dataclass
+
+
+def _interned(default=()):
+    """Marks a field whose strings are interned, so every session shares one copy of e.g. "Python"."""
+    return field(default=default, metadata={"intern": True})
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeRecord:
+    """The structured resume the parser extracted, as held in session state."""
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    summary: str = ""
+    skills: tuple = _interned()
+    experience: tuple = ()
+    education: tuple = ()
+    certifications: tuple = ()
+    projects: tuple = ()
+    extra: tuple = ()  # (key, value) pairs the parser returned beyond the fields above
+
+
+@dataclass(frozen=True, slots=True)
+class ATSRecord:
+    """One ATS analysis result."""
+    ats_score: float = 0
+    keyword_match_percentage: float = 0
+    formatting_score: float = 0
+    content_relevance_score: float = 0
+    missing_critical_keywords: tuple = _interned()
+    strengths: tuple = ()
+    improvement_areas: tuple = ()
+    extra: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionRecord:
+    """One generated interview question."""
+    question: str = ""
+    category: str = _interned("")
+    tips: str = ""
+    extra: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class CourseRecord:
+    """One recommended course."""
+    course_name: str = ""
+    provider: str = _interned("")
+    reason: str = ""
+    skill_gap: str = _interned("")
+    duration: str = ""
+    extra: tuple = ()
+
+
+def _as_tuple(value, intern=False):
+    if value is None:
+        return ()
+    items = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+    if intern:
+        items = tuple(sys.intern(item) if isinstance(item, str) else item for item in items)
+    return items
+
+def from_dict(record_type, data):
+    """
+    Builds a record from the JSON dict the AI helper returned. List fields become
+    tuples; keys the record has no field for are kept in 'extra', so the
+    conversion loses nothing.
+    """
+    values, known = {}, set()
+    for f in fields(record_type):
+        if f.name == "extra":
+            continue
+        known.add(f.name)
+        if f.name not in data:
+            continue
+        if f.default == ():
+            values[f.name] = _as_tuple(data[f.name], intern=f.metadata.get("intern", False))
+        elif isinstance(data[f.name], str):
+            values[f.name] = sys.intern(data[f.name]) if f.metadata.get("intern") else data[f.name]
+        else:
+            values[f.name] = data[f.name]
+    values["extra"] = tuple((key, value) for key, value in data.items() if key not in known)
+    return record_type(**values)
+
+def as_dict(record):
+    """The plain dict form of a record, as the pages, templates and prompts expect it."""
+    data = {}
+    for f in fields(record):
+        value = getattr(record, f.name)
+        if f.name == "extra":
+            data.update(value)
+        else:
+            data[f.name] = list(value) if f.default == () else value
+    return data
+
+
+# --- SIZE ACCOUNTING ---
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+def deep_sizeof(obj, seen=None):
+    """
+    Approximate bytes held by obj and everything it references. Objects reached
+    twice are counted once. Interned strings are counted too, even though
+    sessions share them, so the figure errs on the high side.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, _ATOMIC_TYPES):
+        return size
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif is_dataclass(obj):
+        size += sum(deep_sizeof(getattr(obj, f.name), seen) for f in fields(obj))
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    return size
@@ -1,5 +1,21 @@
+from dataclasses import is_dataclass
+
 import streamlit as st
-import google.generativeai as genai
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from services.gemini_client import get_gemini_client
+from database import load_analysis_checkpoint
+from .session_records import ResumeRecord, ATSRecord, QuestionRecord, CourseRecord, from_dict, as_dict
+from .session_memory import ArtifactRef, get_artifact_cache
+
+# Session keys held as compact records rather than the AI helper's raw JSON
+RECORD_TYPES = {
+    "resume_data": ResumeRecord,
+    "ats_analysis_results": ATSRecord,
+}
+RECORD_LIST_TYPES = {
+    "interview_questions": QuestionRecord,
+    "course_recommendations": CourseRecord,
+}
 
 def initialize_session_state():
     """
@@ -7,7 +23,8 @@ def initialize_session_state():
 
     This function should be called once per session, typically after a user
     successfully logs in. It sets up the Gemini API connection and default
-    values for the app's state.
+    values for the app's state. The Gemini client itself is shared by all
+    sessions; a session only records that it is available.
     """
     # Use a flag to ensure this runs only once per session
     if 'initialized' in st.session_state:
@@ -18,11 +35,10 @@ def initialize_session_state():
         # Best practice: Use Streamlit secrets to store the API key
         # Create a file .streamlit/secrets.toml and add:
         # GEMINI_API_KEY = "YOUR_API_KEY"
-        api_key = st.secrets["GEMINI_API_KEY"]
-        genai.configure(api_key=api_key)
-        
-        # Store the initialized model in the session state for reuse
-        st.session_state.gemini_model = genai.GenerativeModel('gemini-2.5-flash')
+        # The client is configured once per server process and cached; later
+        # sessions get the same instance back without any setup cost.
+        get_gemini_client()
+        st.session_state.gemini_ready = True
         st.toast("✅ Gemini AI Connected!", icon="🤖")
 
     except Exception as e:
@@ -34,11 +50,13 @@ def initialize_session_state():
     # These variables will hold data as the user navigates through the pages.
     
     # Data structures
-    st.session_state.resume_data = {}
+    # The structured results are held as compact records (see utils/session_records.py);
+    # read and write them through get_record() and set_record().
+    st.session_state.resume_data = None
     st.session_state.job_description = ""
     st.session_state.ats_analysis_results = None
-    st.session_state.course_recommendations = []
-    st.session_state.interview_questions = []
+    st.session_state.course_recommendations = ()
+    st.session_state.interview_questions = ()
 
     # UI and control states
     st.session_state.ats_score = 0
@@ -47,6 +65,71 @@ def initialize_session_state():
     st.session_state.linkedin_summary = ""
     st.session_state.current_mock_question = None
     st.session_state.last_feedback = ""
+    st.session_state.practice_answers = {}   # question -> answer, for the practice round
+    st.session_state.practice_feedback = ()
+
+    # --- 3. RESTORE THE LAST ANALYSIS ---
+    # A reconnect or server restart loses session state; pick the user's latest
+    # results back up from the database instead of repeating the AI calls.
+    checkpoint = load_analysis_checkpoint(st.session_state.user_id)
+    if checkpoint:
+        apply_analysis_results(checkpoint)
 
     # Set the flag to indicate that initialization is complete
-    st.session_state.initialized = True
\ No newline at end of file
+    st.session_state.initialized = True
+
+
+# --- SESSION RECORDS ---
+def set_record(key, value):
+    """
+    Stores a result in session state in its compact form: resume and ATS dicts
+    become frozen records, question and course lists become tuples of records,
+    and anything else (e.g. generated text) is stored as is.
+    """
+    if value and key in RECORD_TYPES:
+        value = from_dict(RECORD_TYPES[key], value)
+    elif value and key in RECORD_LIST_TYPES:
+        value = tuple(from_dict(RECORD_LIST_TYPES[key], item) for item in value if isinstance(item, dict))
+    st.session_state[key] = value
+
+def get_record(key, default=None):
+    """
+    Returns a result stored with set_record() in the plain form the pages use
+    (dicts and lists of dicts), following it into the shared cache if the
+    session's memory budget moved it there. An artifact the shared cache has
+    since dropped reads as missing, so the page offers to generate it again.
+    """
+    value = st.session_state.get(key)
+    if isinstance(value, ArtifactRef):
+        value = get_artifact_cache().get(value)
+        if value is None:
+            del st.session_state[key]
+    if not value:
+        return default
+    # Values stored before records were introduced are already plain
+    if key in RECORD_TYPES:
+        return as_dict(value) if is_dataclass(value) else value
+    if key in RECORD_LIST_TYPES:
+        return [as_dict(item) if is_dataclass(item) else item for item in value]
+    return value
+
+def apply_analysis_results(results):
+    """Puts the results of a Dashboard analysis (fresh or restored) into session state."""
+    set_record('resume_data', results['resume_data'])
+    st.session_state.job_description = results['job_description']
+    set_record('ats_analysis_results', results['ats'])
+    st.session_state.ats_score = results['ats_score']
+    set_record('interview_questions', results['questions'])
+    set_record('course_recommendations', results['courses'])
+
+def release_uploaded_file(uploaded_file, generation_key):
+    """
+    Frees an uploaded file once its text has been extracted. Streamlit otherwise
+    keeps the file's bytes for the rest of the session. The uploader's key is
+    built from the counter at generation_key; bumping it brings the widget
+    back empty on the next run.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and uploaded_file is not None:
+        ctx.uploaded_file_mgr.remove_file(ctx.session_id, uploaded_file.file_id)
+    st.session_state[generation_key] = st.session_state.get(generation_key, 0) + 1
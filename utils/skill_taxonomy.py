@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+OTHER_CATEGORY = "Other"
+
+# Category -> lowercase skills and keywords that place a skill in it. A skill
+# is matched whole first, then word by word (and by adjacent word pairs), so
+# "AWS Lambda" lands in Cloud & DevOps and "SQL query tuning" in Data.
+SKILL_CATEGORIES = {
+    "Programming Languages": [
+        "python", "java", "javascript", "typescript", "go", "golang", "c", "c++", "c#", "objective-c", "rust", "ruby",
+        "scala", "kotlin", "swift", "php", "r", "matlab", "bash", "shell", "perl",
+    ],
+    "Web & Frontend": [
+        "react", "angular", "vue", "html", "css", "node", "node.js", "next.js", "django", "flask",
+        "fastapi", "spring", "rails", "graphql", "rest", "api", "apis", "frontend", "backend", "web",
+    ],
+    "Data & Analytics": [
+        "sql", "postgresql", "postgres", "mysql", "mongodb", "nosql", "redis", "pandas", "numpy", "spark",
+        "hadoop", "kafka", "airflow", "dbt", "snowflake", "bigquery", "redshift", "etl", "elt", "tableau",
+        "power bi", "looker", "excel", "analytics", "data", "warehouse", "streaming", "modeling",
+    ],
+    "Machine Learning & AI": [
+        "machine learning", "ml", "deep learning", "ai", "tensorflow", "pytorch", "scikit-learn", "sklearn",
+        "nlp", "llm", "llms", "computer vision", "statistics", "mlops", "genai",
+    ],
+    "Cloud & DevOps": [
+        "aws", "azure", "gcp", "google cloud", "cloud", "docker", "kubernetes", "k8s", "terraform",
+        "ansible", "ci/cd", "cicd", "jenkins", "github actions", "linux", "devops", "git", "observability",
+        "monitoring", "prometheus", "grafana", "serverless", "lambda", "infrastructure",
+    ],
+    "Security": [
+        "security", "cybersecurity", "iam", "oauth", "encryption", "penetration testing", "soc 2", "gdpr",
+        "compliance", "vulnerability",
+    ],
+    "Product & Delivery": [
+        "agile", "scrum", "kanban", "jira", "product management", "roadmap", "figma", "ux", "ui",
+        "design", "testing", "qa", "project management",
+    ],
+    "Leadership & Communication": [
+        "leadership", "communication", "stakeholder", "stakeholders", "stakeholder management", "mentoring",
+        "coaching", "management", "collaboration", "teamwork", "presentation", "negotiation",
+        "problem solving", "cross-functional",
+    ],
+    "Business & Domain": [
+        "finance", "accounting", "marketing", "sales", "crm", "salesforce", "seo", "e-commerce",
+        "healthcare", "operations", "budgeting", "strategy",
+    ],
+}
+
+CATEGORY_NAMES = list(SKILL_CATEGORIES) + [OTHER_CATEGORY]
+_KEYWORD_INDEX = {keyword: index for index, keywords in enumerate(SKILL_CATEGORIES.values()) for keyword in keywords}
+_WORD_PATTERN = re.compile(r"[a-z0-9+#./-]+")
+_PART_PATTERN = re.compile(r"[a-z0-9+#]+")
+# Keywords this short ("c", "r", "go", "ai") only count as a whole token, so
+# "R&D", "C-suite" or "go-to-market" stay out of Programming Languages
+SHORT_KEYWORD_LENGTH = 2
+_TOKEN_PATTERN = re.compile(r"[^\s/,;]+")
+_TOKEN_PUNCTUATION = "()[]{}.:'\"-"
+
+
+@lru_cache(maxsize=4096)
+def categorize_skill(skill):
+    """Returns the index into CATEGORY_NAMES of the category a skill belongs to."""
+    normalized = " ".join(str(skill).lower().split())
+    if normalized in _KEYWORD_INDEX:
+        return _KEYWORD_INDEX[normalized]
+    words = [word.strip("./-") or word for word in _WORD_PATTERN.findall(normalized)]
+    for pair in zip(words, words[1:]):
+        if " ".join(pair) in _KEYWORD_INDEX:
+            return _KEYWORD_INDEX[" ".join(pair)]
+    # Then the parts of dotted or slashed words, e.g. "react" in "react.js"
+    tokens = {token.strip(_TOKEN_PUNCTUATION) for token in _TOKEN_PATTERN.findall(normalized)}
+    for word in words + _PART_PATTERN.findall(normalized):
+        if word in _KEYWORD_INDEX and (len(word) > SHORT_KEYWORD_LENGTH or word in tokens):
+            return _KEYWORD_INDEX[word]
+    return len(CATEGORY_NAMES) - 1
+
+
+def skills_gap_by_category(user_skills, missing_skills, top_n=8, examples=4):
+    """
+    Groups the skills a resume has and the ones the job needs but it lacks into
+    taxonomy categories and scores coverage per category (have / (have + missing)).
+
+    Returns at most top_n categories, the ones with the most skills; the rest
+    are folded into "Other". Each comes with up to `examples` skill names per
+    side, so the result stays the same size however many skills there are.
+    """
+    have = {str(skill).lower(): str(skill) for skill in user_skills}
+    missing = {str(skill).lower(): str(skill) for skill in missing_skills if str(skill).lower() not in have}
+    if not have and not missing:
+        return []
+
+    names = list(have.values()) + list(missing.values())
+    is_have = np.arange(len(names)) < len(have)
+    categories = np.fromiter((categorize_skill(name) for name in names), dtype=np.int64, count=len(names))
+
+    # Fold everything outside the top (N - 1) categories into "Other"
+    other = len(CATEGORY_NAMES) - 1
+    totals = np.bincount(categories, minlength=len(CATEGORY_NAMES))
+    ranked = [index for index in np.argsort(-totals, kind='stable') if totals[index] and index != other]
+    if len(ranked) > top_n or totals[other]:
+        ranked = ranked[:top_n - 1]
+        categories = np.where(np.isin(categories, ranked), categories, other)
+        ranked.append(other)
+
+    have_counts = np.bincount(categories[is_have], minlength=len(CATEGORY_NAMES))
+    missing_counts = np.bincount(categories[~is_have], minlength=len(CATEGORY_NAMES))
+    coverage = have_counts / np.maximum(have_counts + missing_counts, 1)
+
+    rows = []
+    for index in ranked:
+        members = np.flatnonzero(categories == index)
+        rows.append({
+            "category": CATEGORY_NAMES[index],
+            "coverage": float(coverage[index]),
+            "have": int(have_counts[index]),
+            "missing": int(missing_counts[index]),
+            "have_examples": [names[i] for i in members[is_have[members]][:examples]],
+            "missing_examples": [names[i] for i in members[~is_have[members]][:examples]],
+        })
+    return rows